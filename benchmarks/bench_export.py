@@ -0,0 +1,59 @@
+"""
+Benchmarks de la construcción de DataFrames y de la exportación a Excel/CSV.
+"""
+
+import pytest
+from openpyxl import Workbook
+
+from src.utils.result_table import ResultTable
+
+
+# Las exportaciones completas escriben en disco: menos rondas para no alargar la suite
+EXPORT_ROUNDS = 3
+
+
+@pytest.mark.benchmark(group='create_dataframe')
+def bench_create_dataframe(benchmark, exporter, followers_data):
+    table = ResultTable.from_dict({'cuenta': followers_data})
+    df = benchmark(exporter._table_dataframe, table, 'cuenta')
+    assert len(df) == len(followers_data)
+
+
+@pytest.mark.benchmark(group='create_dataframe')
+def bench_table_dataframe(benchmark, exporter, result_table):
+    account = result_table.accounts[0]
+    df = benchmark(exporter._table_dataframe, result_table, account)
+    assert len(df) == result_table.row_count(account)
+
+
+@pytest.mark.benchmark(group='result_table')
+def bench_result_table_from_dict(benchmark, accounts_data):
+    table = benchmark(ResultTable.from_dict, accounts_data)
+    assert len(table) == sum(len(profiles) for profiles in accounts_data.values())
+
+
+@pytest.mark.benchmark(group='format_worksheet')
+def bench_format_worksheet(benchmark, exporter, followers_data):
+    df = exporter._table_dataframe(ResultTable.from_dict({'cuenta': followers_data}), 'cuenta')
+
+    def setup():
+        return (Workbook().active, df), {}
+
+    benchmark.pedantic(exporter._format_worksheet, setup=setup, rounds=EXPORT_ROUNDS * 3)
+
+
+@pytest.mark.benchmark(group='summary_dataframe')
+def bench_create_summary_dataframe(benchmark, exporter, result_table):
+    summary = benchmark(exporter._create_summary_dataframe, result_table)
+    assert len(summary) == len(result_table.accounts)
+
+
+@pytest.mark.benchmark(group='export_to_excel')
+def bench_export_to_excel(benchmark, exporter, result_table):
+    benchmark.pedantic(exporter.export_to_excel, args=(result_table, 'benchmark.xlsx'), rounds=EXPORT_ROUNDS)
+
+
+@pytest.mark.benchmark(group='export_to_csv')
+def bench_export_to_csv(benchmark, exporter, result_table):
+    files = benchmark.pedantic(exporter.export_to_csv, args=(result_table,), rounds=EXPORT_ROUNDS)
+    assert len(files) == len(result_table.accounts)
@@ -0,0 +1,63 @@
+"""
+Benchmarks de extremo a extremo de extract_multiple_accounts sobre FakeWebDriver.
+
+Las pausas fijas del extractor (time.sleep entre perfiles y cuentas) se
+anulan para medir solo la orquestación y la latencia de carga simulada; el
+sondeo de og:description conserva su espera para no inflar los comandos.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import settings
+from src.extractors import instagram_extractor
+from src.extractors.instagram_extractor import InstagramExtractor
+from benchmarks.fakes.fake_webdriver import FakeWebDriver
+from src.utils.page_corpus import build_corpus
+
+from conftest import ACCOUNTS, SEED
+
+
+FOLLOWERS_PER_ACCOUNT = 50
+
+# Latencia de carga por página: 0 mide solo la orquestación
+LATENCIES = (0.0, 0.02)
+
+# Las esperas de hasta este valor (sondeo) se mantienen; las pausas fijas (>= 1 s) no
+POLL_INTERVAL = 0.005
+
+
+@pytest.fixture(scope='session')
+def corpus(tmp_path_factory):
+    """Corpus sintético con las cuentas de ACCOUNTS y sus seguidores."""
+    return build_corpus(str(tmp_path_factory.mktemp('corpus')), ACCOUNTS, FOLLOWERS_PER_ACCOUNT, SEED)
+
+
+@pytest.fixture
+def no_pacing(monkeypatch, tmp_path):
+    """Anula las pausas del extractor y el login."""
+    monkeypatch.setattr(instagram_extractor, 'time', SimpleNamespace(
+        sleep=lambda seconds: time.sleep(seconds) if seconds <= POLL_INTERVAL else None,
+        monotonic=time.monotonic,
+        perf_counter=time.perf_counter,
+        time=time.time
+    ))
+    # Ranking de selectores aislado por benchmark (no se lee ni escribe el de data/temp)
+    monkeypatch.setitem(settings.SELECTOR_RANKING_CONFIG, 'file', str(tmp_path / 'selector_ranking.json'))
+    monkeypatch.setitem(settings.SELENIUM_CONFIG, 'metadata_poll_interval', POLL_INTERVAL)
+    monkeypatch.setattr(settings, 'is_login_enabled', lambda: False)
+    monkeypatch.setitem(settings.BROWSER_DAEMON_CONFIG, 'enabled', False)
+
+
+@pytest.mark.benchmark(group='extract_multiple_accounts')
+@pytest.mark.parametrize('latency', LATENCIES, ids=lambda latency: f"latency_{int(latency * 1000)}ms")
+def bench_extract_multiple_accounts(benchmark, corpus, no_pacing, latency):
+    def run():
+        extractor = InstagramExtractor(driver_factory=lambda: FakeWebDriver(corpus, latency=latency, seed=SEED))
+        with extractor:
+            return extractor.extract_multiple_accounts(list(ACCOUNTS))
+
+    results = benchmark.pedantic(run, rounds=3)
+    assert len(results) == FOLLOWERS_PER_ACCOUNT * len(ACCOUNTS)
@@ -0,0 +1,80 @@
+"""
+Benchmarks del parseo de contadores, og:description y enlaces de seguidores.
+"""
+
+import random
+
+import pandas as pd
+import pytest
+
+from conftest import SEED, SIZES
+from src.utils import count_parser
+
+
+def _number_texts(count: int):
+    """Textos de contador como los que muestra Instagram ('1,234', '12.5K', '3M')."""
+    rng = random.Random(SEED)
+    formats = (
+        lambda: str(rng.randint(0, 999)),
+        lambda: f"{rng.randint(1, 999)},{rng.randint(0, 999):03d}",
+        lambda: f"{rng.randint(1, 999)}.{rng.randint(0, 9)}K",
+        lambda: f"{rng.randint(1, 99)}M",
+        lambda: f"{rng.randint(1, 99)},{rng.randint(1, 9)} mil",
+    )
+    return [rng.choice(formats)() for _ in range(count)]
+
+
+def _descriptions(count: int):
+    """Contenidos de og:description con contadores variados."""
+    texts = _number_texts(count * 3)
+    return [
+        f"{texts[i]} seguidores, {texts[i + 1]} siguiendo, {texts[i + 2]} publicaciones"
+        f" - Ver fotos y videos de Instagram de usuario_{i} (@usuario_{i})"
+        for i in range(0, count * 3, 3)
+    ]
+
+
+def _hrefs(count: int):
+    """Enlaces del modal de seguidores (perfiles, con y sin barra final, y enlaces no válidos)."""
+    rng = random.Random(SEED)
+    hrefs = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.8:
+            hrefs.append(f"https://www.instagram.com/usuario.{i}_x/")
+        elif roll < 0.9:
+            hrefs.append(f"https://www.instagram.com/usuario{i}")
+        else:
+            hrefs.append(f"https://www.instagram.com/explore/tags/tag-{i}/?hl=es")
+    return hrefs
+
+
+@pytest.mark.benchmark(group='convert_number_text')
+@pytest.mark.parametrize('size', SIZES, ids=lambda size: f"{size}_values")
+def bench_convert_number_text(benchmark, extractor, size):
+    texts = _number_texts(size)
+    benchmark(lambda: [extractor._convert_number_text(text) for text in texts])
+
+
+@pytest.mark.benchmark(group='og_description')
+@pytest.mark.parametrize('size', SIZES, ids=lambda size: f"{size}_profiles")
+def bench_parse_og_description(benchmark, extractor, size):
+    descriptions = _descriptions(size)
+    results = benchmark(lambda: [extractor._parse_og_description(text) for text in descriptions])
+    assert all(len(counts) == 3 for counts in results)
+
+
+@pytest.mark.benchmark(group='og_description_batch')
+@pytest.mark.parametrize('size', SIZES, ids=lambda size: f"{size}_profiles")
+def bench_parse_descriptions_series(benchmark, size):
+    # Re-parseo de archivo: pocas descripciones distintas repetidas muchas veces
+    descriptions = pd.Series(_descriptions(max(size // 10, 1)) * 10)
+    frame = benchmark(count_parser.parse_descriptions, descriptions)
+    assert frame['follower_count'].notna().all()
+
+
+@pytest.mark.benchmark(group='username_from_href')
+@pytest.mark.parametrize('size', SIZES, ids=lambda size: f"{size}_links")
+def bench_username_from_href(benchmark, extractor, size):
+    hrefs = _hrefs(size)
+    benchmark(lambda: [extractor._username_from_href(href) for href in hrefs])
@@ -0,0 +1,41 @@
+"""
+Benchmarks de la base SQLite de resultados (inserción por lotes y consultas indexadas).
+"""
+
+import pytest
+
+from src.utils.results_store import ResultsStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Base vacía en un directorio temporal."""
+    with ResultsStore(str(tmp_path / 'results.sqlite3')) as results_store:
+        yield results_store
+
+
+@pytest.fixture
+def filled_store(store, result_table):
+    """Base con los perfiles de result_table."""
+    store.save_table(result_table)
+    return store
+
+
+@pytest.mark.benchmark(group='results_store_save')
+def bench_save_table(benchmark, store, result_table):
+    saved = benchmark.pedantic(store.save_table, args=(result_table,), rounds=3)
+    assert saved == len(result_table)
+
+
+@pytest.mark.benchmark(group='results_store_query')
+def bench_query_latest_username(benchmark, filled_store, accounts_data):
+    username = next(iter(accounts_data.values()))[0]['username']
+    profiles = benchmark(filled_store.query, username=username, latest=True)
+    assert len(profiles) >= 1
+
+
+@pytest.mark.benchmark(group='results_store_query')
+def bench_query_account_min_followers(benchmark, filled_store, result_table):
+    account = result_table.accounts[0]
+    profiles = benchmark(filled_store.query, source_account=account, min_followers=1_000)
+    assert {profile['source_account'] for profile in profiles} <= {f"@{account}"}
@@ -0,0 +1,76 @@
+"""
+Benchmarks del arranque de la CLI con presupuesto de tiempo de importación.
+
+Cada caso ejecuta main.py en un proceso nuevo con -X importtime, mide la
+duración total y comprueba que las rutas ligeras (--help, query) no
+importan selenium, pandas ni pyarrow y que sus importaciones caben en
+IMPORT_BUDGET_SECONDS.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.utils.results_store import ResultsStore
+
+
+MAIN = Path(__file__).resolve().parent.parent / 'main.py'
+
+# Tiempo acumulado de importación permitido (antes de las importaciones perezosas: ~0.9 s)
+IMPORT_BUDGET_SECONDS = 0.3
+
+HEAVY_MODULES = ('selenium', 'webdriver_manager', 'pandas', 'pyarrow', 'openpyxl')
+
+
+def _run_cli(cwd, *args):
+    """
+    Ejecuta main.py con -X importtime.
+
+    Args:
+        cwd: Directorio de trabajo (temporal: logs/ y data/ se crean ahí y no en el repositorio)
+        *args: Argumentos de main.py
+
+    Returns:
+        (segundos de importación acumulados, módulos de primer nivel importados)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', str(MAIN), *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        modules.add(name.strip().split('.')[0])
+        # Solo las entradas de primer nivel (sin sangría) suman al total
+        if not name[1:].startswith(' '):
+            total_us += int(cumulative)
+    return total_us / 1_000_000, modules
+
+
+def _check_budget(import_seconds, modules):
+    assert import_seconds < IMPORT_BUDGET_SECONDS, f"Importación de {import_seconds:.3f}s"
+    assert not modules & set(HEAVY_MODULES), sorted(modules & set(HEAVY_MODULES))
+
+
+@pytest.mark.benchmark(group='cli_startup')
+def bench_cli_help(benchmark, tmp_path):
+    import_seconds, modules = benchmark.pedantic(_run_cli, args=(tmp_path, '--help'), rounds=5)
+    _check_budget(import_seconds, modules)
+
+
+@pytest.mark.benchmark(group='cli_startup')
+def bench_cli_query(benchmark, tmp_path):
+    # query abre la base en solo lectura: crearla antes (vacía)
+    results_db = tmp_path / 'results.sqlite3'
+    ResultsStore(str(results_db)).close()
+    args = (tmp_path, '--results-db', str(results_db), 'query', '--limit', '1')
+    import_seconds, modules = benchmark.pedantic(_run_cli, args=args, rounds=5)
+    _check_budget(import_seconds, modules)
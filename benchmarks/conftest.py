@@ -0,0 +1,51 @@
+"""
+Fixtures compartidas de los micro-benchmarks.
+
+Los datos son sintéticos y deterministas (semilla fija) para que las
+comparaciones contra la línea base sean reproducibles.
+"""
+
+import pytest
+
+from src.exporters.excel_exporter import ExcelExporter
+from src.extractors.instagram_extractor import InstagramExtractor
+from src.utils.result_table import ResultTable
+from src.utils.synthetic_data import build_account_data, iter_profiles
+
+
+# Número de perfiles por cuenta en cada variante de los benchmarks
+SIZES = (100, 1_000, 10_000)
+
+SEED = 1234
+
+ACCOUNTS = ('cuenta_a', 'cuenta_b', 'cuenta_c')
+
+
+@pytest.fixture(scope='session', params=SIZES, ids=lambda size: f"{size}_rows")
+def followers_data(request):
+    """Perfiles de una cuenta en cada tamaño de SIZES."""
+    return list(iter_profiles(request.param, seed=SEED))
+
+
+@pytest.fixture(scope='session')
+def accounts_data(followers_data):
+    """Datos por cuenta ({cuenta: perfiles}) con el mismo total de perfiles repartido en tres cuentas."""
+    return build_account_data(len(followers_data), ACCOUNTS, SEED)
+
+
+@pytest.fixture(scope='session')
+def result_table(accounts_data):
+    """Los mismos datos por cuenta en la tabla columnar que devuelve la extracción."""
+    return ResultTable.from_dict(accounts_data)
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    """Exportador que escribe en un directorio temporal."""
+    return ExcelExporter(output_dir=str(tmp_path))
+
+
+@pytest.fixture(scope='session')
+def extractor():
+    """Extractor sin navegador (solo se usan sus métodos de parseo)."""
+    return InstagramExtractor()
@@ -0,0 +1,3 @@
+"""
+Dobles de prueba para benchmarks y perfilado sin navegador (fuera de src/).
+"""
@@ -0,0 +1,613 @@
+"""
+WebDriver falso en proceso para benchmarks y perfilado sin navegador ni red.
+
+Implementa el subconjunto de la API de Selenium que usa InstagramExtractor
+(get, find_elements, get_attribute, execute_script, window_handles,
+switch_to, close...) sobre un corpus de páginas HTML, con latencia de carga
+y de comando configurables. Todos los comandos pasan por execute(), igual
+que en Selenium, para que WebDriverCommandRecorder pueda contabilizarlos.
+
+Selectores soportados: CSS con etiqueta, #id, .clase y atributos
+([a], [a=v], [a*=v], [a^=v], [a$=v]) combinados con descendiente (' '),
+hijo ('>') y grupos (','). Los XPath no encuentran ningún elemento.
+"""
+
+import random
+import re
+import time
+from html.parser import HTMLParser
+from itertools import count
+from typing import Dict, List, Any, Optional
+from urllib.parse import urljoin
+
+from selenium.common.exceptions import NoSuchElementException, NoSuchWindowException
+
+from src.utils.page_corpus import PageCorpus, NOT_FOUND_PAGE
+
+
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+# Equivalencias de las estrategias de By con selectores CSS
+BY_TO_CSS = {
+    'id': '#{}',
+    'name': '[name="{}"]',
+    'class name': '.{}',
+    'tag name': '{}',
+    'css selector': '{}',
+}
+
+
+class _Node:
+    """Nodo del árbol HTML."""
+
+    __slots__ = ('tag', 'attrs', 'children', 'parent', 'text')
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional['_Node']):
+        self.tag = tag
+        self.attrs = attrs
+        self.children = []
+        self.parent = parent
+        self.text = []
+
+    def iter_descendants(self):
+        """Recorre los descendientes en orden de documento."""
+        for child in self.children:
+            yield child
+            yield from child.iter_descendants()
+
+    def get_text(self) -> str:
+        """Texto visible del nodo y sus descendientes."""
+        parts = list(self.text)
+        for child in self.children:
+            parts.append(child.get_text())
+        return ' '.join(part for part in (p.strip() for p in parts) if part)
+
+
+class _DocumentBuilder(HTMLParser):
+    """Construye el árbol de nodos de una página."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = _Node('#document', {}, None)
+        self._current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = _Node(tag, {name: value or '' for name, value in attrs}, self._current)
+        self._current.children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self._current.children.append(_Node(tag, {name: value or '' for name, value in attrs}, self._current))
+
+    def handle_endtag(self, tag):
+        node = self._current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self._current = node.parent
+
+    def handle_data(self, data):
+        if data.strip():
+            self._current.text.append(data)
+
+
+def parse_document(page: str) -> _Node:
+    """
+    Parsea una página HTML.
+
+    Args:
+        page: HTML de la página
+
+    Returns:
+        Nodo raíz del documento
+    """
+    builder = _DocumentBuilder()
+    builder.feed(page)
+    builder.close()
+    return builder.root
+
+
+def _split_selector_group(selector: str) -> List[str]:
+    """Separa un grupo de selectores por comas fuera de corchetes y comillas."""
+    parts, current, depth, quote = [], [], 0, None
+
+    for char in selector:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in '"\'':
+            quote = char
+        elif char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            parts.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+
+    parts.append(''.join(current).strip())
+    return [part for part in parts if part]
+
+
+def _parse_compound(selector: str, position: int):
+    """Parsea un selector compuesto (ej: 'a.clase[href*="/"]') desde position."""
+    tag, conditions = None, []
+    length = len(selector)
+
+    start = position
+    while position < length and (selector[position].isalnum() or selector[position] in '-_*'):
+        position += 1
+    if position > start:
+        tag = selector[start:position].lower()
+
+    while position < length and selector[position] in '.#[':
+        marker = selector[position]
+        if marker in '.#':
+            start = position = position + 1
+            while position < length and (selector[position].isalnum() or selector[position] in '-_'):
+                position += 1
+            value = selector[start:position]
+            conditions.append(('class', value) if marker == '.' else ('attr', 'id', '=', value))
+        else:
+            end = position + 1
+            quote = None
+            while end < length and (quote or selector[end] != ']'):
+                if selector[end] in '"\'':
+                    quote = None if quote == selector[end] else (quote or selector[end])
+                end += 1
+            body = selector[position + 1:end].strip()
+            position = end + 1
+
+            for operator in ('*=', '^=', '$=', '~=', '='):
+                if operator in body:
+                    name, value = body.split(operator, 1)
+                    conditions.append(('attr', name.strip(), operator, value.strip().strip('"\'')))
+                    break
+            else:
+                conditions.append(('attr', body, None, None))
+
+    return (tag, conditions), position
+
+
+def parse_selector(selector: str) -> List[List]:
+    """
+    Parsea un selector CSS del subconjunto soportado.
+
+    Args:
+        selector: Selector CSS (puede ser un grupo separado por comas)
+
+    Returns:
+        Lista de cadenas [(combinador, compuesto), ...] por cada selector del grupo
+    """
+    chains = []
+
+    for part in _split_selector_group(selector):
+        chain, position, combinator = [], 0, ' '
+        while position < len(part):
+            if part[position].isspace():
+                position += 1
+                continue
+            if part[position] == '>':
+                combinator = '>'
+                position += 1
+                continue
+            compound, next_position = _parse_compound(part, position)
+            if next_position == position:
+                raise ValueError(f"Selector no soportado por FakeWebDriver: {part}")
+            position = next_position
+            chain.append((combinator, compound))
+            combinator = ' '
+        chains.append(chain)
+
+    return chains
+
+
+def _matches_compound(node: _Node, compound) -> bool:
+    """Comprueba un selector compuesto contra un nodo."""
+    tag, conditions = compound
+    if tag not in (None, '*') and node.tag != tag:
+        return False
+
+    for condition in conditions:
+        if condition[0] == 'class':
+            if condition[1] not in node.attrs.get('class', '').split():
+                return False
+            continue
+
+        _, name, operator, value = condition
+        actual = node.attrs.get(name)
+        if actual is None:
+            return False
+        if operator == '=' and actual != value:
+            return False
+        if operator == '*=' and value not in actual:
+            return False
+        if operator == '^=' and not actual.startswith(value):
+            return False
+        if operator == '$=' and not actual.endswith(value):
+            return False
+        if operator == '~=' and value not in actual.split():
+            return False
+
+    return True
+
+
+def _matches_chain(node: _Node, chain, index: int, scope: _Node) -> bool:
+    """Comprueba la cadena de selectores de derecha a izquierda."""
+    combinator, compound = chain[index]
+    if not _matches_compound(node, compound):
+        return False
+    if index == 0:
+        return True
+
+    ancestor = node.parent
+    while ancestor is not None and ancestor is not scope.parent:
+        if _matches_chain(ancestor, chain, index - 1, scope):
+            return True
+        if combinator == '>':
+            return False
+        ancestor = ancestor.parent
+
+    return False
+
+
+def select(scope: _Node, selector: str) -> List[_Node]:
+    """
+    Busca los descendientes de scope que cumplen el selector.
+
+    Args:
+        scope: Nodo desde el que buscar
+        selector: Selector CSS
+
+    Returns:
+        Nodos encontrados en orden de documento
+    """
+    chains = parse_selector(selector)
+    return [
+        node for node in scope.iter_descendants()
+        if any(_matches_chain(node, chain, len(chain) - 1, scope) for chain in chains if chain)
+    ]
+
+
+class _Tab:
+    """Estado de una pestaña del navegador falso."""
+
+    __slots__ = ('url', 'document', 'ready_at', 'size')
+
+    def __init__(self):
+        self.url = 'about:blank'
+        self.document = parse_document('<html><head></head><body></body></html>')
+        self.ready_at = 0.0
+        self.size = 0
+
+
+class FakeWebElement:
+    """
+    Elemento de una página del navegador falso.
+    """
+
+    def __init__(self, parent: 'FakeWebDriver', node: _Node, element_id: str):
+        self.parent = parent
+        self.node = node
+        self.id = element_id
+
+    def _execute(self, command: str, params: Dict[str, Any] = None):
+        params = dict(params or {})
+        params['id'] = self.id
+        return self.parent.execute(command, params)['value']
+
+    @property
+    def tag_name(self) -> str:
+        return self._execute('getElementTagName')
+
+    @property
+    def text(self) -> str:
+        return self._execute('getElementText')
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return self._execute('getElementAttribute', {'name': name})
+
+    def click(self) -> None:
+        self._execute('clickElement')
+
+    def clear(self) -> None:
+        self._execute('clearElement')
+
+    def send_keys(self, *value) -> None:
+        self._execute('sendKeysToElement', {'text': ''.join(str(v) for v in value)})
+
+    def find_elements(self, by: str = 'css selector', value: str = None) -> List['FakeWebElement']:
+        return self._execute('findChildElements', {'using': by, 'value': value})
+
+
+class _SwitchTo:
+    """Equivalente a driver.switch_to."""
+
+    def __init__(self, driver: 'FakeWebDriver'):
+        self._driver = driver
+
+    def window(self, handle: str) -> None:
+        self._driver.execute('switchToWindow', {'handle': handle})
+
+
+class FakeWebDriver:
+    """
+    Navegador falso que sirve páginas de un PageCorpus con latencia simulada.
+    """
+
+    def __init__(
+        self,
+        corpus: PageCorpus,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        command_latency: float = 0.0,
+        seed: int = 0,
+        base_url: str = 'https://www.instagram.com/'
+    ):
+        """
+        Inicializa el navegador falso.
+
+        Args:
+            corpus: Corpus de páginas a servir
+            latency: Segundos de carga de cada página
+            jitter: Variación relativa de la latencia de carga (0.2 = ±20%)
+            command_latency: Segundos de cada round-trip WebDriver
+            seed: Semilla de la variación de latencia
+            base_url: URL base con la que se resuelven enlaces relativos
+        """
+        self.corpus = corpus
+        self.latency = latency
+        self.jitter = jitter
+        self.command_latency = command_latency
+        self.base_url = base_url
+        self.switch_to = _SwitchTo(self)
+        self.cookies = {}
+        self.timeouts = {}
+        self.page_loads = 0
+
+        self._random = random.Random(seed)
+        self._handle_ids = count(1)
+        self._element_ids = count(1)
+        self._elements = {}
+        self._tabs = {}
+        self._current_handle = self._open_tab()
+
+        self._commands = {
+            'get': self._cmd_get,
+            'getCurrentUrl': lambda params: self._tab().url,
+            'getTitle': self._cmd_get_title,
+            'getPageSource': lambda params: self._page_source(),
+            'w3cExecuteScript': self._cmd_execute_script,
+            'findElements': self._cmd_find_elements,
+            'findChildElements': self._cmd_find_elements,
+            'getElementAttribute': self._cmd_get_attribute,
+            'getElementText': lambda params: self._elements[params['id']].get_text(),
+            'getElementTagName': lambda params: self._elements[params['id']].tag,
+            'clickElement': self._cmd_click,
+            'clearElement': lambda params: None,
+            'sendKeysToElement': lambda params: None,
+            'w3cGetWindowHandles': lambda params: list(self._tabs),
+            'w3cGetCurrentWindowHandle': lambda params: self._current_handle,
+            'switchToWindow': self._cmd_switch_to_window,
+            'close': self._cmd_close,
+            'quit': self._cmd_quit,
+            'getCookie': lambda params: self.cookies.get(params['name']),
+            'getAllCookies': lambda params: list(self.cookies.values()),
+            'addCookie': lambda params: self.cookies.__setitem__(params['cookie']['name'], params['cookie']),
+            'setTimeouts': lambda params: self.timeouts.update(params),
+        }
+
+    # --- Protocolo de comandos -------------------------------------------------
+
+    def execute(self, driver_command: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Ejecuta un comando WebDriver (punto único, como en Selenium).
+
+        Args:
+            driver_command: Nombre del comando
+            params: Parámetros del comando
+
+        Returns:
+            Respuesta {'value': ...}
+        """
+        if self.command_latency:
+            time.sleep(self.command_latency)
+
+        handler = self._commands.get(driver_command)
+        if handler is None:
+            raise NotImplementedError(f"Comando no soportado por FakeWebDriver: {driver_command}")
+
+        return {'value': handler(params or {})}
+
+    # --- API pública de Selenium -----------------------------------------------
+
+    @property
+    def current_url(self) -> str:
+        return self.execute('getCurrentUrl')['value']
+
+    @property
+    def title(self) -> str:
+        return self.execute('getTitle')['value']
+
+    @property
+    def page_source(self) -> str:
+        return self.execute('getPageSource')['value']
+
+    @property
+    def window_handles(self) -> List[str]:
+        return self.execute('w3cGetWindowHandles')['value']
+
+    @property
+    def current_window_handle(self) -> str:
+        return self.execute('w3cGetCurrentWindowHandle')['value']
+
+    def get(self, url: str) -> None:
+        self.execute('get', {'url': url})
+
+    def execute_script(self, script: str, *args):
+        return self.execute('w3cExecuteScript', {'script': script, 'args': list(args)})['value']
+
+    def find_elements(self, by: str = 'css selector', value: str = None) -> List[FakeWebElement]:
+        return self.execute('findElements', {'using': by, 'value': value})['value']
+
+    def find_element(self, by: str = 'css selector', value: str = None) -> FakeWebElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"No se encontró el elemento: {value}")
+        return elements[0]
+
+    def get_cookie(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.execute('getCookie', {'name': name})['value']
+
+    def get_cookies(self) -> List[Dict[str, Any]]:
+        return self.execute('getAllCookies')['value']
+
+    def add_cookie(self, cookie: Dict[str, Any]) -> None:
+        self.execute('addCookie', {'cookie': cookie})
+
+    def implicitly_wait(self, seconds: float) -> None:
+        self.execute('setTimeouts', {'implicit': int(seconds * 1000)})
+
+    def set_page_load_timeout(self, seconds: float) -> None:
+        self.execute('setTimeouts', {'pageLoad': int(seconds * 1000)})
+
+    def close(self) -> None:
+        self.execute('close')
+
+    def quit(self) -> None:
+        self.execute('quit')
+
+    # --- Implementación de los comandos ----------------------------------------
+
+    def _open_tab(self) -> str:
+        """Crea una pestaña vacía y devuelve su handle."""
+        handle = f"fake-tab-{next(self._handle_ids)}"
+        self._tabs[handle] = _Tab()
+        return handle
+
+    def _tab(self) -> _Tab:
+        """Pestaña activa."""
+        try:
+            return self._tabs[self._current_handle]
+        except KeyError:
+            raise NoSuchWindowException("La pestaña activa está cerrada")
+
+    def _page_latency(self) -> float:
+        """Latencia de carga de una página con su variación aleatoria."""
+        if not self.latency:
+            return 0.0
+        return max(0.0, self.latency * (1 + self._random.uniform(-self.jitter, self.jitter)))
+
+    def _load(self, url: str, blocking: bool) -> None:
+        """Carga una URL en la pestaña activa (bloqueante como get() o en segundo plano)."""
+        tab = self._tab()
+        url = urljoin(self.base_url, url)
+        page = self.corpus.get(url) or NOT_FOUND_PAGE
+        latency = self._page_latency()
+
+        if blocking and latency:
+            time.sleep(latency)
+
+        tab.url = url
+        tab.document = parse_document(page)
+        tab.size = len(page.encode('utf-8'))
+        tab.ready_at = 0.0 if blocking else time.monotonic() + latency
+        self.page_loads += 1
+        # Como en un navegador real, los elementos de la página anterior quedan obsoletos
+        self._elements.clear()
+
+    def _page_source(self) -> str:
+        return self.corpus.get(self._tab().url) or NOT_FOUND_PAGE
+
+    def _head_html(self) -> Optional[str]:
+        match = re.search(r'<head\b.*?</head>', self._page_source(), re.IGNORECASE | re.DOTALL)
+        return match.group(0) if match else None
+
+    def _is_ready(self, tab: _Tab) -> bool:
+        return time.monotonic() >= tab.ready_at
+
+    def _register(self, nodes: List[_Node]) -> List[FakeWebElement]:
+        """Crea los WebElement de los nodos encontrados."""
+        elements = []
+        for node in nodes:
+            element_id = f"fake-element-{next(self._element_ids)}"
+            self._elements[element_id] = node
+            elements.append(FakeWebElement(self, node, element_id))
+        return elements
+
+    def _cmd_get(self, params):
+        self._load(params['url'], blocking=True)
+
+    def _cmd_get_title(self, params):
+        titles = select(self._tab().document, 'title')
+        return titles[0].get_text() if titles else ''
+
+    def _cmd_execute_script(self, params):
+        script, args = params['script'], params.get('args', [])
+        tab = self._tab()
+
+        if 'og:description' in script:
+            expected_path = args[0] if args else None
+            if not self._is_ready(tab) or (expected_path and expected_path not in tab.url):
+                return None
+            metas = select(tab.document, 'meta[property="og:description"]')
+            if not metas:
+                return None
+            # HEAD_WHEN_READY_SCRIPT devuelve el <head> en lugar del contenido
+            return self._head_html() if 'outerHTML' in script else metas[0].attrs.get('content')
+        if 'document.readyState' in script:
+            return 'complete' if self._is_ready(tab) else 'interactive'
+        if 'window.stop' in script:
+            tab.ready_at = min(tab.ready_at, time.monotonic())
+            return None
+        if 'window.open' in script:
+            self._open_tab()
+            return None
+        if 'location.href' in script and args:
+            self._load(args[0], blocking=False)
+            return None
+        if 'document.head' in script and 'outerHTML' in script:
+            return self._head_html()
+        if 'outerHTML' in script:
+            return self._page_source()
+        if 'getEntriesByType' in script:
+            return [0, 1, tab.size] if self._is_ready(tab) else [0, 0, 0]
+
+        return None
+
+    def _cmd_find_elements(self, params):
+        by, value = params['using'], params['value']
+        if by not in BY_TO_CSS:
+            return []
+
+        scope = self._elements[params['id']] if 'id' in params else self._tab().document
+        return self._register(select(scope, BY_TO_CSS[by].format(value)))
+
+    def _cmd_get_attribute(self, params):
+        node = self._elements[params['id']]
+        value = node.attrs.get(params['name'])
+        if value is not None and params['name'] in ('href', 'src'):
+            return urljoin(self._tab().url, value)
+        return value
+
+    def _cmd_click(self, params):
+        node = self._elements[params['id']]
+        while node is not None and node.tag != 'a':
+            node = node.parent
+        if node is not None and node.attrs.get('href'):
+            self._load(urljoin(self._tab().url, node.attrs['href']), blocking=True)
+
+    def _cmd_switch_to_window(self, params):
+        if params['handle'] not in self._tabs:
+            raise NoSuchWindowException(f"Pestaña inexistente: {params['handle']}")
+        self._current_handle = params['handle']
+
+    def _cmd_close(self, params):
+        self._tabs.pop(self._current_handle, None)
+        self._elements.clear()
+
+    def _cmd_quit(self, params):
+        self._tabs.clear()
+        self._elements.clear()
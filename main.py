@@ -16,17 +16,28 @@ Requisitos según PRD:
 
 import sys
 import argparse
+import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import List, TYPE_CHECKING
 import time
+from contextlib import nullcontext
+from datetime import datetime
 
 # Agregar src al path para importar módulos
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.config.settings import TARGET_ACCOUNTS, OUTPUT_SETTINGS, is_login_enabled, get_instagram_credentials
-from src.extractors.instagram_extractor import InstagramExtractor
-from src.exporters.excel_exporter import ExcelExporter
+from src.config.settings import TARGET_ACCOUNTS, OUTPUT_SETTINGS, METRICS_CONFIG, INSTAGRAM_CONFIG, is_login_enabled, get_instagram_credentials
 from src.utils.helpers import create_directories, format_timestamp
+from src.utils.timing import PhaseTimer
+from src.utils.metrics import MetricsRegistry
+from src.utils.logging_setup import setup_logging
+
+# selenium, pandas y pyarrow tardan más en importarse que muchas ejecuciones en
+# completarse (--help, query, reparse): cada función importa lo que necesita
+if TYPE_CHECKING:
+    from src.utils.result_table import ResultTable
+
+logger = logging.getLogger(__name__)
 
 
 def parse_arguments():
@@ -46,6 +57,22 @@ Ejemplos de uso:
   python main.py --accounts elcorteingles mercadona # Solo cuentas específicas
   python main.py --output-dir ./resultados         # Directorio de salida personalizado
   python main.py --debug                           # Modo debug con logging detallado
+  python main.py browser start                     # Arrancar navegador persistente
+  python main.py bench-export --rows 10000 100000  # Medir exportación con datos sintéticos
+  python main.py standin-server --latency 0.2      # Instagram local (INSTAGRAM_BASE_URL=http://127.0.0.1:8765)
+  python main.py --reuse-browser --max-followers 50 # Reutilizar navegador y sesión
+  python main.py --timings report.json             # Informe de tiempos por fase (p50/p95/p99)
+  python main.py --fake-browser data/fixtures --profile sampling  # Perfilar sin navegador ni red
+  python main.py --capture-raw                     # Guardar el <head> de cada perfil en data/raw
+  python main.py reparse --since 2024-05-01        # Re-parsear snapshots y exportar sin extraer
+  python main.py --profile-fetcher http            # Perfiles por HTTP; el navegador solo abre los seguidores
+  python main.py query --username ana.garcia --latest  # Último registro guardado de un perfil
+  python main.py query --account mercadona --min-followers 10001 --export excel  # Consultar la base y exportar
+  python main.py --parse-workers 4                 # Parsear perfiles en 4 procesos aparte del navegador
+  python main.py --webdriver-stats commands.json   # Contabilidad de comandos WebDriver
+  python main.py --memory-report memory.json       # Picos de memoria por etapa
+  python main.py --profile sampling                # Perfil (stacks colapsados) espera vs CPU
+  python main.py --metrics-file /var/lib/node_exporter/instagram.prom  # Métricas para Prometheus
 
 Configuración de autenticación:
   - Copia env_example.txt a .env y configura INSTAGRAM_USERNAME/INSTAGRAM_PASSWORD
@@ -75,12 +102,25 @@ Configuración de autenticación:
         help='Formato de exportación (default: excel)'
     )
     
+    parser.add_argument(
+        '--export-columns',
+        choices=['basic', 'all'],
+        help="Columnas exportadas: 'basic' (username, nombre, bio, contadores, fecha y cuenta) "
+             "o 'all' (todos los campos del perfil) (default: EXPORT_COLUMNS o basic)"
+    )
+    
     parser.add_argument(
         '--debug',
         action='store_true',
         help='Activar modo debug con logging detallado'
     )
     
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='No mostrar el log en consola (sigue escribiéndose en logs/)'
+    )
+    
     parser.add_argument(
         '--no-selenium',
         action='store_true',
@@ -101,6 +141,203 @@ Configuración de autenticación:
         help='Máximo número de seguidores a extraer por cuenta (default: todos)'
     )
     
+    parser.add_argument(
+        '--reuse-browser',
+        action='store_true',
+        help='Conectarse al navegador persistente (lo arranca si no existe)'
+    )
+    
+    parser.add_argument(
+        '--capture-raw',
+        nargs='?',
+        const='head',
+        choices=['head', 'full'],
+        default=None,
+        help='Guardar el HTML de cada perfil (head o página completa) en data/raw para re-parsearlo'
+    )
+    
+    parser.add_argument(
+        '--profile-fetcher',
+        choices=['browser', 'http'],
+        default=None,
+        help='Cómo obtener cada perfil: navegando con Selenium o descargándolo por HTTP (default: browser)'
+    )
+    
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        default=None,
+        metavar='N',
+        help='Parsear el HTML de los perfiles en N procesos sin bloquear el navegador (0 = desactivado)'
+    )
+    
+    parser.add_argument(
+        '--results-db',
+        type=str,
+        default=None,
+        metavar='DB_PATH',
+        help='Base SQLite donde se guardan los resultados (default: data/processed/results.sqlite3)'
+    )
+    
+    parser.add_argument(
+        '--no-results-db',
+        action='store_true',
+        help='No guardar los resultados en la base SQLite'
+    )
+    
+    parser.add_argument(
+        '--fake-browser',
+        type=str,
+        default=None,
+        metavar='CORPUS_DIR',
+        help='Usar un navegador falso que sirve páginas HTML de CORPUS_DIR (lo genera si está vacío; requiere benchmarks/ del repositorio)'
+    )
+    
+    parser.add_argument(
+        '--fake-latency',
+        type=float,
+        default=0.0,
+        help='Segundos de carga simulados por página con --fake-browser (default: 0)'
+    )
+    
+    parser.add_argument(
+        '--timings',
+        type=str,
+        default=None,
+        metavar='REPORT.json',
+        help='Escribir informe de tiempos por fase (p50/p95/p99) en formato JSON'
+    )
+    
+    parser.add_argument(
+        '--webdriver-stats',
+        type=str,
+        default=None,
+        metavar='REPORT.json',
+        help='Contar y cronometrar cada comando WebDriver y escribir el informe en JSON'
+    )
+    
+    parser.add_argument(
+        '--memory-report',
+        type=str,
+        default=None,
+        metavar='REPORT.json',
+        help='Perfilar memoria (tracemalloc + RSS) por etapa y escribir el informe en JSON'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        choices=['cprofile', 'sampling'],
+        default=None,
+        help='Perfilar extracción y exportación (pstats o stacks colapsados para speedscope)'
+    )
+    
+    parser.add_argument(
+        '--profile-output',
+        type=str,
+        default=None,
+        help='Archivo del perfil (default: <output-dir>/profile_<timestamp>.pstats|.collapsed)'
+    )
+    
+    parser.add_argument(
+        '--metrics-file',
+        type=str,
+        default=None,
+        help='Archivo .prom (OpenMetrics) para el textfile collector de node-exporter'
+    )
+    
+    parser.add_argument(
+        '--metrics-every',
+        type=int,
+        default=None,
+        help='Reescribir el archivo de métricas cada N perfiles (default: solo al terminar)'
+    )
+    
+    subparsers = parser.add_subparsers(dest='command')
+    
+    browser_parser = subparsers.add_parser(
+        'browser',
+        help='Gestiona el navegador persistente reutilizable entre ejecuciones'
+    )
+    browser_parser.add_argument(
+        'action',
+        choices=['start', 'stop', 'status'],
+        help='Acción a realizar sobre el navegador persistente'
+    )
+    
+    reparse_parser = subparsers.add_parser(
+        'reparse',
+        help='Reconstruye los registros desde los snapshots de data/raw y los exporta'
+    )
+    reparse_parser.add_argument('--since', type=datetime.fromisoformat, default=None, help='Solo capturas desde esta fecha (ISO, ej: 2024-05-01)')
+    reparse_parser.add_argument('--until', type=datetime.fromisoformat, default=None, help='Solo capturas anteriores a esta fecha (ISO)')
+    reparse_parser.add_argument('--username', type=str, default=None, help='Solo capturas de este perfil')
+    
+    query_parser = subparsers.add_parser(
+        'query',
+        help='Consulta los perfiles guardados en la base SQLite y opcionalmente los exporta'
+    )
+    query_parser.add_argument('--username', type=str, default=None, help='Solo registros de este perfil')
+    query_parser.add_argument('--account', type=str, default=None, help='Solo seguidores de esta cuenta (ej: mercadona)')
+    query_parser.add_argument('--min-followers', type=int, default=None, help='Mínimo de seguidores del perfil')
+    query_parser.add_argument('--max-followers', type=int, default=None, help='Máximo de seguidores del perfil')
+    query_parser.add_argument('--since', type=datetime.fromisoformat, default=None, help='Solo extracciones desde esta fecha (ISO)')
+    query_parser.add_argument('--until', type=datetime.fromisoformat, default=None, help='Solo extracciones anteriores a esta fecha (ISO)')
+    query_parser.add_argument('--latest', action='store_true', help='Solo el registro más reciente de cada perfil')
+    query_parser.add_argument('--limit', type=int, default=20, help='Máximo de filas (0 = sin límite, default: 20)')
+    query_parser.add_argument(
+        '--export',
+        choices=['excel', 'csv', 'both'],
+        default=None,
+        help='Exportar el resultado con el exportador habitual en vez de solo mostrarlo'
+    )
+    
+    standin_parser = subparsers.add_parser(
+        'standin-server',
+        help='Sirve páginas de perfil grabadas o sintéticas en local (usar con INSTAGRAM_BASE_URL)'
+    )
+    standin_parser.add_argument('--corpus', type=str, default=None, help='Directorio del corpus HTML (se genera si está vacío)')
+    standin_parser.add_argument('--host', type=str, default=None, help='Dirección de escucha')
+    standin_parser.add_argument('--port', type=int, default=None, help='Puerto de escucha')
+    standin_parser.add_argument('--latency', type=float, default=None, help='Segundos de respuesta por página')
+    standin_parser.add_argument('--jitter', type=float, default=None, help='Variación relativa de la latencia (0.2 = ±20%%)')
+    standin_parser.add_argument('--error-rate', type=float, default=None, help='Fracción de respuestas con error (0.0 - 1.0)')
+    standin_parser.add_argument('--error-status', type=int, default=None, help='Código HTTP de los errores (default: 429)')
+    standin_parser.add_argument('--followers', type=int, default=50, help='Seguidores por cuenta al generar el corpus (default: 50)')
+    
+    bench_parser = subparsers.add_parser(
+        'bench-export',
+        help='Mide la exportación de extremo a extremo con perfiles sintéticos'
+    )
+    bench_parser.add_argument(
+        '--rows',
+        type=int,
+        nargs='+',
+        required=True,
+        help='Número total de perfiles sintéticos (varios valores para ver cómo escala)'
+    )
+    bench_parser.add_argument(
+        '--export-format',
+        '--formats',
+        dest='formats',
+        nargs='+',
+        choices=['excel', 'csv'],
+        default=['excel', 'csv'],
+        help='Formatos de exportación a medir (default: excel csv; --formats es un alias)'
+    )
+    bench_parser.add_argument(
+        '--seed',
+        type=int,
+        default=42,
+        help='Semilla del generador de datos (default: 42)'
+    )
+    bench_parser.add_argument(
+        '--report',
+        type=str,
+        default=None,
+        metavar='REPORT.json',
+        help='Escribir resultados y tiempos por fase en formato JSON'
+    )
+    
     return parser.parse_args()
 
 
@@ -116,6 +353,230 @@ def setup_environment(args):
         'data/output',
         args.output_dir
     ])
+    
+    if getattr(args, 'export_columns', None):
+        OUTPUT_SETTINGS['export_columns'] = args.export_columns
+
+
+def run_browser_command(args) -> None:
+    """
+    Ejecuta las acciones del subcomando 'browser'.
+    
+    Args:
+        args: Argumentos parseados
+    """
+    from src.utils import browser_daemon
+    
+    if args.action == 'start':
+        state = browser_daemon.start_daemon()
+        print(f"✅ Navegador persistente ({state['browser']}) en {state['debugger_address']} - PID {state['pid']}")
+    elif args.action == 'stop':
+        if browser_daemon.stop_daemon():
+            print("✅ Navegador persistente detenido")
+        else:
+            print("ℹ️  No hay navegador persistente en ejecución")
+    else:
+        state = browser_daemon.get_running_daemon()
+        if state:
+            print(f"✅ Navegador persistente ({state['browser']}) en {state['debugger_address']} - PID {state['pid']} desde {state['started_at']}")
+        else:
+            print("ℹ️  No hay navegador persistente en ejecución")
+
+
+def run_reparse(args) -> List[str]:
+    """
+    Ejecuta el subcomando 'reparse': parsea la captura más reciente de cada
+    perfil y exporta el resultado como una extracción normal.
+    
+    Args:
+        args: Argumentos parseados
+        
+    Returns:
+        Lista de archivos generados
+    """
+    from src.extractors.profile_parser import parse_profile_html
+    from src.utils.snapshot_store import SnapshotStore
+    from src.utils.profile_record import ProfileRecord
+    from src.utils.result_table import ResultTable
+    
+    store = SnapshotStore()
+    entries = store.latest(
+        since=args.since,
+        until=args.until,
+        username=args.username
+    )
+    
+    data = ResultTable()
+    for (source_account, username), entry in entries.items():
+        # Contadores no encontrados a 0, como en una extracción normal
+        record = ProfileRecord(
+            username, source_account, extraction_timestamp=entry['captured_at'],
+            follower_count=0, following_count=0, posts_count=0
+        )
+        record.update(parse_profile_html(store.get(entry['sha256'])))
+        data.append(source_account.lstrip('@') or 'sin_cuenta', record)
+    data.flush()
+    
+    print(f"ℹ️  {len(entries)} perfiles re-parseados desde {store.root}")
+    
+    if not len(data):
+        return []
+    
+    save_results(data, args)
+    generated_files = export_data(data, args)
+    for path in generated_files:
+        print(f"✅ {path}")
+    return generated_files
+
+
+def run_query(args) -> List[str]:
+    """
+    Ejecuta el subcomando 'query': busca en la base SQLite, muestra las filas
+    y exporta el resultado si se pidió.
+    
+    Args:
+        args: Argumentos parseados
+        
+    Returns:
+        Lista de archivos generados
+    """
+    from src.utils.results_store import ResultsStore, profiles_to_table
+    
+    start = time.perf_counter()
+    try:
+        store = ResultsStore(args.results_db, read_only=True)
+    except FileNotFoundError as e:
+        print(f"❌ {e} (se crea en la primera extracción; --results-db RUTA para usar otra)", file=sys.stderr)
+        sys.exit(1)
+    
+    with store:
+        profiles = store.query(
+            username=args.username,
+            source_account=args.account,
+            min_followers=args.min_followers,
+            max_followers=args.max_followers,
+            since=args.since,
+            until=args.until,
+            latest=args.latest,
+            limit=args.limit or None
+        )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    print(f"{'username':<30} {'cuenta':<20} {'seguidores':>12} {'extracción':<26}")
+    for profile in profiles:
+        followers = profile['follower_count'] if profile['follower_count'] is not None else '-'
+        print(f"{profile['username']:<30} {profile['source_account']:<20} {followers:>12} {profile['extraction_timestamp']:<26}")
+    print(f"ℹ️  {len(profiles)} perfiles en {elapsed_ms:.1f} ms")
+    
+    if not args.export or not profiles:
+        return []
+    
+    export_args = argparse.Namespace(export_format=args.export, output_dir=args.output_dir)
+    generated_files = export_data(profiles_to_table(profiles), export_args)
+    for path in generated_files:
+        print(f"✅ {path}")
+    return generated_files
+
+
+def run_standin_server(args) -> None:
+    """
+    Ejecuta el subcomando 'standin-server' hasta Ctrl+C.
+    
+    Args:
+        args: Argumentos parseados
+    """
+    from src.config.settings import STANDIN_SERVER_CONFIG
+    from src.utils.page_corpus import PageCorpus, build_corpus
+    from src.utils.standin_server import StandinServer
+    
+    corpus_dir = args.corpus or STANDIN_SERVER_CONFIG['corpus_dir']
+    corpus = PageCorpus(corpus_dir)
+    if corpus.is_empty():
+        corpus = build_corpus(corpus_dir, args.accounts, args.followers)
+        print(f"📁 Corpus sintético generado en {corpus_dir} ({args.followers} seguidores por cuenta)")
+    
+    server = StandinServer(
+        corpus,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status
+    ).start()
+    
+    print(f"✅ Servidor local en {server.base_url} (Ctrl+C para detener)")
+    print(f"   export INSTAGRAM_BASE_URL={server.base_url}")
+    
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        stats = server.get_stats()
+        print(f"ℹ️  {stats['requests']} peticiones servidas: {stats['by_status']}")
+
+
+def run_bench_export(args) -> None:
+    """
+    Ejecuta el subcomando 'bench-export': exporta perfiles sintéticos en cada
+    formato y tamaño y muestra duración, filas/s, tamaño y memoria.
+    
+    Args:
+        args: Argumentos parseados
+    """
+    import tempfile
+    from src.utils.synthetic_data import build_account_data
+    from src.utils.memory_watchdog import get_current_rss
+    from src.utils.result_table import ResultTable
+    
+    timer = PhaseTimer()
+    results = []
+    
+    print(f"{'filas':>10} {'formato':>8} {'segundos':>10} {'filas/s':>10} {'MB':>8} {'RSS MB':>8}")
+    
+    for rows in args.rows:
+        with timer.span(f"generate_{rows}"):
+            data = ResultTable.from_dict(build_account_data(rows, args.accounts, args.seed))
+        
+        for export_format in args.formats:
+            result = {'rows': rows, 'format': export_format}
+            
+            with tempfile.TemporaryDirectory(prefix='bench_export_') as output_dir:
+                export_args = argparse.Namespace(export_format=export_format, output_dir=output_dir)
+                run_timer = PhaseTimer()
+                start = time.perf_counter()
+                try:
+                    files = export_data(data, export_args, run_timer)
+                    result['seconds'] = round(time.perf_counter() - start, 3)
+                    result['bytes'] = sum(Path(path).stat().st_size for path in files)
+                except Exception as e:
+                    # Ej: más filas por hoja de las que admite Excel (1.048.576)
+                    result['error'] = str(e)
+            
+            result['rss_bytes'] = get_current_rss()
+            result['phases'] = run_timer.summary()
+            results.append(result)
+            timer.record(f"export_{export_format}_{rows}", result.get('seconds', 0.0))
+            
+            if 'error' in result:
+                print(f"{rows:>10} {export_format:>8}  error: {result['error']}")
+            else:
+                rows_per_second = rows / result['seconds'] if result['seconds'] else 0.0
+                print(
+                    f"{rows:>10} {export_format:>8} {result['seconds']:>10.3f} {rows_per_second:>10.0f} "
+                    f"{result['bytes'] / 1024 / 1024:>8.1f} {result['rss_bytes'] / 1024 / 1024:>8.0f}"
+                )
+        
+        del data
+    
+    if args.report:
+        timer.metadata['seed'] = args.seed
+        timer.metadata['accounts'] = args.accounts
+        timer.metadata['results'] = results
+        timer.write_report(args.report)
 
 
 def validate_requirements(args) -> bool:
@@ -136,12 +597,20 @@ def validate_requirements(args) -> bool:
     return True
 
 
-def extract_followers_data(args) -> Dict[str, List[Dict[str, Any]]]:
+def extract_followers_data(
+    args,
+    timer: PhaseTimer = None,
+    memory_profiler=None,
+    metrics: MetricsRegistry = None
+) -> 'ResultTable':
     """
     Ejecuta la extracción de datos de seguidores.
     
     Args:
         args: Argumentos parseados
+        timer: Temporizador de fases (opcional)
+        memory_profiler: Perfilador de memoria por etapa (opcional)
+        metrics: Registro de métricas (opcional)
         
     Returns:
         Datos extraídos por cuenta
@@ -149,8 +618,67 @@ def extract_followers_data(args) -> Dict[str, List[Dict[str, Any]]]:
     # Limitar la cantidad de cuentas si se especifica --max-accounts
     accounts_to_process = args.accounts
     
+    # Reutilizar el navegador persistente si se solicita
+    if args.reuse_browser:
+        from src.config.settings import BROWSER_DAEMON_CONFIG
+        BROWSER_DAEMON_CONFIG['enabled'] = True
+    
+    # Contabilidad opcional de comandos WebDriver
+    command_recorder = None
+    if args.webdriver_stats:
+        from src.utils.webdriver_stats import WebDriverCommandRecorder
+        command_recorder = WebDriverCommandRecorder()
+    
+    # Captura de snapshots HTML para re-parsear después
+    if args.capture_raw:
+        from src.config.settings import SNAPSHOT_CONFIG
+        SNAPSHOT_CONFIG['enabled'] = True
+        SNAPSHOT_CONFIG['mode'] = args.capture_raw
+    
+    # Parseo de perfiles en un pool de procesos
+    if args.parse_workers is not None:
+        from src.config.settings import PARSING_CONFIG
+        PARSING_CONFIG['workers'] = args.parse_workers
+    
+    # Navegador falso sobre un corpus HTML (benchmarks y perfilado sin red)
+    driver_factory = None
+    if args.fake_browser:
+        # El doble de WebDriver vive con los benchmarks (fuera de src/): solo
+        # está disponible desde un checkout del repositorio
+        try:
+            from benchmarks.fakes.fake_webdriver import FakeWebDriver
+        except ImportError as e:
+            print(f"❌ --fake-browser necesita benchmarks/fakes del repositorio (checkout completo): {e}", file=sys.stderr)
+            sys.exit(1)
+        from src.utils.page_corpus import PageCorpus, build_corpus
+        corpus = PageCorpus(args.fake_browser)
+        if corpus.is_empty():
+            corpus = build_corpus(args.fake_browser, accounts_to_process, args.max_followers or 50)
+        driver_factory = lambda: FakeWebDriver(
+            corpus,
+            latency=args.fake_latency,
+            base_url=INSTAGRAM_CONFIG['base_url'] + '/'
+        )
+    
+    # Descarga de perfiles por HTTP (comparte sesión, parser y métricas con el navegador)
+    from src.config.settings import HTTP_FETCH_CONFIG
+    if args.profile_fetcher:
+        HTTP_FETCH_CONFIG['profile_fetcher'] = args.profile_fetcher
+    profile_fetcher = None
+    if HTTP_FETCH_CONFIG['profile_fetcher'] == 'http':
+        from src.extractors.http_profile_extractor import HttpProfileExtractor
+        profile_fetcher = HttpProfileExtractor(timer=timer, memory_profiler=memory_profiler, metrics=metrics)
+    
     # Inicializar extractor
-    with InstagramExtractor() as extractor:
+    from src.extractors.instagram_extractor import InstagramExtractor
+    with profile_fetcher if profile_fetcher else nullcontext(), InstagramExtractor(
+        timer=timer,
+        command_recorder=command_recorder,
+        memory_profiler=memory_profiler,
+        metrics=metrics,
+        driver_factory=driver_factory,
+        profile_fetcher=profile_fetcher
+    ) as extractor:
         # Configurar delay personalizado si se especifica
         if hasattr(args, 'delay'):
             from src.config.settings import RATE_LIMITS
@@ -158,24 +686,42 @@ def extract_followers_data(args) -> Dict[str, List[Dict[str, Any]]]:
         
         # Extraer datos de todas las cuentas
         results = extractor.extract_multiple_accounts(accounts_to_process, max_followers=args.max_followers)
+        extractor.update_metrics()
         
+        if timer is not None:
+            stats = extractor.get_extraction_stats()
+            stats.pop('phases', None)
+            timer.metadata['extraction_stats'] = stats
+    
+    if command_recorder is not None:
+        command_recorder.write_report(args.webdriver_stats)
     
     return results
 
 
-def export_data(data: Dict[str, List[Dict[str, Any]]], args) -> List[str]:
+def export_data(
+    data: 'ResultTable',
+    args,
+    timer: PhaseTimer = None,
+    memory_profiler=None,
+    metrics: MetricsRegistry = None
+) -> List[str]:
     """
     Exporta los datos extraídos según el formato especificado.
     
     Args:
         data: Datos a exportar
         args: Argumentos con configuración de exportación
+        timer: Temporizador de fases (opcional)
+        memory_profiler: Perfilador de memoria por etapa (opcional)
+        metrics: Registro de métricas (opcional)
         
     Returns:
         Lista de archivos generados
     """
     # Inicializar exportador
-    exporter = ExcelExporter(output_dir=args.output_dir)
+    from src.exporters.excel_exporter import ExcelExporter
+    exporter = ExcelExporter(output_dir=args.output_dir, timer=timer, memory_profiler=memory_profiler)
     generated_files = []
     
     # Exportar según formato especificado
@@ -183,22 +729,106 @@ def export_data(data: Dict[str, List[Dict[str, Any]]], args) -> List[str]:
         timestamp = format_timestamp()
         excel_filename = f"instagram_followers_{timestamp}.xlsx"
         
+        start = time.perf_counter()
         excel_path = exporter.export_to_excel(data, excel_filename)
+        _record_export_metrics(metrics, 'excel', time.perf_counter() - start, [excel_path])
         generated_files.append(excel_path)
     
     if args.export_format in ['csv', 'both']:
+        start = time.perf_counter()
         csv_files = exporter.export_to_csv(data, args.output_dir)
+        _record_export_metrics(metrics, 'csv', time.perf_counter() - start, csv_files)
         generated_files.extend(csv_files)
     
     return generated_files
 
 
+def save_results(data: 'ResultTable', args, timer: PhaseTimer = None) -> int:
+    """
+    Guarda los resultados en la base SQLite (salvo con --no-results-db).
+    
+    Args:
+        data: Tabla de resultados
+        args: Argumentos con la ruta de la base
+        timer: Temporizador de fases (opcional)
+        
+    Returns:
+        Número de perfiles guardados
+    """
+    import sqlite3
+    from src.config.settings import RESULTS_DB_CONFIG
+    from src.utils.results_store import ResultsStore
+    
+    if args.no_results_db or not RESULTS_DB_CONFIG['enabled'] or not len(data):
+        return 0
+    
+    try:
+        with (timer.span('results_db') if timer else nullcontext()), ResultsStore(args.results_db) as store:
+            saved = store.save_table(data)
+    except sqlite3.Error as e:
+        # Base bloqueada, corrupta o disco lleno: la exportación sigue adelante
+        logger.warning("No se pudieron guardar los resultados en la base SQLite: %s", e)
+        return 0
+    print(f"✅ {saved} perfiles guardados en {store.path}")
+    return saved
+
+
+def _record_export_metrics(metrics: MetricsRegistry, export_format: str, seconds: float, files: List[str]) -> None:
+    """
+    Registra duración y bytes escritos de una exportación.
+    
+    Args:
+        metrics: Registro de métricas (None para no registrar)
+        export_format: Formato exportado
+        seconds: Duración de la exportación
+        files: Archivos generados
+    """
+    if metrics is None:
+        return
+    
+    metrics.set('export_duration_seconds', seconds, help_text='Duración de la exportación', format=export_format)
+    metrics.set(
+        'export_bytes_written',
+        sum(Path(path).stat().st_size for path in files),
+        help_text='Bytes escritos por la exportación',
+        format=export_format
+    )
+
+
 def main():
     """Función principal del script."""
     try:
         # Parsear argumentos
         args = parse_arguments()
         
+        # Logging estructurado no bloqueante
+        setup_logging(
+            level='DEBUG' if args.debug else None,
+            console=False if args.quiet else None,
+            console_level='DEBUG' if args.debug else None
+        )
+        
+        # Subcomandos auxiliares
+        if args.command == 'browser':
+            run_browser_command(args)
+            return
+        if args.command == 'reparse':
+            setup_environment(args)
+            run_reparse(args)
+            return
+        if args.command == 'query':
+            # Solo se crean directorios si hay que exportar
+            if args.export:
+                setup_environment(args)
+            run_query(args)
+            return
+        if args.command == 'standin-server':
+            run_standin_server(args)
+            return
+        if args.command == 'bench-export':
+            run_bench_export(args)
+            return
+        
         # Configurar entorno
         setup_environment(args)
         
@@ -206,10 +836,55 @@ def main():
         if not validate_requirements(args):
             sys.exit(1)
         
-        # Extraer datos
-        data = extract_followers_data(args)
-        # Exportar datos
-        export_data(data, args)
+        timer = PhaseTimer()
+        metrics = MetricsRegistry()
+        
+        # Archivo de métricas para el textfile collector
+        if args.metrics_file:
+            METRICS_CONFIG['textfile'] = args.metrics_file
+        if args.metrics_every is not None:
+            METRICS_CONFIG['write_every'] = args.metrics_every
+        
+        # Perfilado de memoria opcional
+        memory_profiler = None
+        if args.memory_report:
+            from src.utils.memory_profiler import MemoryProfiler
+            memory_profiler = MemoryProfiler()
+            memory_profiler.start()
+        
+        # Perfilado de CPU opcional (espera vs CPU)
+        profiler = None
+        if args.profile:
+            from src.utils.profiling import CLIProfiler
+            extension = 'pstats' if args.profile == 'cprofile' else 'collapsed'
+            profile_output = args.profile_output or str(
+                Path(args.output_dir) / f"profile_{format_timestamp()}.{extension}"
+            )
+            profiler = CLIProfiler(args.profile, profile_output)
+        
+        with profiler.run() if profiler else nullcontext():
+            # Extraer datos
+            with timer.span('extraction'):
+                data = extract_followers_data(args, timer, memory_profiler, metrics)
+            # Guardar antes de exportar: un fallo de exportación no pierde la extracción
+            save_results(data, args, timer)
+            # Exportar datos
+            with timer.span('export'):
+                export_data(data, args, timer, memory_profiler, metrics)
+        
+        # Métricas finales (OpenMetrics)
+        if METRICS_CONFIG['textfile']:
+            metrics.set('run_duration_seconds', time.perf_counter() - timer.started_at, help_text='Duración total de la ejecución')
+            metrics.write_textfile(METRICS_CONFIG['textfile'])
+        
+        # Informe de tiempos por fase
+        if args.timings:
+            timer.write_report(args.timings)
+        
+        # Al final: el snapshot de asignaciones de tracemalloc no cuenta en los tiempos
+        if memory_profiler is not None:
+            memory_profiler.stop()
+            memory_profiler.write_report(args.memory_report)
         
     except KeyboardInterrupt:
         sys.exit(1)
@@ -3,20 +3,51 @@ Configuración central del extractor de Instagram.
 """
 from datetime import timedelta
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import List
+import logging
+import logging.handlers
 import os
 
+logger = logging.getLogger(__name__)
+
+# Este módulo se importa antes de setup_logging: sus mensajes se retienen
+# hasta que setup_logging los recoge con release_startup_logs (si no, INFO y
+# DEBUG se descartarían y nunca llegarían al archivo de log)
+_startup_log_buffer = logging.handlers.BufferingHandler(capacity=100)
+logger.addHandler(_startup_log_buffer)
+logger.setLevel(logging.DEBUG)
+logger.propagate = False
+
+
+def release_startup_logs() -> List[logging.LogRecord]:
+    """
+    Deja de retener los mensajes de este módulo.
+
+    Returns:
+        Registros emitidos desde la importación (los siguientes se propagan con normalidad)
+    """
+    logger.removeHandler(_startup_log_buffer)
+    logger.setLevel(logging.NOTSET)
+    logger.propagate = True
+
+    records = list(_startup_log_buffer.buffer)
+    _startup_log_buffer.buffer.clear()
+    return records
+
+
 # Intentar cargar variables de entorno desde archivo .env
 try:
     # Buscar archivo .env en el directorio raíz del proyecto
     env_path = Path(__file__).parent.parent.parent / '.env'
     if env_path.exists():
+        # Solo hace falta con .env (se ahorra la importación al arrancar sin él)
+        from dotenv import load_dotenv
         load_dotenv(env_path)
-        print(f"✅ Variables de entorno cargadas desde: {env_path}")
+        logger.info("Variables de entorno cargadas desde: %s", env_path)
     else:
-        print("ℹ️  Archivo .env no encontrado - usando valores por defecto")
+        logger.info("Archivo .env no encontrado - usando valores por defecto")
 except Exception as e:
-    print(f"⚠️  Error cargando variables de entorno: {e}")
+    logger.warning("Error cargando variables de entorno: %s", e)
 
 def get_env_variable(var_name: str, default=None, var_type=str):
     """
@@ -116,6 +147,9 @@ OUTPUT_SETTINGS = {
     'excel_filename': 'instagram_followers_data.xlsx',
     'sheet_prefix': 'Seguidores_',
     'include_metadata': get_env_variable('INCLUDE_METADATA', True, bool),
+    # Columnas de las hojas y CSV por cuenta: 'basic' (las de siempre) o 'all'
+    # (además teléfonos, fechas, verificado, privado y URL externa)
+    'export_columns': get_env_variable('EXPORT_COLUMNS', 'basic'),
     'date_format': get_env_variable('DATE_FORMAT', '%Y-%m-%d'),
     'datetime_format': get_env_variable('DATETIME_FORMAT', '%Y-%m-%d %H:%M:%S')
 }
@@ -129,6 +163,18 @@ SELENIUM_CONFIG_BASE = {
     ),
     'implicit_wait': 10,
     'page_load_timeout': 30,
+    # Estrategia de carga: 'normal' (carga completa), 'eager' (DOMContentLoaded) o 'none'
+    'page_load_strategy': get_env_variable('SELENIUM_PAGE_LOAD_STRATEGY', 'eager'),
+    # Espera máxima y frecuencia de sondeo de los meta tags del perfil (segundos)
+    'metadata_wait_timeout': get_env_variable('METADATA_WAIT_TIMEOUT', 5.0, float),
+    'metadata_poll_interval': get_env_variable('METADATA_POLL_INTERVAL', 0.1, float),
+    # Reciclaje del driver: umbral de RSS del navegador (MB), navegaciones máximas
+    # por driver (0 desactiva) y navegaciones entre muestras de memoria
+    'max_browser_rss_mb': get_env_variable('MAX_BROWSER_RSS_MB', 1500, int),
+    'recycle_after_navigations': get_env_variable('RECYCLE_AFTER_NAVIGATIONS', 500, int),
+    'memory_check_interval': get_env_variable('MEMORY_CHECK_INTERVAL', 25, int),
+    # Pestañas reutilizadas para cargar perfiles en paralelo
+    'tab_pool_size': get_env_variable('TAB_POOL_SIZE', 5, int),
     'enable_cookies': get_env_variable('ENABLE_COOKIES', True, bool),
     'enable_user_agent_rotation': get_env_variable('ENABLE_USER_AGENT_ROTATION', True, bool),
     'stealth_mode': get_env_variable('STEALTH_MODE', True, bool),
@@ -154,7 +200,7 @@ def initialize_browser_detection():
         
         return True
     except Exception as e:
-        print(f"⚠️  Error en detección de navegador: {e}")
+        logger.warning("Error en detección de navegador: %s", e)
         # Fallback a user agents básicos
         SELENIUM_CONFIG_BASE.update({
             'user_agents': [
@@ -176,7 +222,12 @@ LOGGING_CONFIG = {
     'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     'filename': 'instagram_extractor.log',
     'max_bytes': get_env_variable('LOG_FILE_SIZE_MB', 10, int) * 1024 * 1024,  # Convertir MB a bytes
-    'backup_count': get_env_variable('LOG_BACKUP_COUNT', 5, int)
+    'backup_count': get_env_variable('LOG_BACKUP_COUNT', 5, int),
+    # Fracción de mensajes DEBUG que se registran (1.0 = todos)
+    'debug_sample_rate': get_env_variable('LOG_DEBUG_SAMPLE_RATE', 1.0, float),
+    # Consola en texto legible (el JSON va solo al archivo); --quiet la desactiva
+    'console': get_env_variable('LOG_TO_CONSOLE', True, bool),
+    'console_level': get_env_variable('LOG_CONSOLE_LEVEL', 'INFO')
 }
 
 # Patrones regex para validación
@@ -198,9 +249,106 @@ DATA_PATHS = {
     'backup': get_env_variable('BACKUP_DIR', 'backups')
 }
 
+# Navegador persistente reutilizable entre ejecuciones (con variables de entorno)
+BROWSER_DAEMON_CONFIG = {
+    'enabled': get_env_variable('REUSE_BROWSER', False, bool),
+    'host': '127.0.0.1',
+    'port': get_env_variable('BROWSER_DAEMON_PORT', 9222, int),
+    'headless': get_env_variable('BROWSER_DAEMON_HEADLESS', False, bool),
+    'user_data_dir': get_env_variable('BROWSER_DAEMON_PROFILE_DIR', 'data/browser_daemon_profile'),
+    'state_file': str(Path(DATA_PATHS['temp']) / 'browser_daemon.json'),
+    'startup_timeout': get_env_variable('BROWSER_DAEMON_STARTUP_TIMEOUT', 15, int)
+}
+
+# Perfil de navegador persistente con caché HTTP limitada (con variables de entorno)
+BROWSER_PROFILE_CONFIG = {
+    # Opt-in: guarda cookies y sesión entre ejecuciones y no admite dos
+    # ejecuciones a la vez sobre el mismo directorio (sin él, perfil temporal)
+    'enabled': get_env_variable('PERSISTENT_BROWSER_PROFILE', False, bool),
+    'profile_dir': get_env_variable('BROWSER_PROFILE_DIR', 'data/browser_profile'),
+    # Ubicar el perfil en un directorio en RAM (tmpfs) para acelerar la caché
+    'use_tmpfs': get_env_variable('BROWSER_PROFILE_TMPFS', False, bool),
+    'tmpfs_dir': get_env_variable('BROWSER_PROFILE_TMPFS_DIR', '/dev/shm/instagram_extractor'),
+    'cache_max_mb': get_env_variable('BROWSER_CACHE_MAX_MB', 256, int),
+    # Fracción del límite a la que se reduce la caché al expulsar entradas (LRU)
+    'cache_low_watermark': 0.8,
+    'report_cache_stats': get_env_variable('REPORT_CACHE_STATS', True, bool)
+}
+
+# Métricas para el textfile collector de node-exporter (con variables de entorno)
+METRICS_CONFIG = {
+    'textfile': get_env_variable('METRICS_TEXTFILE'),
+    # Escribir también cada N perfiles (0 = solo al terminar)
+    'write_every': get_env_variable('METRICS_WRITE_EVERY', 0, int)
+}
+
+# Captura de snapshots HTML de perfiles en DATA_PATHS['raw'] (con variables de entorno)
+SNAPSHOT_CONFIG = {
+    'enabled': get_env_variable('CAPTURE_RAW', False, bool),
+    # 'head' guarda solo <head> (contiene los meta tags); 'full' guarda la página completa
+    'mode': get_env_variable('CAPTURE_RAW_MODE', 'head'),
+    'compression_level': get_env_variable('CAPTURE_RAW_COMPRESSION_LEVEL', 3, int)
+}
+
+# Parseo del HTML de perfiles en un pool de procesos (con variables de entorno)
+PARSING_CONFIG = {
+    # Procesos del pool (0 = parsear en el hilo del navegador)
+    'workers': get_env_variable('PARSE_WORKERS', 0, int)
+}
+
+# Descarga de perfiles por HTTP sin navegador (con variables de entorno)
+HTTP_FETCH_CONFIG = {
+    # 'browser' navega cada perfil con Selenium; 'http' lo descarga con requests
+    'profile_fetcher': get_env_variable('PROFILE_FETCHER', 'browser'),
+    'pool_size': get_env_variable('HTTP_POOL_SIZE', 4, int),
+    'timeout': RATE_LIMITS['timeout'],
+    'max_retries': RATE_LIMITS['max_retries'],
+    # Pausa mínima entre peticiones (apply_rate_limiting) y espera máxima ante 429
+    'delay': {'base': get_env_variable('HTTP_FETCH_DELAY', 1.0, float), 'max': 5.0},
+    'max_retry_after': get_env_variable('HTTP_MAX_RETRY_AFTER', 120, int),
+    'user_agent': get_env_variable(
+        'HTTP_USER_AGENT',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36'
+    ),
+    'accept_language': 'es-ES,es;q=0.9',
+    # ETag/Last-Modified de cada perfil para peticiones condicionales entre ejecuciones
+    'validators_file': str(Path(DATA_PATHS['temp']) / 'http_validators.json')
+}
+
+# Ranking adaptativo de selectores del modal de seguidores y de popups (con variables de entorno)
+SELECTOR_RANKING_CONFIG = {
+    'enabled': get_env_variable('SELECTOR_RANKING', True, bool),
+    'file': str(Path(DATA_PATHS['temp']) / 'selector_ranking.json'),
+    # Peso del historial en cada intento (menor = se adapta antes a cambios de Instagram)
+    'decay': get_env_variable('SELECTOR_RANKING_DECAY', 0.8, float)
+}
+
+# Base de datos SQLite con los resultados de cada extracción (con variables de entorno)
+RESULTS_DB_CONFIG = {
+    'enabled': get_env_variable('RESULTS_DB', True, bool),
+    'path': get_env_variable('RESULTS_DB_PATH', str(Path(DATA_PATHS['processed']) / 'results.sqlite3')),
+    # Filas por transacción al insertar
+    'batch_size': get_env_variable('RESULTS_DB_BATCH_SIZE', 5_000, int)
+}
+
+# Servidor local que imita las páginas de Instagram (con variables de entorno)
+STANDIN_SERVER_CONFIG = {
+    'host': get_env_variable('STANDIN_SERVER_HOST', '127.0.0.1'),
+    'port': get_env_variable('STANDIN_SERVER_PORT', 8765, int),
+    'corpus_dir': get_env_variable('STANDIN_CORPUS_DIR', 'data/fixtures'),
+    # Segundos de respuesta por página y variación relativa (0.2 = ±20%)
+    'latency': get_env_variable('STANDIN_LATENCY', 0.0, float),
+    'jitter': get_env_variable('STANDIN_JITTER', 0.0, float),
+    # Fracción de respuestas con error y código devuelto (429 incluye Retry-After)
+    'error_rate': get_env_variable('STANDIN_ERROR_RATE', 0.0, float),
+    'error_status': get_env_variable('STANDIN_ERROR_STATUS', 429, int),
+    'seed': get_env_variable('STANDIN_SEED', 42, int)
+}
+
 # Configuración de Instagram específica (con variables de entorno)
 INSTAGRAM_CONFIG = {
-    'base_url': 'https://www.instagram.com',
+    # Apuntar a un servidor local (main.py standin-server) para pruebas sin red
+    'base_url': get_env_variable('INSTAGRAM_BASE_URL', 'https://www.instagram.com').rstrip('/'),
     'login_required': False,  # Se actualiza automáticamente si hay credenciales
     'max_followers_per_account': get_env_variable('MAX_FOLLOWERS_PER_ACCOUNT', 150, int),
     'scroll_pause_time': 2,
@@ -232,29 +380,37 @@ WEBHOOK_URL = get_env_variable('WEBHOOK_URL')
 # Actualizar configuración basada en credenciales disponibles
 if INSTAGRAM_USERNAME and INSTAGRAM_PASSWORD:
     INSTAGRAM_CONFIG['login_required'] = True
-    print(f"✅ Credenciales de Instagram configuradas para usuario: {INSTAGRAM_USERNAME}")
+    logger.info("Credenciales de Instagram configuradas para usuario: %s", INSTAGRAM_USERNAME)
 else:
-    print("ℹ️  No se configuraron credenciales de Instagram - modo solo datos públicos")
+    logger.info("No se configuraron credenciales de Instagram - modo solo datos públicos")
 
 # Validar configuración de proxies
 if PROXY_LIST and PROXY_LIST != ['']:
-    print(f"✅ Configurados {len(PROXY_LIST)} proxies")
+    logger.info("Configurados %d proxies", len(PROXY_LIST))
 
 # Mostrar configuración cargada (solo en modo debug)
 if DEBUG_MODE:
-    print("🔧 Configuración DEBUG activada:")
-    print(f"  - Rate limits: {RATE_LIMITS['delay_between_requests']}s entre requests")
-    print(f"  - Selenium headless: {SELENIUM_CONFIG['headless']}")
-    print(f"  - Log level: {LOGGING_CONFIG['level']}")
-    print(f"  - Auto backup: {AUTO_BACKUP}")
+    logger.debug(
+        "Configuración DEBUG activada",
+        extra={
+            'delay_between_requests': RATE_LIMITS['delay_between_requests'],
+            'selenium_headless': SELENIUM_CONFIG['headless'],
+            'log_level': LOGGING_CONFIG['level'],
+            'auto_backup': AUTO_BACKUP
+        }
+    )
     
     # Información específica del modo abuelo
     if RATE_LIMITS['conservative_mode']:
-        print("👴 MODO ABUELO ACTIVADO:")
-        print(f"  - Delay variation: ±{RATE_LIMITS['delay_variation']}s")
-        print(f"  - Account breaks: {RATE_LIMITS['account_break_minutes']} minutos")
-        print(f"  - Skip on error: {RATE_LIMITS['skip_on_error']}")
-        print(f"  - Random waits: {RATE_LIMITS['enable_random_waits']}")
+        logger.debug(
+            "Modo abuelo activado",
+            extra={
+                'delay_variation': RATE_LIMITS['delay_variation'],
+                'account_break_minutes': RATE_LIMITS['account_break_minutes'],
+                'skip_on_error': RATE_LIMITS['skip_on_error'],
+                'random_waits': RATE_LIMITS['enable_random_waits']
+            }
+        )
 
 def get_instagram_credentials():
     """
@@ -2,14 +2,66 @@
 Exportador de datos a Excel.
 """
 
+import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 from datetime import datetime
 import os
 
 from ..config.settings import OUTPUT_SETTINGS, DATA_PATHS
 from ..utils.helpers import format_timestamp, sanitize_filename
+from ..utils.timing import PhaseTimer
+from ..utils.memory_profiler import NullMemoryProfiler
+from ..utils.result_table import ResultTable
+
+
+logger = logging.getLogger(__name__)
+
+# Cadenas en memoria contigua de Arrow (mucho menos memoria que un objeto
+# Python por celda)
+STRING_DTYPE = 'string[pyarrow]'
+
+# Tipos de las columnas exportadas: se aplican al construir el DataFrame y se
+# conservan en Excel y CSV (los nulos se escriben como celdas vacías)
+EXPORT_SCHEMA = {
+    'username': STRING_DTYPE,
+    'full_name': STRING_DTYPE,
+    'bio': STRING_DTYPE,
+    'external_url': STRING_DTYPE,
+    'phone_numbers': STRING_DTYPE,
+    'posts_count': 'Int64',
+    'follower_count': 'Int64',
+    'following_count': 'Int64',
+    'is_verified': 'boolean',
+    'is_private': 'boolean',
+    'account_created_date': 'datetime64[ns]',
+    'first_post_date': 'datetime64[ns]',
+    'last_post_date': 'datetime64[ns]',
+    'extraction_timestamp': 'datetime64[ns]',
+    # Pocas cuentas de origen repetidas en todas las filas
+    'source_account': 'category'
+}
+
+# Tipos pandas de las columnas Arrow de ResultTable (las fechas y la cuenta de
+# origen ya llegan como datetime64 y category)
+ARROW_TYPES_MAPPER = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.int64(): pd.Int64Dtype(),
+    pa.bool_(): pd.BooleanDtype()
+}.get
+
+# Columnas exportadas con export_columns='basic', en este orden; con 'all' el
+# resto de campos va detrás en su orden original
+COLUMN_ORDER = [
+    'username', 'full_name', 'bio',
+    'posts_count', 'follower_count', 'following_count',
+    'extraction_timestamp', 'source_account'
+]
+
+ExportData = Union[ResultTable, Dict[str, List[Dict[str, Any]]]]
 
 
 class ExcelExporter:
@@ -17,26 +69,30 @@ class ExcelExporter:
     Exporta datos de seguidores de Instagram a formato Excel.
     """
     
-    def __init__(self, output_dir: str = None):
+    def __init__(self, output_dir: str = None, timer: PhaseTimer = None, memory_profiler=None):
         """
         Inicializa el exportador.
         
         Args:
             output_dir: Directorio de salida (opcional)
+            timer: Temporizador de fases compartido (opcional)
+            memory_profiler: Perfilador de memoria por etapa (opcional)
         """
         self.output_dir = Path(output_dir) if output_dir else Path(DATA_PATHS['output'])
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.timer = timer or PhaseTimer()
+        self.memory_profiler = memory_profiler or NullMemoryProfiler()
     
     def export_to_excel(
         self, 
-        data: Dict[str, List[Dict[str, Any]]], 
+        data: ExportData, 
         filename: str = None
     ) -> str:
         """
         Exporta datos a archivo Excel con múltiples hojas.
         
         Args:
-            data: Datos por cuenta {account: [follower_data]}
+            data: Tabla de resultados (o dict {account: [follower_data]})
             filename: Nombre del archivo (opcional)
             
         Returns:
@@ -50,18 +106,39 @@ class ExcelExporter:
         output_path = self.output_dir / filename
         
         try:
-            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-                # Crear hoja por cada cuenta
-                for account, followers_data in data.items():
-                    if not followers_data:
-                        continue
+            with self.memory_profiler.stage('excel_write'):
+                self._write_workbook(self._as_table(data), output_path)
+            
+            logger.info("Excel exportado", extra={'path': str(output_path)})
+            return str(output_path)
+            
+        except Exception as e:
+            logger.exception("Error exportando Excel a %s", output_path)
+            raise
+    
+    def _write_workbook(self, table: ResultTable, output_path: Path) -> None:
+        """
+        Escribe todas las hojas del libro Excel con openpyxl.
+        
+        Args:
+            table: Tabla de resultados
+            output_path: Ruta del archivo de salida
+        """
+        writer = pd.ExcelWriter(output_path, engine='openpyxl')
+        try:
+            # Crear hoja por cada cuenta
+            for account in table:
+                if not table.row_count(account):
+                    continue
                     
-                    sheet_name = self._create_sheet_name(account)
+                sheet_name = self._create_sheet_name(account)
                     
-                    # Convertir a DataFrame
-                    df = self._create_dataframe(followers_data)
+                # Convertir la vista Arrow de la cuenta a DataFrame
+                with self.timer.span('export_create_dataframe'), self.memory_profiler.stage('create_dataframe'):
+                    df = self._table_dataframe(table, account)
                     
-                    # Escribir a Excel
+                # Escribir a Excel
+                with self.timer.span('export_excel_write_sheet'):
                     df.to_excel(
                         writer, 
                         sheet_name=sheet_name,
@@ -69,25 +146,40 @@ class ExcelExporter:
                         freeze_panes=(1, 0)  # Congelar primera fila
                     )
                     
-                    # Formatear hoja
+                # Formatear hoja
+                with self.timer.span('export_excel_format'):
                     self._format_worksheet(writer.book[sheet_name], df)
                 
-                # Crear hoja de resumen
-                summary_df = self._create_summary_dataframe(data)
+            # Crear hoja de resumen (agregados vectorizados sobre las columnas Arrow)
+            with self.timer.span('export_excel_summary'):
+                summary_df = self._create_summary_dataframe(table)
                 summary_df.to_excel(writer, sheet_name='Resumen', index=False)
                 self._format_summary_worksheet(writer.book['Resumen'], summary_df)
                 
-                # Crear hoja de metadatos
-                if OUTPUT_SETTINGS['include_metadata']:
-                    metadata_df = self._create_metadata_dataframe(data)
+            # Crear hoja de metadatos
+            if OUTPUT_SETTINGS['include_metadata']:
+                with self.timer.span('export_excel_metadata'):
+                    metadata_df = self._create_metadata_dataframe(table)
                     metadata_df.to_excel(writer, sheet_name='Metadatos', index=False)
+        finally:
+            # Guardar el libro (openpyxl serializa todo al cerrar)
+            with self.timer.span('export_excel_save'):
+                writer.close()
+    
+    @staticmethod
+    def _as_table(data: ExportData) -> ResultTable:
+        """
+        Devuelve la tabla de resultados (convierte el dict por cuenta si hace falta).
+        
+        Args:
+            data: Tabla de resultados o dict {account: [follower_data]}
             
-            return str(output_path)
-            
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            raise
+        Returns:
+            Tabla de resultados
+        """
+        if isinstance(data, ResultTable):
+            return data
+        return ResultTable.from_dict(data)
     
     def _create_sheet_name(self, account: str) -> str:
         """
@@ -112,51 +204,75 @@ class ExcelExporter:
             
         return sheet_name
     
-    def _create_dataframe(self, followers_data: List[Dict[str, Any]]) -> pd.DataFrame:
+    def _table_dataframe(self, table: ResultTable, account: str) -> pd.DataFrame:
         """
-        Convierte datos de seguidores a DataFrame.
+        Convierte la vista Arrow de una cuenta a DataFrame con los tipos de EXPORT_SCHEMA.
         
         Args:
-            followers_data: Lista de datos de seguidores
+            table: Tabla de resultados
+            account: Cuenta a convertir
             
         Returns:
             DataFrame con datos formateados
         """
-        if not followers_data:
-            return pd.DataFrame()
-        
-        # Normalizar datos para DataFrame
-        normalized_data = []
-        for follower in followers_data:
-            normalized_follower = {}
-            
-            for key, value in follower.items():
-                if isinstance(value, list):
-                    # Convertir listas a strings separados por "; "
-                    normalized_follower[key] = "; ".join(str(v) for v in value) if value else ""
-                elif value is None:
-                    normalized_follower[key] = ""
-                else:
-                    normalized_follower[key] = value
-            
-            normalized_data.append(normalized_follower)
-        
-        df = pd.DataFrame(normalized_data)
+        view = table.for_account(account)
+        if OUTPUT_SETTINGS['export_columns'] == 'all':
+            # Listas de teléfonos a "; " en Arrow (las vacías ya son nulas)
+            column = view.schema.get_field_index('phone_numbers')
+            view = view.set_column(column, 'phone_numbers', pc.binary_join(view['phone_numbers'], '; '))
+        else:
+            # Solo las columnas exportadas (el resto no se convierte a pandas)
+            view = view.select(COLUMN_ORDER)
         
-        # Reordenar columnas según importancia
-        column_order = [
-            'username', 'full_name', 'bio', 
-            'posts_count', 'follower_count', 'following_count',
-            'extraction_timestamp', 'source_account'
-        ]
+        df = view.to_pandas(types_mapper=ARROW_TYPES_MAPPER)
+        return self._reorder_columns(self._apply_schema(df))
+    
+    @staticmethod
+    def _reorder_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reordena las columnas según importancia (COLUMN_ORDER).
         
+        Args:
+            df: DataFrame de una cuenta
+            
+        Returns:
+            DataFrame con las columnas reordenadas (solo las de COLUMN_ORDER
+            salvo con export_columns='all')
+        """
         # Mantener solo columnas que existen
-        existing_columns = [col for col in column_order if col in df.columns]
-        remaining_columns = [col for col in df.columns if col not in existing_columns]
+        existing_columns = [col for col in COLUMN_ORDER if col in df.columns]
+        remaining_columns = []
+        if OUTPUT_SETTINGS['export_columns'] == 'all':
+            remaining_columns = [col for col in df.columns if col not in existing_columns]
         
-        final_order = existing_columns + remaining_columns
-        df = df[final_order]
+        return df[existing_columns + remaining_columns]
+    
+    @staticmethod
+    def _apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convierte las columnas conocidas a los tipos de EXPORT_SCHEMA.
         
+        Args:
+            df: DataFrame con columnas object (o ya tipadas desde Arrow)
+            
+        Returns:
+            El mismo DataFrame con tipos compactos (valores no válidos = nulo)
+        """
+        for column, dtype in EXPORT_SCHEMA.items():
+            if column not in df.columns:
+                continue
+            values = df[column]
+            if dtype != STRING_DTYPE and values.dtype == dtype:
+                # Columna Arrow ya tipada: sin conversión
+                continue
+            if dtype == 'Int64':
+                df[column] = pd.to_numeric(values.replace('', None), errors='coerce').astype(dtype)
+            elif dtype.startswith('datetime64'):
+                df[column] = pd.to_datetime(values.replace('', None), errors='coerce', format='ISO8601').astype(dtype)
+            elif dtype == STRING_DTYPE:
+                df[column] = values.astype(dtype).replace('', pd.NA)
+            else:
+                df[column] = values.astype(dtype)
         return df
     
     def _format_worksheet(self, worksheet, df: pd.DataFrame) -> None:
@@ -198,39 +314,50 @@ class ExcelExporter:
         if len(df) > 0:
             worksheet.auto_filter.ref = f"A1:{get_column_letter(len(df.columns))}{len(df) + 1}"
     
-    def _create_summary_dataframe(self, data: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+    def _create_summary_dataframe(self, data: ExportData) -> pd.DataFrame:
         """
         Crea DataFrame de resumen.
         
         Args:
-            data: Datos completos por cuenta
+            data: Tabla de resultados (o dict por cuenta)
             
         Returns:
             DataFrame con resumen por cuenta
         """
-        summary_data = []
-        
-        for account, followers_data in data.items():
-            if not followers_data:
-                continue
-                
-            # Calcular estadísticas
-            total_followers = len(followers_data)
-            with_phone = sum(1 for f in followers_data if f.get('phone_numbers'))
-            verified_count = sum(1 for f in followers_data if f.get('is_verified'))
-            private_count = sum(1 for f in followers_data if f.get('is_private'))
-            
-            summary_data.append({
-                'Cuenta': f"@{account}",
-                'Total_Seguidores_Extraídos': total_followers,
-                'Con_Teléfono': with_phone,
-                'Verificados': verified_count,
-                'Privados': private_count,
-                'Porcentaje_Teléfono': f"{(with_phone/total_followers)*100:.1f}%" if total_followers > 0 else "0%"
-            })
+        table = self._as_table(data)
+        summary_data = [
+            self._create_summary_row(account, table.account_stats(account))
+            for account in table
+            if table.row_count(account)
+        ]
         
         return pd.DataFrame(summary_data)
     
+    def _create_summary_row(self, account: str, stats: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Construye la fila de resumen de una cuenta.
+        
+        Args:
+            account: Nombre de la cuenta
+            stats: Agregados de la cuenta (de ResultTable.account_stats)
+            
+        Returns:
+            Fila del resumen
+        """
+        total_followers = stats['rows']
+        with_phone = stats['with_phone']
+        verified_count = stats['verified']
+        private_count = stats['private']
+        
+        return {
+            'Cuenta': f"@{account}",
+            'Total_Seguidores_Extraídos': total_followers,
+            'Con_Teléfono': with_phone,
+            'Verificados': verified_count,
+            'Privados': private_count,
+            'Porcentaje_Teléfono': f"{(with_phone/total_followers)*100:.1f}%" if total_followers > 0 else "0%"
+        }
+    
     def _format_summary_worksheet(self, worksheet, df: pd.DataFrame) -> None:
         """
         Aplica formato especial a hoja de resumen.
@@ -257,20 +384,20 @@ class ExcelExporter:
             column_letter = get_column_letter(col_num)
             worksheet.column_dimensions[column_letter].width = 20
     
-    def _create_metadata_dataframe(self, data: Dict[str, List[Dict[str, Any]]]) -> pd.DataFrame:
+    def _create_metadata_dataframe(self, table: ResultTable) -> pd.DataFrame:
         """
         Crea DataFrame con metadatos de extracción.
         
         Args:
-            data: Datos completos
+            table: Tabla de resultados
             
         Returns:
             DataFrame con metadatos
         """
         metadata = [
             {'Campo': 'Fecha_Extracción', 'Valor': datetime.now().strftime(OUTPUT_SETTINGS['datetime_format'])},
-            {'Campo': 'Total_Cuentas_Procesadas', 'Valor': len(data)},
-            {'Campo': 'Total_Seguidores_Extraídos', 'Valor': sum(len(followers) for followers in data.values())},
+            {'Campo': 'Total_Cuentas_Procesadas', 'Valor': len(table.accounts)},
+            {'Campo': 'Total_Seguidores_Extraídos', 'Valor': len(table)},
             {'Campo': 'Formato_Fecha', 'Valor': OUTPUT_SETTINGS['date_format']},
             {'Campo': 'Versión_Extractor', 'Valor': '1.0.0'},
             {'Campo': 'Cumplimiento_GDPR', 'Valor': 'Solo datos públicos'},
@@ -281,14 +408,14 @@ class ExcelExporter:
     
     def export_to_csv(
         self, 
-        data: Dict[str, List[Dict[str, Any]]], 
+        data: ExportData, 
         output_dir: str = None
     ) -> List[str]:
         """
         Exporta datos a archivos CSV separados por cuenta.
         
         Args:
-            data: Datos por cuenta
+            data: Tabla de resultados (o dict por cuenta)
             output_dir: Directorio de salida
             
         Returns:
@@ -302,17 +429,21 @@ class ExcelExporter:
         
         csv_files = []
         timestamp = format_timestamp()
+        table = self._as_table(data)
         
-        for account, followers_data in data.items():
-            if not followers_data:
+        for account in table:
+            if not table.row_count(account):
                 continue
             
             filename = f"seguidores_{account}_{timestamp}.csv"
             csv_path = output_dir / filename
             
-            df = self._create_dataframe(followers_data)
-            df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+            with self.timer.span('export_create_dataframe'), self.memory_profiler.stage('create_dataframe'):
+                df = self._table_dataframe(table, account)
+            with self.timer.span('export_csv_write'), self.memory_profiler.stage('csv_write'):
+                df.to_csv(csv_path, index=False, encoding='utf-8-sig', date_format=OUTPUT_SETTINGS['datetime_format'])
             
             csv_files.append(str(csv_path))
+            logger.info("CSV exportado", extra={'path': str(csv_path), 'rows': len(df)})
         
         return csv_files 
\ No newline at end of file
@@ -8,17 +8,43 @@ from datetime import datetime
 import time
 import random
 
+from ..utils.timing import PhaseTimer
+from ..utils.memory_profiler import NullMemoryProfiler
+from ..utils.metrics import MetricsRegistry
+from ..utils.profile_record import ProfileRecord
 
-class BaseExtractor(ABC):
+
+class BaseProfileExtractor(ABC):
     """
-    Clase base abstracta para extractores de redes sociales.
+    Clase base abstracta para extractores de datos de perfil.
+
+    Los que solo descargan perfiles (p. ej. por HTTP) heredan de aquí; los
+    que además obtienen la lista de seguidores heredan de BaseExtractor.
     """
     
-    def __init__(self):
-        """Inicializa el extractor base."""
+    # Valor de los contadores no encontrados en el perfil (None = desconocido)
+    MISSING_COUNT = None
+    
+    def __init__(
+        self,
+        timer: Optional[PhaseTimer] = None,
+        memory_profiler=None,
+        metrics: Optional[MetricsRegistry] = None
+    ):
+        """
+        Inicializa el extractor base.
+        
+        Args:
+            timer: Temporizador de fases compartido (opcional)
+            memory_profiler: Perfilador de memoria por etapa (opcional)
+            metrics: Registro de métricas compartido (opcional)
+        """
         self.requests_made = 0
         self.start_time = datetime.now()
         self.last_request_time = None
+        self.timer = timer or PhaseTimer()
+        self.memory_profiler = memory_profiler or NullMemoryProfiler()
+        self.metrics = metrics or MetricsRegistry()
         
     def __enter__(self):
         """Context manager entry."""
@@ -39,19 +65,6 @@ class BaseExtractor(ABC):
         """Limpieza de recursos."""
         pass
         
-    @abstractmethod
-    def extract_followers(self, username: str) -> List[str]:
-        """
-        Extrae la lista de seguidores de una cuenta.
-        
-        Args:
-            username: Username de la cuenta
-            
-        Returns:
-            Lista de usernames de seguidores
-        """
-        pass
-        
     @abstractmethod
     def extract_profile_data(self, username: str) -> Dict[str, Any]:
         """
@@ -65,7 +78,7 @@ class BaseExtractor(ABC):
         """
         pass
     
-    def create_profile_template(self, username: str, source_account: str) -> Dict[str, Any]:
+    def create_profile_template(self, username: str, source_account: str) -> ProfileRecord:
         """
         Crea un template básico de datos de perfil.
         
@@ -74,25 +87,15 @@ class BaseExtractor(ABC):
             source_account: Cuenta de origen
             
         Returns:
-            Diccionario con template de datos
-        """
-        return {
-            'username': username,
-            'full_name': '',
-            'phone_numbers': [],
-            'account_created_date': None,
-            'first_post_date': None,
-            'last_post_date': None,
-            'follower_count': None,
-            'following_count': None,
-            'posts_count': None,
-            'is_verified': False,
-            'is_private': False,
-            'bio': '',
-            'external_url': '',
-            'extraction_timestamp': datetime.now().isoformat(),
-            'source_account': source_account
-        }
+            Registro compacto con acceso tipo diccionario
+        """
+        return ProfileRecord(
+            username,
+            source_account,
+            follower_count=self.MISSING_COUNT,
+            following_count=self.MISSING_COUNT,
+            posts_count=self.MISSING_COUNT
+        )
     
     def apply_rate_limiting(self, delay_config: Dict[str, float]) -> None:
         """
@@ -111,6 +114,10 @@ class BaseExtractor(ABC):
                 sleep_time = min(sleep_time, max_delay)
                 time.sleep(sleep_time)
         
+        self.record_request()
+    
+    def record_request(self) -> None:
+        """Registra un request (o navegación) realizado contra la plataforma."""
         self.last_request_time = datetime.now()
         self.requests_made += 1
     
@@ -126,7 +133,8 @@ class BaseExtractor(ABC):
         return {
             'requests_made': self.requests_made,
             'elapsed_time': f"{elapsed:.1f}s",
-            'avg_requests_per_minute': (self.requests_made / elapsed * 60) if elapsed > 0 else 0
+            'avg_requests_per_minute': (self.requests_made / elapsed * 60) if elapsed > 0 else 0,
+            'phases': self.timer.summary()
         }
     
     def wait_for_rate_limit_reset(self, minutes: int = 15) -> None:
@@ -168,6 +176,8 @@ class BaseExtractor(ABC):
                 if attempt == max_retries:
                     return None
                 
+                self.metrics.inc('retries', help_text='Reintentos realizados', reason='backoff')
+                
                 delay = base_delay * (backoff_factor ** attempt)
                 delay += random.uniform(0, delay * 0.1)  # Jitter
                 
@@ -183,4 +193,23 @@ class BaseExtractor(ABC):
             error: Error de autenticación
         """
         extra_wait = 10 * 60  # 10 minutos extra
-        time.sleep(extra_wait) 
\ No newline at end of file
+        time.sleep(extra_wait) 
+
+
+class BaseExtractor(BaseProfileExtractor):
+    """
+    Clase base abstracta para extractores de redes sociales (seguidores y perfiles).
+    """
+    
+    @abstractmethod
+    def extract_followers(self, username: str) -> List[str]:
+        """
+        Extrae la lista de seguidores de una cuenta.
+        
+        Args:
+            username: Username de la cuenta
+            
+        Returns:
+            Lista de usernames de seguidores
+        """
+        pass
@@ -0,0 +1,199 @@
+"""
+Extractor de perfiles por HTTP sin navegador.
+
+Descarga el HTML de cada perfil con una sesión requests (conexiones
+keep-alive reutilizadas) y lo parsea con profile_parser, el mismo parser
+del extractor con Selenium. El navegador solo hace falta para el diálogo
+de seguidores: las cookies de su sesión se importan aquí.
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .base_extractor import BaseProfileExtractor
+from . import profile_parser
+from ..config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class HttpProfileExtractor(BaseProfileExtractor):
+    """
+    Extractor de datos de perfil mediante peticiones HTTP condicionales.
+    """
+
+    # Mismos valores por defecto que los perfiles obtenidos con el navegador
+    MISSING_COUNT = 0
+
+    def __init__(self, timer=None, memory_profiler=None, metrics=None, base_url: str = None):
+        """
+        Inicializa el extractor HTTP.
+
+        Args:
+            timer: Temporizador de fases compartido (opcional)
+            memory_profiler: Perfilador de memoria por etapa (opcional)
+            metrics: Registro de métricas compartido (opcional)
+            base_url: URL base de Instagram (default: INSTAGRAM_CONFIG['base_url'])
+        """
+        super().__init__(timer, memory_profiler, metrics)
+        self.base_url = (base_url or settings.INSTAGRAM_CONFIG['base_url']).rstrip('/')
+        self.session = None
+        # Validadores por URL: {url: {'etag', 'last_modified', 'data'}}
+        self.validators = {}
+        self.validators_path = Path(settings.HTTP_FETCH_CONFIG['validators_file'])
+        self.last_metadata_found = False
+
+    def setup(self) -> None:
+        """Crea la sesión HTTP con pool de conexiones y carga los validadores guardados."""
+        config = settings.HTTP_FETCH_CONFIG
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=config['pool_size'], pool_maxsize=config['pool_size'])
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': config['user_agent'],
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Language': config['accept_language']
+        })
+        self._load_validators()
+
+    def cleanup(self) -> None:
+        """Cierra la sesión HTTP y guarda los validadores para la próxima ejecución."""
+        self._save_validators()
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def import_cookies(self, cookies: List[Dict[str, Any]]) -> int:
+        """
+        Copia las cookies de la sesión de Selenium (driver.get_cookies()).
+
+        Args:
+            cookies: Cookies en el formato de WebDriver
+
+        Returns:
+            Número de cookies importadas
+        """
+        for cookie in cookies:
+            self.session.cookies.set(
+                cookie['name'],
+                cookie['value'],
+                domain=cookie.get('domain', ''),
+                path=cookie.get('path', '/')
+            )
+        logger.debug("Cookies importadas del navegador", extra={'cookies': len(cookies)})
+        return len(cookies)
+
+    def _load_validators(self) -> None:
+        """Carga los ETag/Last-Modified guardados (se ignora un archivo corrupto)."""
+        try:
+            self.validators = json.loads(self.validators_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.validators = {}
+
+    def _save_validators(self) -> None:
+        """Guarda los ETag/Last-Modified de los perfiles descargados."""
+        if not self.validators:
+            return
+        try:
+            self.validators_path.parent.mkdir(parents=True, exist_ok=True)
+            self.validators_path.write_text(json.dumps(self.validators, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            logger.debug("No se pudieron guardar los validadores HTTP: %s", e)
+
+    def _get(self, url: str) -> Optional[requests.Response]:
+        """
+        GET condicional con rate limiting y espera ante 429.
+
+        Args:
+            url: URL del perfil
+
+        Returns:
+            Respuesta (200, 304 u otro código) o None si se agotaron los reintentos
+        """
+        config = settings.HTTP_FETCH_CONFIG
+        cached = self.validators.get(url, {})
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+
+        for attempt in range(config['max_retries'] + 1):
+            self.apply_rate_limiting(config['delay'])
+            try:
+                response = self.session.get(url, headers=headers, timeout=config['timeout'])
+            except requests.RequestException as e:
+                logger.debug("Error de red en %s: %s", url, e)
+                self.metrics.inc('retries', help_text='Reintentos realizados', reason='http_error')
+                continue
+
+            if response.status_code != 429:
+                return response
+
+            # Respetar Retry-After (acotado) antes de reintentar
+            self.metrics.inc('retries', help_text='Reintentos realizados', reason='http_429')
+            try:
+                retry_after = int(response.headers.get('Retry-After', config['delay']['max']))
+            except ValueError:
+                retry_after = config['delay']['max']
+            wait = min(retry_after, config['max_retry_after'])
+            logger.warning("Rate limit (429) en %s; reintento en %ss", url, wait, extra={'attempt': attempt + 1})
+            with self.timer.span('rate_limit_wait'):
+                time.sleep(wait)
+
+        return None
+
+    def fetch_profile(self, username: str, source_account: str = "") -> Dict[str, Any]:
+        """
+        Descarga y parsea el perfil de un usuario.
+
+        Si el servidor responde 304 se reutilizan los contadores de la
+        descarga anterior sin transferir ni parsear la página.
+
+        Args:
+            username: Username del perfil
+            source_account: Cuenta de origen
+
+        Returns:
+            Diccionario con datos del perfil
+        """
+        profile_data = self.create_profile_template(username, source_account)
+        url = f"{self.base_url}/{username}/"
+        self.last_metadata_found = False
+
+        with self.timer.span('profile_fetch'):
+            response = self._get(url)
+        if response is None:
+            return profile_data
+
+        if response.status_code == 304 and url in self.validators:
+            self.metrics.inc('http_not_modified', help_text='Perfiles sin cambios (HTTP 304)')
+            counts = self.validators[url]['data']
+        elif response.status_code == 200:
+            with self.timer.span('parsing'):
+                counts = profile_parser.parse_profile_html(response.text)
+            if response.headers.get('ETag') or response.headers.get('Last-Modified'):
+                self.validators[url] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'data': counts
+                }
+        else:
+            logger.debug("Respuesta %s para @%s", response.status_code, username)
+            return profile_data
+
+        self.last_metadata_found = bool(counts)
+        profile_data.update(counts)
+        return profile_data
+
+    def extract_profile_data(self, username: str) -> Dict[str, Any]:
+        """Implementación del método abstracto."""
+        return self.fetch_profile(username)
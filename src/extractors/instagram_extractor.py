@@ -4,10 +4,15 @@ Instagram extractor usando Selenium en modo interactivo.
 
 import time
 import random
+import logging
 import concurrent.futures
-from typing import List, Dict, Any
+from datetime import datetime
+from contextlib import nullcontext
+from typing import List, Dict, Any, Optional
+from urllib.parse import urlsplit
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -19,7 +24,73 @@ from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 
 from .base_extractor import BaseExtractor
+from . import profile_parser
 from ..config import settings
+from ..utils import browser_daemon
+from ..utils.browser_profile import get_browser_profile
+from ..utils.memory_watchdog import DriverMemoryWatchdog
+from ..utils.tab_pool import TabPool
+from ..utils.snapshot_store import SnapshotStore
+from ..utils.selector_registry import SelectorRegistry
+from ..utils.result_table import ResultTable
+
+
+logger = logging.getLogger(__name__)
+
+# Lee el meta tag og:description en un solo round-trip (null si aún no existe o si
+# la pestaña todavía muestra otra ruta que la esperada en arguments[0])
+OG_DESCRIPTION_SCRIPT = (
+    "if (arguments[0] && window.location.pathname.indexOf(arguments[0]) !== 0) { return null; }"
+    "var meta = document.querySelector('meta[property=\"og:description\"]');"
+    "return meta ? meta.getAttribute('content') : null;"
+)
+
+# Igual que OG_DESCRIPTION_SCRIPT pero devuelve el <head> completo para
+# parsearlo fuera del hilo del navegador (pool de procesos)
+HEAD_WHEN_READY_SCRIPT = (
+    "if (arguments[0] && window.location.pathname.indexOf(arguments[0]) !== 0) { return null; }"
+    "if (!document.querySelector('meta[property=\"og:description\"]')) { return null; }"
+    "return document.head.outerHTML;"
+)
+
+PAGE_LOAD_STRATEGIES = ('normal', 'eager', 'none')
+
+# HTML capturado para el almacén de snapshots según SNAPSHOT_CONFIG['mode']
+SNAPSHOT_SCRIPTS = {
+    'head': "return document.head ? document.head.outerHTML : null;",
+    'full': "return document.documentElement.outerHTML;"
+}
+
+# Selectores alternativos por defecto; SelectorRegistry los reordena según
+# cuál ha funcionado en ejecuciones anteriores
+FOLLOWER_MODAL_SELECTORS = (
+    '[role="dialog"] a[href*="/"]',  # Enlaces en el modal
+    '[role="dialog"] [role="button"]',  # Botones en el modal
+    'div[style*="transform"] a',  # Área scrolleable
+    '._aano a'  # Selector específico de Instagram
+)
+
+POPUP_XPATHS = (
+    "//button[contains(text(), 'Ahora no')]",
+    "//button[contains(text(), 'Not Now')]",
+    "//button[contains(text(), 'Dismiss')]",
+    "//button[@aria-label='Close']",
+    "//*[contains(text(), 'Ahora no')]",
+    "//*[contains(text(), 'Not Now')]"
+)
+
+# Cuenta recursos servidos desde caché (transferSize 0 con cuerpo) vía Resource Timing
+CACHE_STATS_SCRIPT = (
+    "var entries = performance.getEntriesByType('navigation')"
+    ".concat(performance.getEntriesByType('resource'));"
+    "var hits = 0, total = 0, bytes = 0;"
+    "entries.forEach(function (e) {"
+    "  if (!e.decodedBodySize) { return; }"
+    "  total += 1; bytes += e.transferSize;"
+    "  if (e.transferSize === 0) { hits += 1; }"
+    "});"
+    "return [hits, total, bytes];"
+)
 
 
 class InstagramExtractor(BaseExtractor):
@@ -27,42 +98,115 @@ class InstagramExtractor(BaseExtractor):
     Extractor de datos de Instagram usando Selenium en modo interactivo.
     """
     
-    def __init__(self):
-        super().__init__()
+    # Contadores no encontrados a 0, como en la exportación original
+    MISSING_COUNT = 0
+    
+    def __init__(self, timer=None, command_recorder=None, memory_profiler=None, metrics=None, driver_factory=None, profile_fetcher=None):
+        super().__init__(timer, memory_profiler, metrics)
+        self.command_recorder = command_recorder
+        # Callable sin argumentos que crea el driver (ej: FakeWebDriver en benchmarks)
+        self.driver_factory = driver_factory
+        # HttpProfileExtractor ya configurado para descargar los perfiles sin navegador (opcional)
+        self.profile_fetcher = profile_fetcher
         self.selenium_driver = None
         self.is_logged_in = False
         self.login_username = None
+        self.attached_to_daemon = False
+        self.browser_profile = get_browser_profile()
+        self.cache_stats = {'hits': 0, 'requests': 0, 'bytes_transferred': 0}
+        self.memory_watchdog = DriverMemoryWatchdog()
+        self.tab_pool = None
+        self.last_metadata_found = False
+        self.profiles_processed = 0
+        self.snapshot_store = SnapshotStore() if settings.SNAPSHOT_CONFIG['enabled'] else None
+        self.selector_registry = SelectorRegistry()
+        # Pool de procesos para parsear el HTML de los perfiles (None = parseo en el hilo del navegador)
+        self.parse_pool = None
+        self.pending_parses = []
     
     def setup(self) -> None:
         """Configura el extractor de Instagram con autenticación interactiva opcional."""
         try:
             self._setup_driver()
+            self._instrument_driver()
+            self._setup_parse_pool()
             
-            # Intentar login interactivo con Selenium
-            if settings.is_login_enabled():
-                login_success = self._attempt_login_interactive()
+            # Intentar login interactivo con Selenium (salvo que el navegador
+            # persistente ya conserve una sesión activa)
+            if self.attached_to_daemon and self._has_active_session():
+                self.is_logged_in = True
+                self.login_username = settings.get_instagram_credentials()[0]
+                logger.info("Sesión de Instagram reutilizada del navegador persistente")
+            elif settings.is_login_enabled():
+                with self.timer.span('login'):
+                    login_success = self._attempt_login_interactive()
                 if login_success:
-                    pass
+                    logger.info("Login completado", extra={'login_username': self.login_username})
                 else:
-                    pass
+                    logger.warning("Login no completado - se continúa con datos públicos")
             else:
-                pass
+                logger.info("Sin credenciales - modo solo datos públicos")
+            
+            # Las peticiones HTTP usan la sesión del navegador
+            if self.profile_fetcher is not None:
+                self.profile_fetcher.import_cookies(self.selenium_driver.get_cookies())
             
         except Exception as e:
+            logger.exception("Error configurando el extractor de Instagram")
             raise
     
     def cleanup(self) -> None:
         """Limpia recursos de Selenium."""
+        try:
+            self.selector_registry.save()
+        except OSError as e:
+            logger.debug("No se pudo guardar el ranking de selectores: %s", e)
+        
+        if self.parse_pool is not None:
+            self.parse_pool.shutdown(cancel_futures=True)
+            self.parse_pool = None
+            self.pending_parses = []
+        
         try:
             if self.selenium_driver:
-                self.selenium_driver.quit()
+                if self.attached_to_daemon:
+                    # Solo se detiene el driver; el navegador persistente sigue abierto
+                    self.selenium_driver.service.stop()
+                else:
+                    self.selenium_driver.quit()
                 self.selenium_driver = None
                 
         except Exception as e:
-            pass
+            logger.debug("Error cerrando el driver: %s", e)
     
     def _setup_driver(self):
         """Configura el driver de Selenium con opciones optimizadas para modo interactivo."""
+        if self.driver_factory is not None:
+            self.selenium_driver = self.driver_factory()
+            self.selenium_driver.implicitly_wait(settings.SELENIUM_CONFIG['implicit_wait'])
+            self.selenium_driver.set_page_load_timeout(settings.SELENIUM_CONFIG['page_load_timeout'])
+            return
+        
+        if settings.BROWSER_DAEMON_CONFIG['enabled']:
+            try:
+                self.selenium_driver = self._attach_to_daemon()
+                self.attached_to_daemon = True
+                self.selenium_driver.implicitly_wait(settings.SELENIUM_CONFIG['implicit_wait'])
+                self.selenium_driver.set_page_load_timeout(settings.SELENIUM_CONFIG['page_load_timeout'])
+                return
+            except Exception as e:
+                # Fallback a un navegador nuevo para esta ejecución
+                logger.warning("No se pudo conectar al navegador persistente: %s", e)
+                self.attached_to_daemon = False
+        
+        # Preparar perfil persistente (recorta la caché si excede el límite)
+        if self.browser_profile:
+            try:
+                self.browser_profile.prepare()
+            except Exception as e:
+                logger.warning("Perfil persistente no disponible, se usa uno temporal: %s", e)
+                self.browser_profile = None
+        
         try:
             # Detectar navegador y configurar según lo detectado
             detected_browser = settings.SELENIUM_CONFIG.get('detected_browser', 'chrome')
@@ -78,13 +222,140 @@ class InstagramExtractor(BaseExtractor):
             # Configuración común para todos los navegadores
             self.selenium_driver.implicitly_wait(settings.SELENIUM_CONFIG['implicit_wait'])
             self.selenium_driver.set_page_load_timeout(settings.SELENIUM_CONFIG['page_load_timeout'])
+            logger.info("Navegador iniciado", extra={'browser': detected_browser})
                 
         except Exception as e:
-            # Fallback a Chrome básico en modo interactivo
+            # Fallback a Chrome básico en modo interactivo (con perfil temporal:
+            # el persistente puede ser la causa del fallo, p. ej. si está bloqueado)
+            logger.warning("Error iniciando %s, usando Chrome básico: %s", detected_browser, e)
+            self.browser_profile = None
             self.selenium_driver = self._setup_chrome_driver_interactive({})
             self.selenium_driver.implicitly_wait(settings.SELENIUM_CONFIG['implicit_wait'])
             self.selenium_driver.set_page_load_timeout(settings.SELENIUM_CONFIG['page_load_timeout'])
     
+    def _attach_to_daemon(self):
+        """
+        Conecta Selenium al navegador persistente, arrancándolo si no existe.
+        
+        Returns:
+            Driver conectado vía debuggerAddress
+        """
+        state = browser_daemon.start_daemon()
+        
+        if state['browser'] == 'edge':
+            options = EdgeOptions()
+            options.add_experimental_option('debuggerAddress', state['debugger_address'])
+            options.page_load_strategy = self._get_page_load_strategy()
+            with self.timer.span('driver_resolution'):
+                service = EdgeService(EdgeChromiumDriverManager().install())
+            with self.timer.span('browser_launch'):
+                driver = webdriver.Edge(service=service, options=options)
+        else:
+            options = ChromeOptions()
+            options.add_experimental_option('debuggerAddress', state['debugger_address'])
+            options.page_load_strategy = self._get_page_load_strategy()
+            with self.timer.span('driver_resolution'):
+                service = ChromeService(ChromeDriverManager().install())
+            with self.timer.span('browser_launch'):
+                driver = webdriver.Chrome(service=service, options=options)
+        
+        # Reutilizar siempre la primera pestaña del navegador persistente
+        driver.switch_to.window(driver.window_handles[0])
+        
+        return driver
+    
+    def _instrument_driver(self) -> None:
+        """Activa la contabilidad de comandos WebDriver si está configurada."""
+        if self.command_recorder is not None:
+            self.command_recorder.owner = self
+            self.command_recorder.instrument(self.selenium_driver)
+    
+    def _profile_scope(self, username: str):
+        """Atribuye los comandos WebDriver del bloque a un perfil."""
+        if self.command_recorder is None:
+            return nullcontext()
+        return self.command_recorder.profile(username)
+    
+    def _get_browser_pid(self):
+        """Obtiene el PID raíz del árbol de procesos del navegador."""
+        try:
+            if self.attached_to_daemon:
+                state = browser_daemon.read_state()
+                return state['pid'] if state else None
+            return self.selenium_driver.service.process.pid
+        except Exception:
+            return None
+    
+    def _recycle_driver(self, reason: str) -> None:
+        """
+        Reinicia el navegador para liberar memoria y restaura la sesión.
+        
+        Args:
+            reason: Motivo del reciclaje
+        """
+        logger.info(
+            "Reciclando navegador",
+            extra={'reason': reason, 'navigations': self.memory_watchdog.navigations, 'rss_bytes': self.memory_watchdog.last_rss}
+        )
+        was_attached = self.attached_to_daemon
+        # cleanup() cierra también el pool de parseo: antes se recogen sus resultados
+        self._collect_parses()
+        self.cleanup()
+        
+        # El navegador persistente también se reinicia para recuperar su memoria
+        if was_attached:
+            browser_daemon.stop_daemon()
+        
+        self._setup_driver()
+        self._instrument_driver()
+        self._setup_parse_pool()
+        self.memory_watchdog.reset(reason)
+        self.metrics.inc('driver_recycles', help_text='Reinicios del navegador', reason=reason)
+        
+        if self.tab_pool:
+            self.tab_pool.attach(self.selenium_driver)
+        
+        # Con perfil persistente las cookies sobreviven; solo se repite el login si se perdió
+        if self.is_logged_in and not self._has_active_session():
+            self.is_logged_in = False
+            with self.timer.span('login'):
+                self._attempt_login_interactive()
+    
+    def _check_driver_health(self) -> None:
+        """Recicla el driver si el watchdog lo indica."""
+        reason = self.memory_watchdog.should_recycle(self._get_browser_pid())
+        if reason:
+            self._recycle_driver(reason)
+    
+    @staticmethod
+    def _instagram_url(path: str = '') -> str:
+        """
+        Construye una URL de Instagram a partir de INSTAGRAM_CONFIG['base_url'].
+        
+        Args:
+            path: Ruta relativa (ej: 'usuario/')
+            
+        Returns:
+            URL absoluta
+        """
+        return f"{settings.INSTAGRAM_CONFIG['base_url']}/{path}"
+    
+    @staticmethod
+    def _is_instagram_url(url: str) -> bool:
+        """Indica si la URL pertenece al host configurado en base_url."""
+        base_host = urlsplit(settings.INSTAGRAM_CONFIG['base_url']).netloc
+        return bool(url) and base_host.replace('www.', '', 1) in urlsplit(url).netloc
+    
+    def _has_active_session(self) -> bool:
+        """Verifica si el navegador ya tiene una sesión de Instagram iniciada."""
+        try:
+            if not self._is_instagram_url(self.selenium_driver.current_url):
+                self.selenium_driver.get(self._instagram_url())
+                self.record_request()
+            return self.selenium_driver.get_cookie('sessionid') is not None
+        except Exception:
+            return False
+    
     def _setup_edge_driver_interactive(self, browser_config):
         """Configura Microsoft Edge en modo interactivo (visible)."""
         options = EdgeOptions()
@@ -107,6 +378,11 @@ class InstagramExtractor(BaseExtractor):
         options.add_argument('--window-size=1400,1000')
         options.add_argument('--start-maximized')
         
+        # Perfil persistente con caché HTTP limitada
+        if self.browser_profile:
+            for argument in self.browser_profile.chromium_arguments():
+                options.add_argument(argument)
+        
         # User agent real de tu sistema
         user_agent = f"Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36 Edg/{settings.SELENIUM_CONFIG.get('detected_version', '136.0.3240.92')}"
         options.add_argument(f'--user-agent={user_agent}')
@@ -121,10 +397,13 @@ class InstagramExtractor(BaseExtractor):
         options.add_experimental_option('prefs', prefs)
         options.add_experimental_option('excludeSwitches', ['enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
+        options.page_load_strategy = self._get_page_load_strategy()
         
         # Configurar servicio
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        driver = webdriver.Edge(service=service, options=options)
+        with self.timer.span('driver_resolution'):
+            service = EdgeService(EdgeChromiumDriverManager().install())
+        with self.timer.span('browser_launch'):
+            driver = webdriver.Edge(service=service, options=options)
         
         # Script anti-detección
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -148,6 +427,11 @@ class InstagramExtractor(BaseExtractor):
         for option in interactive_options:
             options.add_argument(option)
         
+        # Perfil persistente con caché HTTP limitada
+        if self.browser_profile:
+            for argument in self.browser_profile.chromium_arguments():
+                options.add_argument(argument)
+        
         # User agent real
         user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
         options.add_argument(f'--user-agent={user_agent}')
@@ -162,10 +446,13 @@ class InstagramExtractor(BaseExtractor):
         options.add_experimental_option('prefs', prefs)
         options.add_experimental_option('excludeSwitches', ['enable-automation'])
         options.add_experimental_option('useAutomationExtension', False)
+        options.page_load_strategy = self._get_page_load_strategy()
         
         # Configurar servicio
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        with self.timer.span('driver_resolution'):
+            service = ChromeService(ChromeDriverManager().install())
+        with self.timer.span('browser_launch'):
+            driver = webdriver.Chrome(service=service, options=options)
         
         # Script anti-detección
         driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -183,30 +470,167 @@ class InstagramExtractor(BaseExtractor):
             'intl.locale.requested': 'es-ES'
         }
         
+        # Perfil persistente con caché HTTP limitada
+        if self.browser_profile:
+            firefox_prefs.update(self.browser_profile.firefox_preferences())
+            options.add_argument('-profile')
+            options.add_argument(str(self.browser_profile.path))
+        
         for pref, value in firefox_prefs.items():
             options.set_preference(pref, value)
         
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
+        options.page_load_strategy = self._get_page_load_strategy()
+        
+        with self.timer.span('driver_resolution'):
+            service = FirefoxService(GeckoDriverManager().install())
+        with self.timer.span('browser_launch'):
+            driver = webdriver.Firefox(service=service, options=options)
         
         return driver
     
+    def _setup_parse_pool(self) -> None:
+        """Crea el pool de procesos de parseo si PARSING_CONFIG['workers'] > 0."""
+        workers = settings.PARSING_CONFIG['workers']
+        if workers <= 0 or self.parse_pool is not None:
+            return
+        
+        self.parse_pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        logger.info(
+            "Pool de parseo iniciado",
+            extra={'workers': workers, 'html_backend': profile_parser.get_html_backend()}
+        )
+    
+    def _get_page_load_strategy(self) -> str:
+        """Obtiene la estrategia de carga configurada ('eager' si el valor no es válido)."""
+        strategy = str(settings.SELENIUM_CONFIG.get('page_load_strategy', 'eager')).lower()
+        return strategy if strategy in PAGE_LOAD_STRATEGIES else 'eager'
+    
+    def _wait_for_metadata(self, expected_path: str = None, script: str = OG_DESCRIPTION_SCRIPT) -> Optional[str]:
+        """
+        Espera al meta tag og:description y detiene la carga en cuanto está disponible.
+        
+        Con las estrategias 'eager' o 'none' el meta tag suele estar en el HTML
+        inicial, así que se sondea hasta encontrarlo y se llama a window.stop()
+        para no esperar al resto de recursos. Si no aparece dentro de
+        metadata_wait_timeout se espera a la carga completa como fallback.
+        
+        Args:
+            expected_path: Ruta que debe tener la pestaña (evita leer la página anterior)
+            script: Script de consulta (HEAD_WHEN_READY_SCRIPT devuelve el <head> completo)
+            
+        Returns:
+            Contenido del meta tag (o el <head>) o None si no se encontró
+        """
+        timeout = settings.SELENIUM_CONFIG.get('metadata_wait_timeout', 5.0)
+        poll_interval = settings.SELENIUM_CONFIG.get('metadata_poll_interval', 0.1)
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            try:
+                description = self.selenium_driver.execute_script(script, expected_path)
+            except Exception:
+                description = None
+            
+            if description:
+                if self._get_page_load_strategy() != 'normal':
+                    try:
+                        self.selenium_driver.execute_script("window.stop();")
+                    except Exception:
+                        pass
+                return description
+            
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(poll_interval)
+        
+        # Fallback: esperar a la carga completa y volver a consultar
+        self.metrics.inc('retries', help_text='Reintentos realizados', reason='metadata_full_load')
+        try:
+            WebDriverWait(
+                self.selenium_driver,
+                settings.SELENIUM_CONFIG['page_load_timeout']
+            ).until(lambda driver: driver.execute_script("return document.readyState") == 'complete')
+            return self.selenium_driver.execute_script(script, expected_path)
+        except Exception:
+            return None
+    
+    def _record_cache_stats(self) -> None:
+        """Acumula aciertos de caché HTTP de la página actual."""
+        if not settings.BROWSER_PROFILE_CONFIG['report_cache_stats']:
+            return
+        
+        try:
+            hits, total, transferred = self.selenium_driver.execute_script(CACHE_STATS_SCRIPT)
+            self.cache_stats['hits'] += hits
+            self.cache_stats['requests'] += total
+            self.cache_stats['bytes_transferred'] += transferred
+            self.metrics.inc('cache_hits', hits, help_text='Recursos servidos desde la caché HTTP')
+            self.metrics.inc('cache_requests', total, help_text='Recursos medidos vía Resource Timing')
+            self.metrics.inc('cache_bytes_transferred', transferred, help_text='Bytes transferidos por la red')
+        except Exception:
+            pass
+    
+    def get_extraction_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene estadísticas de la extracción, incluyendo la caché HTTP.
+        
+        Returns:
+            Diccionario con estadísticas
+        """
+        stats = super().get_extraction_stats()
+        requests = self.cache_stats['requests']
+        
+        stats['cache'] = {
+            **self.cache_stats,
+            'hit_ratio': (self.cache_stats['hits'] / requests) if requests > 0 else 0.0
+        }
+        stats['browser_memory'] = self.memory_watchdog.get_stats()
+        stats['tab_pool'] = self.tab_pool.get_stats() if self.tab_pool else []
+        
+        return stats
+    
+    def update_metrics(self) -> None:
+        """Actualiza los gauges de rendimiento del registro de métricas."""
+        elapsed_minutes = (datetime.now() - self.start_time).total_seconds() / 60
+        
+        self.metrics.set(
+            'profiles_per_minute',
+            (self.profiles_processed / elapsed_minutes) if elapsed_minutes > 0 else 0,
+            help_text='Perfiles procesados por minuto'
+        )
+        self.metrics.set('requests_made', self.requests_made, help_text='Navegaciones realizadas')
+        self.metrics.set(
+            'browser_rss_peak_bytes',
+            self.memory_watchdog.peak_rss,
+            help_text='Pico de RSS medido del navegador'
+        )
+        self.metrics.set(
+            'last_run_timestamp_seconds',
+            time.time(),
+            help_text='Momento de la última actualización de métricas'
+        )
+    
+    def _maybe_write_metrics(self) -> None:
+        """Escribe el archivo de métricas cada METRICS_WRITE_EVERY perfiles."""
+        write_every = settings.METRICS_CONFIG['write_every']
+        textfile = settings.METRICS_CONFIG['textfile']
+        
+        if textfile and write_every and self.profiles_processed % write_every == 0:
+            self.update_metrics()
+            try:
+                self.metrics.write_textfile(textfile)
+            except Exception:
+                pass
+    
     def _handle_instagram_popups(self):
         """Maneja popups comunes de Instagram después del login."""
         try:
-            # Lista de selectores XPath para cerrar popups
-            popup_xpaths = [
-                "//button[contains(text(), 'Ahora no')]",
-                "//button[contains(text(), 'Not Now')]",
-                "//button[contains(text(), 'Dismiss')]",
-                "//button[@aria-label='Close']",
-                "//*[contains(text(), 'Ahora no')]",
-                "//*[contains(text(), 'Not Now')]"
-            ]
-            
-            for xpath in popup_xpaths:
+            # Selectores XPath para cerrar popups, empezando por el que mejor ha funcionado
+            for xpath in self.selector_registry.ranked('popups', POPUP_XPATHS):
                 try:
+                    started = time.perf_counter()
                     elements = self.selenium_driver.find_elements(By.XPATH, xpath)
+                    self._record_selector('popups', xpath, bool(elements), time.perf_counter() - started)
                     if elements:
                         elements[0].click()
                         time.sleep(2)
@@ -231,10 +655,11 @@ class InstagramExtractor(BaseExtractor):
         """
         try:
             # URL del perfil
-            profile_url = f"https://www.instagram.com/{username}/"
+            profile_url = self._instagram_url(f"{username}/")
             
             # Navegar al perfil
             self.selenium_driver.get(profile_url)
+            self.record_request()
             
             # Dar tiempo al usuario para ver la página
             time.sleep(2)
@@ -266,24 +691,28 @@ class InstagramExtractor(BaseExtractor):
                     followers = self._extract_followers_from_modal(max_followers=max_followers)
                     
                     if followers:
-                        pass
+                        logger.info("Seguidores obtenidos", extra={'account': username, 'followers': len(followers)})
                     else:
+                        logger.warning("No se encontraron seguidores en el modal de @%s", username)
                         # Mantener navegador abierto para inspección manual
                         time.sleep(30)
                     
                     return followers
                 
                 else:
+                    logger.warning("No se encontró el enlace de seguidores de @%s", username)
                     # Mantener navegador abierto para inspección manual
                     time.sleep(20)
                     
                     return []
                     
             except Exception as e:
+                logger.warning("Error leyendo seguidores de @%s: %s", username, e)
                 time.sleep(2)
                 return []
                 
         except Exception as e:
+            logger.warning("Error navegando al perfil @%s: %s", username, e)
             return []
     
     def _extract_followers_from_modal(self, max_followers: int = None) -> List[str]:
@@ -291,33 +720,24 @@ class InstagramExtractor(BaseExtractor):
         followers = []
         
         try:
-            # Buscar contenedores de seguidores en el modal
-            selectors = [
-                '[role="dialog"] a[href*="/"]',  # Enlaces en el modal
-                '[role="dialog"] [role="button"]',  # Botones en el modal
-                'div[style*="transform"] a',  # Área scrolleable
-                '._aano a'  # Selector específico de Instagram
-            ]
-            
-            for selector in selectors:
+            # Buscar contenedores de seguidores en el modal, empezando por el
+            # selector que mejor ha funcionado
+            for selector in self.selector_registry.ranked('followers_modal', FOLLOWER_MODAL_SELECTORS):
                 try:
+                    started = time.perf_counter()
                     elements = self.selenium_driver.find_elements(By.CSS_SELECTOR, selector)
                     
                     for element in elements:
                         if max_followers is not None and len(followers) >= max_followers:
                             break
                         try:
-                            href = element.get_attribute('href')
-                            if href and '/' in href:
-                                # Extraer username de la URL
-                                username = href.split('/')[-2] if href.endswith('/') else href.split('/')[-1]
-                                if username and username not in followers and len(username) > 0:
-                                    # Validar que parece un username válido
-                                    if username.replace('_', '').replace('.', '').isalnum():
-                                        followers.append(username)
+                            username = self._username_from_href(element.get_attribute('href'))
+                            if username and username not in followers:
+                                followers.append(username)
                         except:
                             continue
                             
+                    self._record_selector('followers_modal', selector, bool(followers), time.perf_counter() - started)
                     if followers:
                         break  # Si encontramos seguidores, no probar más selectores
                         
@@ -329,56 +749,110 @@ class InstagramExtractor(BaseExtractor):
         except Exception as e:
             return [] 
 
-    def create_profile_template(self, username: str, source_account: str) -> Dict[str, Any]:
+    def _record_selector(self, group: str, selector: str, hit: bool, latency: float) -> None:
+        """Anota el resultado de un selector en el ranking y en las métricas."""
+        self.selector_registry.record(group, selector, hit, latency)
+        self.metrics.inc(
+            'selector_lookups',
+            help_text='Búsquedas con selectores alternativos',
+            group=group,
+            result='hit' if hit else 'miss'
+        )
+    
+    @staticmethod
+    def _username_from_href(href: Optional[str]) -> Optional[str]:
         """
-        Crea un template básico de datos de perfil con campos extraíbles.
+        Obtiene el username de un enlace de perfil (ej: 'https://www.instagram.com/usuario/').
         
         Args:
-            username: Username del perfil
-            source_account: Cuenta de origen
+            href: Atributo href del enlace
             
         Returns:
-            Diccionario con template de datos
+            Username si el enlace parece un perfil válido, None en caso contrario
         """
-        from datetime import datetime
+        if not href or '/' not in href:
+            return None
         
-        return {
-            'username': username,
-            'full_name': '',
-            'bio': '',
-            'posts_count': 0,
-            'follower_count': 0,
-            'following_count': 0,
-            'extraction_timestamp': datetime.now().isoformat(),
-            'source_account': source_account
-        }
+        username = href.split('/')[-2] if href.endswith('/') else href.split('/')[-1]
+        
+        # Validar que parece un username válido
+        if username and username.replace('_', '').replace('.', '').isalnum():
+            return username
+        return None
 
     def extract_profile_detailed_info(self, username: str) -> Dict[str, Any]:
         """
         Extrae información detallada del perfil usando solo el meta tag og:description para seguidores, siguiendo y publicaciones.
         """
+        if self.profile_fetcher is not None:
+            return self.profile_fetcher.fetch_profile(username)
+        with self._profile_scope(username):
+            return self._navigate_and_extract_profile(username)
+    
+    def _navigate_and_extract_profile(self, username: str) -> Dict[str, Any]:
+        """Navega al perfil en la pestaña actual y extrae sus datos."""
         try:
-            profile_url = f"https://www.instagram.com/{username}/"
-            self.selenium_driver.get(profile_url)
-            time.sleep(2)
-            profile_data = self.create_profile_template(username, "")
-            # Extraer datos del meta tag og:description
-            followers_meta = self.selenium_driver.find_elements(
-                By.CSS_SELECTOR,
-                'meta[property="og:description"]'
-            )
-            if followers_meta:
-                description = followers_meta[0].get_attribute('content')
-                # Parsear: '1M seguidores, 747 siguiendo, 11K publicaciones - ...'
+            profile_url = self._instagram_url(f"{username}/")
+            with self.timer.span('profile_navigation'):
+                self.selenium_driver.get(profile_url)
+            self.record_request()
+            self.memory_watchdog.record_navigation()
+            profile_data = self._extract_profile_from_current_tab(username)
+            self._collect_parses()
+            return profile_data
+        except Exception as e:
+            return self.create_profile_template(username, "")
+    
+    def _fetch_profiles_http(self, followers: List[str], account: str) -> List[Dict[str, Any]]:
+        """
+        Descarga los perfiles con el extractor HTTP (sin navegar pestañas).
+        
+        El rate limiting lo aplica el propio profile_fetcher entre peticiones.
+        
+        Args:
+            followers: Usernames a descargar
+            account: Cuenta de origen
+            
+        Returns:
+            Lista de perfiles
+        """
+        account_data = []
+        for username in followers:
+            profile_data = self.profile_fetcher.fetch_profile(username, f"@{account}")
+            account_data.append(profile_data)
+            if self.profile_fetcher.last_metadata_found:
+                self.metrics.inc('profiles_extracted', help_text='Perfiles extraídos', source_account=f"@{account}")
+            else:
+                self.metrics.inc('profile_failures', help_text='Perfiles sin datos', source_account=f"@{account}", reason='metadata_missing')
+            self.profiles_processed += 1
+            self._maybe_write_metrics()
+        return account_data
+    
+    def _extract_profile_from_current_tab(self, username: str, source_account: str = "") -> Dict[str, Any]:
+        """
+        Extrae los datos del perfil cargado (o cargándose) en la pestaña actual.
+        
+        Args:
+            username: Username del perfil
+            source_account: Cuenta de origen (se guarda con el snapshot)
+            
+        Returns:
+            Diccionario con datos del perfil
+        """
+        try:
+            profile_data = self.create_profile_template(username, source_account)
+            if self.parse_pool is not None:
+                return self._submit_profile_parse(profile_data, username, source_account)
+            # Extraer datos del meta tag og:description (sin esperar la carga completa)
+            with self.timer.span('profile_load'):
+                description = self._wait_for_metadata(f"/{username}/")
+            self.last_metadata_found = bool(description)
+            self._record_cache_stats()
+            self._capture_snapshot(username, source_account)
+            if description:
                 try:
-                    parts = description.split(' - ')[0].split(',')
-                    for part in parts:
-                        if 'seguidor' in part:
-                            profile_data['follower_count'] = self._convert_number_text(part.split()[0])
-                        elif 'siguiendo' in part:
-                            profile_data['following_count'] = self._convert_number_text(part.split()[0])
-                        elif 'publicacion' in part:
-                            profile_data['posts_count'] = self._convert_number_text(part.split()[0])
+                    with self.timer.span('parsing'):
+                        profile_data.update(self._parse_og_description(description))
                 except Exception as e:
                     pass
             
@@ -386,21 +860,86 @@ class InstagramExtractor(BaseExtractor):
         except Exception as e:
             return self.create_profile_template(username, "")
     
-    def _convert_number_text(self, number_text: str) -> int:
+    def _submit_profile_parse(self, profile_data: Dict[str, Any], username: str, source_account: str) -> Dict[str, Any]:
         """
-        Convierte texto de número (ej: '1M', '2K', '500') a entero.
+        Lee el <head> del perfil y envía su parseo al pool de procesos.
+        
+        El hilo del navegador solo espera a que el meta tag exista y copia el
+        HTML; los contadores se rellenan en profile_data al llamar a
+        _collect_parses().
+        
+        Args:
+            profile_data: Plantilla del perfil (se actualiza más tarde)
+            username: Username del perfil
+            source_account: Cuenta de origen
+            
+        Returns:
+            El mismo profile_data, todavía sin contadores
         """
+        with self.timer.span('profile_load'):
+            head = self._wait_for_metadata(f"/{username}/", HEAD_WHEN_READY_SCRIPT)
+        self.last_metadata_found = bool(head)
+        self._record_cache_stats()
+        # Con el modo 'head' el snapshot reutiliza el HTML ya leído
+        self._capture_snapshot(username, source_account, head if settings.SNAPSHOT_CONFIG['mode'] == 'head' else None)
+        if head:
+            future = self.parse_pool.submit(profile_parser.parse_profile_html, head)
+            self.pending_parses.append((profile_data, future))
+        
+        return profile_data
+    
+    def _collect_parses(self) -> None:
+        """Espera los parseos pendientes del pool y vuelca los contadores en sus perfiles."""
+        if not self.pending_parses:
+            return
+        
+        with self.timer.span('parse_wait'):
+            for profile_data, future in self.pending_parses:
+                try:
+                    profile_data.update(future.result())
+                except Exception as e:
+                    logger.warning("Error parseando el perfil @%s: %s", profile_data.get('username'), e)
+        self.pending_parses = []
+    
+    def _capture_snapshot(self, username: str, source_account: str, content: str = None) -> None:
+        """
+        Guarda el HTML de la pestaña actual en el almacén de snapshots (si está activo).
+        
+        Args:
+            username: Username del perfil
+            source_account: Cuenta de origen
+            content: HTML ya leído de la pestaña (si se omite se consulta al navegador)
+        """
+        if self.snapshot_store is None:
+            return
+        
         try:
-            number_text = number_text.strip().replace(',', '').replace('.', '')
-            
-            if number_text.endswith('M'):
-                return int(float(number_text[:-1]) * 1000000)
-            elif number_text.endswith('K'):
-                return int(float(number_text[:-1]) * 1000)
-            else:
-                return int(number_text)
+            script = SNAPSHOT_SCRIPTS.get(settings.SNAPSHOT_CONFIG['mode'], SNAPSHOT_SCRIPTS['head'])
+            with self.timer.span('snapshot_capture'):
+                if content is None:
+                    content = self.selenium_driver.execute_script(script)
+                if content:
+                    self.snapshot_store.put(username, content, source_account, self._instagram_url(f"{username}/"))
         except Exception as e:
-            return 0
+            logger.debug("No se pudo guardar el snapshot de @%s: %s", username, e)
+    
+    def _parse_og_description(self, description: str) -> Dict[str, int]:
+        """
+        Extrae los contadores del contenido de og:description.
+        
+        Args:
+            description: Texto tipo '1M seguidores, 747 siguiendo, 11K publicaciones - ...'
+            
+        Returns:
+            Diccionario con los contadores encontrados
+        """
+        return profile_parser.parse_og_description(description)
+    
+    def _convert_number_text(self, number_text: str) -> int:
+        """
+        Convierte texto de número (ej: '1M', '2K', '500') a entero.
+        """
+        return profile_parser.convert_number_text(number_text)
     
     def _attempt_login_interactive(self) -> bool:
         """Intenta hacer login de forma interactiva usando Selenium."""
@@ -411,7 +950,8 @@ class InstagramExtractor(BaseExtractor):
                 return False
             
             # Navegar a página de login
-            self.selenium_driver.get("https://www.instagram.com/accounts/login/")
+            self.selenium_driver.get(self._instagram_url("accounts/login/"))
+            self.record_request()
             
             time.sleep(3)
             
@@ -461,7 +1001,7 @@ class InstagramExtractor(BaseExtractor):
                     
                     # Verificar si el login fue exitoso
                     current_url = self.selenium_driver.current_url
-                    if "instagram.com" in current_url and "login" not in current_url:
+                    if self._is_instagram_url(current_url) and "login" not in current_url:
                         self.is_logged_in = True
                         self.login_username = username
                         return True
@@ -483,7 +1023,7 @@ class InstagramExtractor(BaseExtractor):
                 
                 # Verificar si el usuario se logueó manualmente
                 current_url = self.selenium_driver.current_url
-                if "login" not in current_url and "instagram.com" in current_url:
+                if "login" not in current_url and self._is_instagram_url(current_url):
                     self.is_logged_in = True
                     self.login_username = username
                     return True
@@ -493,57 +1033,93 @@ class InstagramExtractor(BaseExtractor):
         except Exception as e:
             return False
 
-    def extract_multiple_accounts(self, accounts: List[str], max_followers: int = None) -> Dict[str, List[Dict[str, Any]]]:
+    def extract_multiple_accounts(self, accounts: List[str], max_followers: int = None) -> ResultTable:
         """
-        Extrae datos de múltiples cuentas en modo interactivo con información detallada y procesamiento en lotes de 5 pestañas.
+        Extrae datos de múltiples cuentas en modo interactivo con información detallada y procesamiento en lotes sobre un pool fijo de pestañas.
+        
+        Returns:
+            Tabla columnar con los perfiles de cada cuenta
         """
-        results = {}
+        results = ResultTable()
         
-        for i, account in enumerate(accounts):
-            try:
-                followers = self.extract_followers_interactive(account, max_followers=max_followers)
-                if not followers:
-                    results[account] = []
-                    continue
+        # La tabla de resultados crece durante toda la extracción
+        with self.memory_profiler.stage('results_table'):
+            for i, account in enumerate(accounts):
+                try:
+                    with self.timer.span('follower_scroll'), self.memory_profiler.stage('follower_collection'):
+                        followers = self.extract_followers_interactive(account, max_followers=max_followers)
+                    if not followers:
+                        results.add_account(account)
+                        continue
                 
-                random.shuffle(followers)
-                account_data = []
-                batch_size = 5
-                for batch_start in range(0, len(followers), batch_size):
-                    batch = followers[batch_start:batch_start+batch_size]
-                    for idx, username in enumerate(batch):
-                        if idx == 0:
-                            self.selenium_driver.switch_to.window(self.selenium_driver.window_handles[0])
-                            self.selenium_driver.get(f"https://www.instagram.com/{username}/")
-                        else:
-                            self.selenium_driver.execute_script(f"window.open('https://www.instagram.com/{username}/', '_blank');")
-                    time.sleep(2)
-                    tabs = self.selenium_driver.window_handles
-                    batch_results = []
-                    for idx, username in enumerate(batch):
-                        self.selenium_driver.switch_to.window(tabs[idx])
-                        try:
-                            profile_data = self.extract_profile_detailed_info(username)
-                            profile_data['source_account'] = f"@{account}"
-                            batch_results.append(profile_data)
-                        except Exception as e:
-                            basic_data = self.create_profile_template(username, account)
-                            batch_results.append(basic_data)
-                        time.sleep(random.uniform(1.0, 2.5))
-                    account_data.extend(batch_results)
-                    for idx in range(len(batch)-1, 0, -1):
-                        self.selenium_driver.switch_to.window(tabs[idx])
-                        self.selenium_driver.close()
-                    self.selenium_driver.switch_to.window(tabs[0])
-                results[account] = account_data
-                if i < len(accounts) - 1:
-                    time.sleep(5)
-            except Exception as e:
-                results[account] = []
-                if i < len(accounts) - 1:
-                    response = input(f"\n🤔 Error en @{account}. ¿Continuar con la siguiente cuenta? (y/N): ")
-                    if response.lower() != 'y':
-                        break
+                    random.shuffle(followers)
+                    account_data = []
+                
+                    if self.profile_fetcher is not None:
+                        # Perfiles por HTTP: el navegador solo se usó para el diálogo de seguidores
+                        account_data = self._fetch_profiles_http(followers, account)
+                    else:
+                        # Pool fijo de pestañas: cada perfil navega una pestaña libre
+                        if self.tab_pool is None:
+                            self.tab_pool = TabPool(self.selenium_driver, settings.SELENIUM_CONFIG['tab_pool_size'])
+                        batch_size = self.tab_pool.size
+                
+                        for batch_start in range(0, len(followers), batch_size):
+                            # Reciclar el navegador entre lotes si creció demasiado; la cola
+                            # continúa desde el lote actual
+                            self._check_driver_health()
+                            batch = followers[batch_start:batch_start+batch_size]
+                            # Lanzar todas las cargas del lote antes de leer ninguna
+                            for idx, username in enumerate(batch):
+                                with self.timer.span('profile_navigation'), self._profile_scope(username):
+                                    self.tab_pool.navigate(idx, self._instagram_url(f"{username}/"))
+                                self.record_request()
+                            self.memory_watchdog.record_navigation(len(batch))
+                            batch_results = []
+                            for idx, username in enumerate(batch):
+                                try:
+                                    with self._profile_scope(username):
+                                        self.tab_pool.switch_to(idx)
+                                        profile_data = self._extract_profile_from_current_tab(username, f"@{account}")
+                                    profile_data['source_account'] = f"@{account}"
+                                    batch_results.append(profile_data)
+                                    logger.debug(
+                                        "Perfil procesado",
+                                        extra={'username': username, 'source_account': f"@{account}", 'metadata_found': self.last_metadata_found}
+                                    )
+                                    if self.last_metadata_found:
+                                        self.metrics.inc('profiles_extracted', help_text='Perfiles extraídos', source_account=f"@{account}")
+                                    else:
+                                        self.metrics.inc('profile_failures', help_text='Perfiles sin datos', source_account=f"@{account}", reason='metadata_missing')
+                                except Exception as e:
+                                    logger.warning("Error extrayendo perfil @%s: %s", username, e)
+                                    basic_data = self.create_profile_template(username, account)
+                                    batch_results.append(basic_data)
+                                    self.metrics.inc('profile_failures', help_text='Perfiles sin datos', source_account=f"@{account}", reason='exception')
+                                finally:
+                                    self.tab_pool.release(idx)
+                                    self.profiles_processed += 1
+                                    self._maybe_write_metrics()
+                                with self.timer.span('profile_delay'):
+                                    time.sleep(random.uniform(1.0, 2.5))
+                            account_data.extend(batch_results)
+                    # Con el pool de parseo los contadores llegan al final de la cuenta
+                    self._collect_parses()
+                    # Los registros completos pasan a lotes Arrow y se liberan
+                    results.extend(account, account_data)
+                    results.flush()
+                    logger.info("Cuenta procesada", extra={'account': account, 'profiles': len(account_data)})
+                    if i < len(accounts) - 1:
+                        with self.timer.span('account_delay'):
+                            time.sleep(5)
+                except Exception as e:
+                    logger.error("Error procesando @%s", account, exc_info=True)
+                    self.pending_parses = []
+                    results.add_account(account)
+                    if i < len(accounts) - 1:
+                        response = input(f"\n🤔 Error en @{account}. ¿Continuar con la siguiente cuenta? (y/N): ")
+                        if response.lower() != 'y':
+                            break
         return results
     
     def get_login_status(self) -> Dict[str, Any]:
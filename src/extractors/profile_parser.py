@@ -0,0 +1,117 @@
+"""
+Parseo de páginas de perfil de Instagram independiente del navegador.
+
+Lo comparten el extractor con Selenium (contenido de og:description leído
+del DOM), los procesos del pool de parseo y el re-parseo de snapshots HTML
+guardados en disco. Para el HTML se usa selectolax o lxml si están
+instalados y, si no, expresiones regulares sobre los meta tags.
+"""
+
+import html
+import re
+from typing import Dict, Optional
+
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:  # selectolax es opcional
+    SelectolaxParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:  # lxml es opcional; sin ninguno se usan expresiones regulares
+    lxml_html = None
+
+from ..utils import count_parser
+
+
+# Meta tags del HTML (los atributos pueden aparecer en cualquier orden)
+META_TAG_PATTERN = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+META_ATTRIBUTE_PATTERN = re.compile(r'([\w:-]+)\s*=\s*("([^"]*)"|\'([^\']*)\')')
+
+
+def convert_number_text(number_text: str) -> int:
+    """
+    Convierte texto de número (ej: '1.5M', '11,2 mil', '500') a entero.
+
+    Args:
+        number_text: Texto del contador
+
+    Returns:
+        Valor entero (0 si no se puede convertir)
+    """
+    return count_parser.parse_count(number_text)
+
+
+def parse_og_description(description: str) -> Dict[str, int]:
+    """
+    Extrae los contadores del contenido de og:description (español o inglés).
+
+    Args:
+        description: Texto tipo '1M seguidores, 747 siguiendo, 11K publicaciones - ...'
+
+    Returns:
+        Diccionario con los contadores encontrados
+    """
+    return count_parser.parse_description(description)
+
+
+def get_html_backend() -> str:
+    """Parser HTML disponible: 'selectolax', 'lxml' o 'regex'."""
+    if SelectolaxParser is not None:
+        return 'selectolax'
+    if lxml_html is not None:
+        return 'lxml'
+    return 'regex'
+
+
+def extract_meta_content(page: str, property_name: str) -> Optional[str]:
+    """
+    Obtiene el atributo content de un meta tag por su property (o name).
+
+    Args:
+        page: HTML de la página (completa o solo <head>)
+        property_name: Valor de property/name buscado (ej: 'og:description')
+
+    Returns:
+        Contenido del meta tag o None si no existe
+    """
+    if SelectolaxParser is not None:
+        tree = SelectolaxParser(page)
+        node = tree.css_first(f'meta[property="{property_name}"]') or tree.css_first(f'meta[name="{property_name}"]')
+        return node.attributes.get('content') if node is not None else None
+
+    if lxml_html is not None and page.strip():
+        nodes = lxml_html.fromstring(page).xpath(
+            '//meta[@property=$name or @name=$name]/@content', name=property_name
+        )
+        return str(nodes[0]) if nodes else None
+
+    return _extract_meta_content_regex(page, property_name)
+
+
+def _extract_meta_content_regex(page: str, property_name: str) -> Optional[str]:
+    """Implementación de extract_meta_content con expresiones regulares."""
+    for tag in META_TAG_PATTERN.findall(page):
+        attributes = {
+            match.group(1).lower(): match.group(3) if match.group(3) is not None else match.group(4)
+            for match in META_ATTRIBUTE_PATTERN.finditer(tag)
+        }
+        if property_name in (attributes.get('property'), attributes.get('name')):
+            content = attributes.get('content')
+            return html.unescape(content) if content is not None else None
+
+    return None
+
+
+def parse_profile_html(page: str) -> Dict[str, int]:
+    """
+    Extrae los datos del perfil de su HTML.
+
+    Args:
+        page: HTML de la página de perfil (completa o solo <head>)
+
+    Returns:
+        Diccionario con los campos encontrados (vacío si no hay og:description)
+    """
+    description = extract_meta_content(page, 'og:description')
+    return parse_og_description(description) if description else {}
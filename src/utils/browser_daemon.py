@@ -0,0 +1,209 @@
+"""
+Navegador persistente (daemon) reutilizable entre ejecuciones del CLI.
+
+Lanza Chrome/Edge con un puerto de depuración remota y un perfil propio para
+que el extractor pueda reconectarse en cada ejecución en lugar de arrancar un
+navegador nuevo y volver a hacer login.
+"""
+
+import json
+import subprocess
+import time
+import urllib.request
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import psutil
+
+from ..config.settings import BROWSER_DAEMON_CONFIG
+from .browser_detector import BrowserDetector
+from .browser_profile import BrowserProfileManager
+
+
+# Solo los navegadores basados en Chromium admiten reconexión vía debuggerAddress
+SUPPORTED_BROWSERS = ('chrome', 'edge')
+
+
+def _find_browser_binary() -> Optional[Dict[str, str]]:
+    """
+    Busca un navegador Chromium instalado.
+
+    Returns:
+        Diccionario con 'browser' y 'path' o None si no hay ninguno
+    """
+    detected = BrowserDetector().detect_all_browsers()
+
+    for browser in SUPPORTED_BROWSERS:
+        info = detected.get(browser)
+        if info and info.get('path'):
+            return {'browser': browser, 'path': info['path']}
+
+    return None
+
+
+def _is_process_alive(pid: int) -> bool:
+    """Verifica si un proceso sigue vivo (os.kill(pid, 0) no sirve en Windows)."""
+    try:
+        return psutil.pid_exists(pid)
+    except (OSError, ValueError):
+        return False
+
+
+def _is_debugger_responding(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Verifica si el endpoint de depuración remota responde."""
+    try:
+        with urllib.request.urlopen(f"http://{host}:{port}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+def read_state() -> Optional[Dict[str, Any]]:
+    """
+    Lee el estado guardado del daemon.
+
+    Returns:
+        Estado del daemon o None si no existe
+    """
+    state_file = Path(BROWSER_DAEMON_CONFIG['state_file'])
+
+    if not state_file.exists():
+        return None
+
+    try:
+        return json.loads(state_file.read_text(encoding='utf-8'))
+    except Exception:
+        return None
+
+
+def _write_state(state: Dict[str, Any]) -> None:
+    """Guarda el estado del daemon."""
+    state_file = Path(BROWSER_DAEMON_CONFIG['state_file'])
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    state_file.write_text(json.dumps(state, indent=2), encoding='utf-8')
+
+
+def _clear_state() -> None:
+    """Elimina el archivo de estado del daemon."""
+    try:
+        Path(BROWSER_DAEMON_CONFIG['state_file']).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def get_running_daemon() -> Optional[Dict[str, Any]]:
+    """
+    Obtiene el daemon en ejecución, limpiando estados obsoletos.
+
+    Returns:
+        Estado del daemon si está vivo y responde, None en otro caso
+    """
+    state = read_state()
+
+    if not state:
+        return None
+
+    if _is_process_alive(state['pid']) and _is_debugger_responding(state['host'], state['port']):
+        return state
+
+    _clear_state()
+    return None
+
+
+def start_daemon() -> Dict[str, Any]:
+    """
+    Arranca el navegador persistente si no está ya en ejecución.
+
+    Returns:
+        Estado del daemon (pid, puerto, navegador, debugger_address)
+
+    Raises:
+        RuntimeError: Si no hay navegador compatible o no arranca a tiempo
+    """
+    state = get_running_daemon()
+    if state:
+        return state
+
+    binary = _find_browser_binary()
+    if binary is None:
+        raise RuntimeError("No se encontró Chrome ni Edge para el navegador persistente")
+
+    host = BROWSER_DAEMON_CONFIG['host']
+    port = BROWSER_DAEMON_CONFIG['port']
+    profile = BrowserProfileManager(BROWSER_DAEMON_CONFIG['user_data_dir'])
+    user_data_dir = profile.prepare()
+
+    command = [
+        binary['path'],
+        f'--remote-debugging-address={host}',
+        f'--remote-debugging-port={port}',
+        *profile.chromium_arguments(),
+        '--no-first-run',
+        '--no-default-browser-check',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-notifications',
+        '--lang=es-ES'
+    ]
+
+    if BROWSER_DAEMON_CONFIG['headless']:
+        command.append('--headless=new')
+
+    # Sesión propia para que el navegador sobreviva al proceso que lo lanza
+    process = subprocess.Popen(
+        command,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+    deadline = time.monotonic() + BROWSER_DAEMON_CONFIG['startup_timeout']
+    while not _is_debugger_responding(host, port):
+        if process.poll() is not None or time.monotonic() >= deadline:
+            process.kill()
+            raise RuntimeError(f"El navegador persistente no respondió en {host}:{port}")
+        time.sleep(0.25)
+
+    state = {
+        'pid': process.pid,
+        'browser': binary['browser'],
+        'host': host,
+        'port': port,
+        'debugger_address': f"{host}:{port}",
+        'user_data_dir': str(user_data_dir),
+        'started_at': datetime.now().isoformat()
+    }
+    _write_state(state)
+
+    return state
+
+
+def stop_daemon() -> bool:
+    """
+    Detiene el navegador persistente.
+
+    Returns:
+        True si había un daemon en ejecución
+    """
+    state = read_state()
+
+    if not state:
+        return False
+
+    was_running = _is_process_alive(state['pid'])
+    if was_running:
+        try:
+            # SIGTERM en POSIX, TerminateProcess en Windows
+            psutil.Process(state['pid']).terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+
+        # Esperar a que libere el puerto de depuración antes de un posible reinicio
+        deadline = time.monotonic() + 5
+        while _is_debugger_responding(state['host'], state['port'], timeout=0.5):
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(0.1)
+
+    _clear_state()
+    return was_running
@@ -0,0 +1,186 @@
+"""
+Gestión del directorio de perfil persistente del navegador y de su caché HTTP.
+"""
+
+import os
+import socket
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+import psutil
+
+from ..config.settings import BROWSER_PROFILE_CONFIG
+
+
+class BrowserProfileManager:
+    """
+    Mantiene un user-data-dir persistente con una caché de disco limitada.
+
+    La caché se guarda en un subdirectorio propio para poder limpiarla con
+    expulsión LRU sin tocar cookies ni almacenamiento de sesión.
+    """
+
+    CACHE_SUBDIR = 'cache'
+
+    def __init__(self, profile_dir: str = None, config: Dict[str, Any] = None):
+        """
+        Inicializa el gestor de perfil.
+
+        Args:
+            profile_dir: Directorio del perfil (default: BROWSER_PROFILE_CONFIG['profile_dir'])
+            config: Configuración alternativa (default: BROWSER_PROFILE_CONFIG)
+        """
+        self.config = config or BROWSER_PROFILE_CONFIG
+        self.path = self._resolve_path(Path(profile_dir or self.config['profile_dir']))
+        self.cache_dir = self.path / self.CACHE_SUBDIR
+        self.max_cache_bytes = self.config['cache_max_mb'] * 1024 * 1024
+
+    def _resolve_path(self, profile_dir: Path) -> Path:
+        """Ubica el perfil en tmpfs si está configurado y disponible."""
+        if self.config.get('use_tmpfs'):
+            tmpfs_root = Path(self.config['tmpfs_dir'])
+            if tmpfs_root.parent.exists():
+                return (tmpfs_root / profile_dir.name).resolve()
+
+        return profile_dir.resolve()
+
+    def is_locked(self) -> bool:
+        """
+        Indica si otro navegador Chromium está usando el perfil.
+
+        Chrome/Edge crean 'SingletonLock' (enlace a 'equipo-pid') en POSIX y
+        mantienen 'lockfile' abierto en exclusiva en Windows. Un bloqueo de un
+        proceso que ya no existe en este equipo no cuenta (Chrome lo recupera).
+
+        Returns:
+            True si el perfil está bloqueado
+        """
+        singleton_lock = self.path / 'SingletonLock'
+        if singleton_lock.is_symlink():
+            host, _, pid = os.readlink(singleton_lock).rpartition('-')
+            if host != socket.gethostname():
+                return True
+            return pid.isdigit() and psutil.pid_exists(int(pid))
+
+        lockfile = self.path / 'lockfile'
+        if lockfile.exists():
+            try:
+                with open(lockfile, 'a'):
+                    pass
+            except PermissionError:
+                return True
+
+        return False
+
+    def prepare(self) -> Path:
+        """
+        Crea el perfil si no existe y recorta la caché si excede el límite.
+
+        Returns:
+            Ruta del perfil
+
+        Raises:
+            RuntimeError: Si otro navegador está usando el perfil
+        """
+        if self.is_locked():
+            raise RuntimeError(f"El perfil {self.path} está en uso por otro navegador")
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.enforce_cache_limit()
+        return self.path
+
+    def chromium_arguments(self) -> List[str]:
+        """
+        Argumentos de línea de comandos para Chrome/Edge.
+
+        Returns:
+            Lista de argumentos
+        """
+        return [
+            f'--user-data-dir={self.path}',
+            f'--disk-cache-dir={self.cache_dir}',
+            f'--disk-cache-size={self.max_cache_bytes}'
+        ]
+
+    def firefox_preferences(self) -> Dict[str, Any]:
+        """
+        Preferencias de caché para Firefox.
+
+        Returns:
+            Diccionario de preferencias
+        """
+        return {
+            'browser.cache.disk.enable': True,
+            'browser.cache.disk.parent_directory': str(self.cache_dir),
+            'browser.cache.disk.smart_size.enabled': False,
+            'browser.cache.disk.capacity': self.max_cache_bytes // 1024
+        }
+
+    def _cache_files(self) -> List[Tuple[str, os.stat_result]]:
+        """Lista los archivos de la caché con su información de stat."""
+        files = []
+
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                file_path = os.path.join(root, name)
+                try:
+                    files.append((file_path, os.stat(file_path)))
+                except OSError:
+                    continue
+
+        return files
+
+    def get_cache_size(self) -> int:
+        """
+        Calcula el tamaño actual de la caché.
+
+        Returns:
+            Tamaño en bytes
+        """
+        return sum(stat.st_size for _, stat in self._cache_files())
+
+    def enforce_cache_limit(self) -> int:
+        """
+        Expulsa los archivos menos usados recientemente si la caché excede el límite.
+
+        Returns:
+            Bytes liberados
+        """
+        files = self._cache_files()
+        total = sum(stat.st_size for _, stat in files)
+
+        if total <= self.max_cache_bytes:
+            return 0
+
+        target = int(self.max_cache_bytes * self.config.get('cache_low_watermark', 0.8))
+        freed = 0
+
+        # Último acceso (o modificación si atime no está disponible) más antiguo primero
+        files.sort(key=lambda item: max(item[1].st_atime, item[1].st_mtime))
+
+        for file_path, stat in files:
+            if total - freed <= target:
+                break
+            try:
+                os.remove(file_path)
+                freed += stat.st_size
+            except OSError:
+                continue
+
+        return freed
+
+
+def get_browser_profile(profile_dir: str = None) -> Optional[BrowserProfileManager]:
+    """
+    Obtiene el gestor de perfil si el perfil persistente está habilitado.
+
+    Args:
+        profile_dir: Directorio del perfil (opcional)
+
+    Returns:
+        BrowserProfileManager o None si está deshabilitado
+    """
+    if not BROWSER_PROFILE_CONFIG['enabled']:
+        return None
+
+    return BrowserProfileManager(profile_dir)
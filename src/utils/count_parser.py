@@ -0,0 +1,175 @@
+"""
+Parseo de contadores de Instagram en español e inglés.
+
+Entiende separadores de miles y decimales de ambos idiomas ('1,234',
+'1.234', '1.5M', '11,2 mil', '3,4 mill.') y las palabras clave de
+og:description ('seguidores'/'followers', 'siguiendo'/'following',
+'publicaciones'/'posts'). Los resultados se memorizan porque al re-parsear
+ejecuciones archivadas los mismos textos se repiten millones de veces.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Any
+
+
+# Multiplicador de cada sufijo (en minúsculas y sin punto final)
+SUFFIX_MULTIPLIERS = {
+    'k': 1_000,
+    'mil': 1_000,
+    'm': 1_000_000,
+    'mill': 1_000_000,
+    'millón': 1_000_000,
+    'millones': 1_000_000,
+    'mln': 1_000_000,
+    'b': 1_000_000_000,
+    'bn': 1_000_000_000,
+    'mil millones': 1_000_000_000
+}
+
+# Número con separadores de miles o decimales ('.', ',' o espacio delante de 3 cifras)
+_NUMBER = r'\d+(?:(?:[.,]|\s(?=\d{3}\b))\d+)*'
+_SUFFIX = r'mil\s+millones|millones|millón|mill\.?|mil|mln|bn|[kmb]'
+
+COUNT_PATTERN = re.compile(
+    rf'^\s*(?P<number>{_NUMBER})\s*(?:(?P<suffix>{_SUFFIX})(?![^\W\d_]))?\.?\s*$',
+    re.IGNORECASE
+)
+
+DESCRIPTION_PATTERN = re.compile(
+    rf'(?P<number>{_NUMBER})\s*(?:(?P<suffix>{_SUFFIX})(?![^\W\d_]))?\.?\s*'
+    r'(?:(?P<followers>followers?|seguidor(?:es)?)'
+    r'|(?P<following>following|siguiendo|seguidos)'
+    r'|(?P<posts>posts?|publicaci[oó]n(?:es)?))\b',
+    re.IGNORECASE
+)
+
+DESCRIPTION_FIELDS = (
+    ('followers', 'follower_count'),
+    ('following', 'following_count'),
+    ('posts', 'posts_count')
+)
+
+CACHE_SIZE = 65_536
+
+
+def _number_value(number: str, has_suffix: bool) -> float:
+    """
+    Interpreta los separadores de un número.
+
+    Un separador repetido es de miles ('1.234.567'). Si aparece una sola vez
+    es decimal cuando va tras el otro tipo de separador ('1.234,5'), cuando
+    no le siguen exactamente 3 cifras o cuando hay sufijo ('1.5M',
+    '11,2 mil'); en otro caso es de miles ('1,234').
+    """
+    number = re.sub(r'\s', '', number)
+    last = max(number.rfind('.'), number.rfind(','))
+    if last < 0:
+        return float(number)
+
+    integer_part, fraction = number[:last], number[last + 1:]
+    separator = number[last]
+    if number.count(separator) > 1:
+        is_decimal = False
+    elif ('.' if separator == ',' else ',') in integer_part:
+        is_decimal = True
+    else:
+        is_decimal = len(fraction) != 3 or has_suffix
+
+    integer_part = integer_part.replace('.', '').replace(',', '')
+    if is_decimal:
+        return float(f"{integer_part}.{fraction}")
+    return float(integer_part + fraction)
+
+
+def _to_int(number: str, suffix: str) -> int:
+    """Valor entero de un número y su sufijo."""
+    multiplier = 1
+    if suffix:
+        key = re.sub(r'\s+', ' ', suffix.lower().rstrip('.'))
+        multiplier = SUFFIX_MULTIPLIERS[key]
+    return int(round(_number_value(number, bool(suffix)) * multiplier))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_count(text: str) -> int:
+    """
+    Convierte un contador ('500', '1,234', '1.5M', '11,2 mil') a entero.
+
+    Args:
+        text: Texto del contador
+
+    Returns:
+        Valor entero (0 si no se puede convertir)
+    """
+    if not isinstance(text, str):
+        return 0
+
+    match = COUNT_PATTERN.match(text)
+    if match is None:
+        return 0
+    return _to_int(match.group('number'), match.group('suffix'))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_description_items(description: str) -> tuple:
+    """Pares (campo, valor) de una og:description (tupla inmutable para la caché)."""
+    counts = {}
+    # El texto tras ' - ' es el nombre del perfil (puede contener números)
+    for match in DESCRIPTION_PATTERN.finditer(description.split(' - ')[0]):
+        for group, field in DESCRIPTION_FIELDS:
+            if match.group(group) and field not in counts:
+                counts[field] = _to_int(match.group('number'), match.group('suffix'))
+    return tuple(counts.items())
+
+
+def parse_description(description: str) -> Dict[str, int]:
+    """
+    Extrae los contadores del contenido de og:description.
+
+    Args:
+        description: Texto tipo '1M seguidores, 747 siguiendo, 11K publicaciones - ...'
+            o '1.5M Followers, 747 Following, 11K Posts - ...'
+
+    Returns:
+        Diccionario con los contadores encontrados
+    """
+    if not isinstance(description, str):
+        return {}
+    return dict(_parse_description_items(description))
+
+
+def parse_counts(values) -> Any:
+    """
+    Convierte una lista o Series de contadores.
+
+    Args:
+        values: Lista de textos o pandas.Series
+
+    Returns:
+        Lista de enteros, o Series con el mismo índice si se pasó una Series
+    """
+    if hasattr(values, 'map') and hasattr(values, 'index'):
+        return values.map(parse_count)
+    return [parse_count(value) for value in values]
+
+
+def parse_descriptions(values) -> Any:
+    """
+    Extrae los contadores de una lista o Series de og:description.
+
+    Args:
+        values: Lista de descripciones o pandas.Series
+
+    Returns:
+        Lista de diccionarios, o DataFrame (columnas Int64) con el mismo índice
+        si se pasó una Series
+    """
+    if hasattr(values, 'map') and hasattr(values, 'index'):
+        import pandas as pd
+
+        rows = [parse_description(value) for value in values]
+        columns = [field for _, field in DESCRIPTION_FIELDS]
+        return pd.DataFrame(rows, index=values.index, columns=columns).astype('Int64')
+    return [parse_description(value) for value in values]
+
@@ -0,0 +1,174 @@
+"""
+Configuración de logging estructurado (JSON lines) no bloqueante.
+
+Los módulos solo encolan registros mediante un QueueHandler; un
+QueueListener en un hilo aparte los formatea y escribe en el archivo
+rotativo definido en LOGGING_CONFIG (JSON) y en la consola (texto, INFO por
+defecto), de modo que el bucle de extracción nunca espera por E/S.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from ..config.settings import LOGGING_CONFIG, DATA_PATHS, release_startup_logs
+
+
+# Atributos estándar de LogRecord; el resto se considera contexto estructurado
+_RESERVED_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime'}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formatea cada registro como un objeto JSON en una línea.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Serializa el registro incluyendo los campos pasados en extra.
+
+        Args:
+            record: Registro de logging
+
+        Returns:
+            Línea JSON
+        """
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith('_'):
+                entry[key] = value
+
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """
+    Deja pasar solo una fracción de los mensajes DEBUG (INFO o superior siempre pasan).
+    """
+
+    def __init__(self, sample_rate: float):
+        """
+        Inicializa el filtro.
+
+        Args:
+            sample_rate: Fracción de mensajes DEBUG a conservar (0.0 - 1.0)
+        """
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Decide si el registro se encola."""
+        if record.levelno > logging.DEBUG or self.sample_rate >= 1.0:
+            return True
+        return random.random() < self.sample_rate
+
+
+class StructuredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que conserva los campos estructurados del registro.
+
+    El QueueHandler estándar sustituye el mensaje por su versión formateada;
+    aquí solo se resuelven los argumentos y la traza para que el registro
+    pueda cruzar al hilo del listener sin referencias a frames.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepara el registro para encolarlo."""
+        record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+def setup_logging(level: str = None, console: bool = None, console_level: str = None) -> logging.handlers.QueueListener:
+    """
+    Configura el logging de la aplicación (idempotente).
+
+    Args:
+        level: Nivel de logging (default: LOGGING_CONFIG['level'])
+        console: Mostrar también los registros en consola (default: LOGGING_CONFIG['console'])
+        console_level: Nivel mínimo en consola (default: LOGGING_CONFIG['console_level'])
+
+    Returns:
+        QueueListener en ejecución
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    level = (level or LOGGING_CONFIG['level']).upper()
+    console = LOGGING_CONFIG['console'] if console is None else console
+
+    log_dir = Path(DATA_PATHS['logs'])
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / LOGGING_CONFIG['filename'],
+        maxBytes=LOGGING_CONFIG['max_bytes'],
+        backupCount=LOGGING_CONFIG['backup_count'],
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(JSONFormatter())
+    handlers = [file_handler]
+
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(LOGGING_CONFIG['format']))
+        console_handler.setLevel((console_level or LOGGING_CONFIG['console_level']).upper())
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = StructuredQueueHandler(log_queue)
+    queue_handler.addFilter(DebugSamplingFilter(LOGGING_CONFIG['debug_sample_rate']))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(queue_handler)
+
+    # Librerías muy verbosas en DEBUG
+    for noisy_logger in ('selenium', 'urllib3', 'WDM'):
+        logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    # Mensajes de la configuración emitidos al importarla, antes de este punto
+    for record in release_startup_logs():
+        if record.levelno >= root_logger.level:
+            logging.getLogger(record.name).handle(record)
+
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Vacía la cola de logging y detiene el listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
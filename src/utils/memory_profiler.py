@@ -0,0 +1,202 @@
+"""
+Perfilado de memoria por etapa del pipeline (opt-in).
+
+Combina tracemalloc (pico de memoria Python por etapa) con muestreo
+periódico del RSS del proceso. Los sitios de asignación se obtienen con un
+único snapshot al detener el perfilador: un snapshot dentro de una etapa
+cuesta segundos con muchos objetos vivos y falsearía los tiempos por fase
+medidos a la vez.
+"""
+
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Dict, List, Any
+
+from .memory_watchdog import get_current_rss
+
+
+MB = 1024 * 1024
+
+
+class MemoryProfiler:
+    """
+    Registra pico de memoria Python y de RSS para cada etapa.
+    """
+
+    def __init__(self, sample_interval: float = 0.05, top_n: int = 10, traceback_frames: int = 1):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            sample_interval: Segundos entre muestras de RSS
+            top_n: Número de sitios de asignación a reportar
+            traceback_frames: Frames guardados por asignación en tracemalloc
+        """
+        self.sample_interval = sample_interval
+        self.top_n = top_n
+        self.traceback_frames = traceback_frames
+        self.stages = {}
+        self.top_allocations = []
+        self._active = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._sampler = None
+
+    def start(self) -> None:
+        """Inicia tracemalloc y el muestreo de RSS."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.traceback_frames)
+
+        self._stop_event.clear()
+        self._sampler = threading.Thread(target=self._sample_rss, name='rss-sampler', daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Detiene el muestreo de RSS y tracemalloc (tras el único snapshot de asignaciones)."""
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+        if tracemalloc.is_tracing():
+            self.top_allocations = self._top_allocations()
+            tracemalloc.stop()
+
+    def _sample_rss(self) -> None:
+        """Actualiza el pico de RSS de las etapas activas."""
+        while not self._stop_event.wait(self.sample_interval):
+            rss = get_current_rss()
+            with self._lock:
+                for frame in self._active:
+                    frame['rss_peak'] = max(frame['rss_peak'], rss)
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Mide la memoria del bloque como una ejecución de la etapa.
+
+        Args:
+            name: Nombre de la etapa
+        """
+        if not tracemalloc.is_tracing():
+            yield
+            return
+
+        rss_start = get_current_rss()
+        python_start = tracemalloc.get_traced_memory()[0]
+        frame = {'rss_peak': rss_start, 'python_peak': python_start}
+        started = time.perf_counter()
+
+        with self._lock:
+            # reset_peak borra el pico acumulado: guardarlo antes en las etapas externas
+            python_peak_so_far = tracemalloc.get_traced_memory()[1]
+            for outer in self._active:
+                outer['python_peak'] = max(outer['python_peak'], python_peak_so_far)
+            self._active.append(frame)
+            tracemalloc.reset_peak()
+
+        try:
+            yield
+        finally:
+            python_end, python_peak = tracemalloc.get_traced_memory()
+            rss_end = get_current_rss()
+
+            with self._lock:
+                self._active.remove(frame)
+                frame['python_peak'] = max(frame['python_peak'], python_peak)
+                frame['rss_peak'] = max(frame['rss_peak'], rss_end)
+                # Pico de la etapa anidada (incluye lo anterior a su reset) hacia las externas
+                for outer in self._active:
+                    outer['python_peak'] = max(outer['python_peak'], frame['python_peak'])
+                    outer['rss_peak'] = max(outer['rss_peak'], frame['rss_peak'])
+
+            self._store(name, {
+                'duration': time.perf_counter() - started,
+                'python_peak_mb': frame['python_peak'] / MB,
+                'python_delta_mb': (python_end - python_start) / MB,
+                'rss_start_mb': rss_start / MB,
+                'rss_peak_mb': frame['rss_peak'] / MB,
+                'rss_end_mb': rss_end / MB
+            })
+
+    def _top_allocations(self) -> List[Dict[str, Any]]:
+        """Obtiene los sitios de asignación con más memoria viva (snapshot completo: costoso)."""
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        ))
+
+        return [
+            {
+                'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                'size_kb': round(stat.size / 1024, 1),
+                'count': stat.count
+            }
+            for stat in snapshot.statistics('lineno')[:self.top_n]
+        ]
+
+    def _store(self, name: str, measurement: Dict[str, float]) -> None:
+        """Agrega una medición a la etapa."""
+        stage = self.stages.setdefault(name, {
+            'calls': 0,
+            'total_duration': 0.0,
+            'python_peak_mb': 0.0,
+            'rss_peak_mb': 0.0,
+            'max_python_delta_mb': 0.0
+        })
+
+        stage['calls'] += 1
+        stage['total_duration'] += measurement['duration']
+        stage['max_python_delta_mb'] = max(stage['max_python_delta_mb'], measurement['python_delta_mb'])
+        stage['rss_peak_mb'] = max(stage['rss_peak_mb'], measurement['rss_peak_mb'])
+        stage['python_peak_mb'] = max(stage['python_peak_mb'], measurement['python_peak_mb'])
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Genera el informe de memoria.
+
+        Returns:
+            Diccionario con 'stages' ({etapa: métricas} con valores en MB) y
+            'top_allocations' (memoria viva al detener el perfilador)
+        """
+        return {
+            'stages': {
+                name: {
+                    key: round(value, 3) if isinstance(value, float) else value
+                    for key, value in stage.items()
+                }
+                for name, stage in self.stages.items()
+            },
+            'top_allocations': self.top_allocations
+        }
+
+    def write_report(self, path: str) -> str:
+        """
+        Escribe el informe en formato JSON.
+
+        Args:
+            path: Ruta del archivo de salida
+
+        Returns:
+            Ruta del archivo generado
+        """
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(self.get_report(), indent=2, ensure_ascii=False), encoding='utf-8')
+
+        return str(output_path)
+
+
+class NullMemoryProfiler:
+    """
+    Perfilador vacío usado cuando el perfilado de memoria está desactivado.
+    """
+
+    def stage(self, name: str):
+        """Devuelve un contexto que no mide nada."""
+        return nullcontext()
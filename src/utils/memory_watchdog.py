@@ -0,0 +1,152 @@
+"""
+Vigilancia de memoria del navegador controlado por Selenium.
+
+Mide el RSS del árbol de procesos del driver (driver + navegador + renderers)
+y decide cuándo reciclar el driver para que las ejecuciones largas no se
+degraden por el crecimiento de memoria del navegador.
+"""
+
+from typing import Dict, Any, Optional
+
+import psutil
+
+from ..config.settings import SELENIUM_CONFIG
+
+
+def get_process_tree_rss(pid: int) -> int:
+    """
+    Calcula el RSS total de un proceso y todos sus descendientes.
+
+    Args:
+        pid: PID del proceso raíz
+
+    Returns:
+        RSS total en bytes (0 si no se puede medir)
+    """
+    if pid is None:
+        return 0
+
+    try:
+        root = psutil.Process(pid)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return 0
+
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.Error:
+            continue
+    return total
+
+
+def get_current_rss() -> int:
+    """
+    Obtiene el RSS del proceso actual.
+
+    Returns:
+        RSS en bytes (0 si no se puede medir)
+    """
+    try:
+        return psutil.Process().memory_info().rss
+    except psutil.Error:
+        return 0
+
+
+class DriverMemoryWatchdog:
+    """
+    Decide cuándo reciclar el driver por memoria o por número de navegaciones.
+    """
+
+    def __init__(
+        self,
+        max_rss_mb: int = None,
+        max_navigations: int = None,
+        check_interval: int = None
+    ):
+        """
+        Inicializa el watchdog.
+
+        Args:
+            max_rss_mb: Umbral de RSS del árbol del navegador en MB (0 desactiva)
+            max_navigations: Navegaciones antes de reciclar (0 desactiva)
+            check_interval: Navegaciones entre muestras de memoria
+        """
+        self.max_rss_bytes = (max_rss_mb if max_rss_mb is not None else SELENIUM_CONFIG['max_browser_rss_mb']) * 1024 * 1024
+        self.max_navigations = max_navigations if max_navigations is not None else SELENIUM_CONFIG['recycle_after_navigations']
+        self.check_interval = max(1, check_interval if check_interval is not None else SELENIUM_CONFIG['memory_check_interval'])
+
+        self.navigations = 0
+        self.navigations_since_check = 0
+        self.last_rss = 0
+        self.peak_rss = 0
+        self.recycles = []
+
+    def record_navigation(self, count: int = 1) -> None:
+        """
+        Registra navegaciones realizadas por el driver actual.
+
+        Args:
+            count: Número de navegaciones
+        """
+        self.navigations += count
+        self.navigations_since_check += count
+
+    def should_recycle(self, browser_pid: Optional[int]) -> Optional[str]:
+        """
+        Evalúa si el driver debe reciclarse.
+
+        Args:
+            browser_pid: PID raíz del árbol de procesos del navegador
+
+        Returns:
+            Motivo ('navigations' o 'memory') o None si no hace falta
+        """
+        if self.max_navigations and self.navigations >= self.max_navigations:
+            return 'navigations'
+
+        if not self.max_rss_bytes or self.navigations_since_check < self.check_interval:
+            return None
+
+        self.navigations_since_check = 0
+        self.last_rss = get_process_tree_rss(browser_pid)
+        self.peak_rss = max(self.peak_rss, self.last_rss)
+
+        if self.last_rss >= self.max_rss_bytes:
+            return 'memory'
+
+        return None
+
+    def reset(self, reason: str = None) -> None:
+        """
+        Reinicia los contadores tras reciclar el driver.
+
+        Args:
+            reason: Motivo del reciclaje (se guarda en las estadísticas)
+        """
+        if reason:
+            self.recycles.append({
+                'reason': reason,
+                'navigations': self.navigations,
+                'rss_bytes': self.last_rss
+            })
+
+        self.navigations = 0
+        self.navigations_since_check = 0
+        self.last_rss = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene estadísticas del watchdog.
+
+        Returns:
+            Diccionario con estadísticas
+        """
+        return {
+            'recycles': len(self.recycles),
+            'recycle_history': list(self.recycles),
+            'navigations_current_driver': self.navigations,
+            'last_rss_mb': round(self.last_rss / (1024 * 1024), 1),
+            'peak_rss_mb': round(self.peak_rss / (1024 * 1024), 1)
+        }
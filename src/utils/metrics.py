@@ -0,0 +1,126 @@
+"""
+Métricas de ejecución en formato texto de Prometheus/OpenMetrics.
+
+Pensado para el textfile collector de node-exporter: las métricas se
+escriben de forma atómica en un archivo .prom al terminar (y opcionalmente
+cada N perfiles) en las ejecuciones programadas.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    """Formatea etiquetas como {clave="valor",...}."""
+    if not labels:
+        return ''
+
+    escaped = [
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    ]
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    """Formatea un valor sin perder precisión en enteros grandes."""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class MetricsRegistry:
+    """
+    Registro mínimo de contadores y gauges con etiquetas.
+    """
+
+    def __init__(self, prefix: str = 'instagram_extractor'):
+        """
+        Inicializa el registro.
+
+        Args:
+            prefix: Prefijo de todas las métricas
+        """
+        self.prefix = prefix
+        self._types = {}
+        self._help = {}
+        self._values = {}
+
+    def _series(self, metric_type: str, name: str, help_text: str) -> Dict[Tuple, float]:
+        """Obtiene (o crea) las series de una métrica."""
+        full_name = f"{self.prefix}_{name}"
+
+        if full_name not in self._types:
+            self._types[full_name] = metric_type
+            self._help[full_name] = help_text or name.replace('_', ' ')
+            self._values[full_name] = {}
+
+        return self._values[full_name]
+
+    def inc(self, name: str, value: float = 1, help_text: str = None, **labels) -> None:
+        """
+        Incrementa un contador.
+
+        Args:
+            name: Nombre del contador (sin sufijo _total)
+            value: Incremento
+            help_text: Descripción de la métrica
+            **labels: Etiquetas de la serie
+        """
+        series = self._series('counter', name, help_text)
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def set(self, name: str, value: float, help_text: str = None, **labels) -> None:
+        """
+        Asigna el valor de un gauge.
+
+        Args:
+            name: Nombre del gauge
+            value: Valor
+            help_text: Descripción de la métrica
+            **labels: Etiquetas de la serie
+        """
+        series = self._series('gauge', name, help_text)
+        series[tuple(sorted(labels.items()))] = value
+
+    def render(self) -> str:
+        """
+        Genera la exposición en formato texto OpenMetrics.
+
+        Returns:
+            Texto con todas las métricas
+        """
+        lines = []
+
+        for full_name in sorted(self._types):
+            metric_type = self._types[full_name]
+            suffix = '_total' if metric_type == 'counter' else ''
+
+            lines.append(f"# HELP {full_name} {self._help[full_name]}")
+            lines.append(f"# TYPE {full_name} {metric_type}")
+            for labels, value in sorted(self._values[full_name].items()):
+                lines.append(f"{full_name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path: str) -> str:
+        """
+        Escribe las métricas de forma atómica (archivo temporal + rename).
+
+        Args:
+            path: Ruta del archivo .prom
+
+        Returns:
+            Ruta del archivo generado
+        """
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(self.render(), encoding='utf-8')
+        os.replace(temp_path, output_path)
+
+        return str(output_path)
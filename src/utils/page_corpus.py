@@ -0,0 +1,199 @@
+"""
+Corpus de páginas HTML de Instagram para ejecuciones sin red.
+
+Cada página se guarda en <raíz>/<ruta de la URL>/index.html (ej:
+data/fixtures/mercadona/followers/index.html). El corpus puede generarse a
+partir de perfiles sintéticos o sustituirse por páginas grabadas reales.
+"""
+
+import html
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+from urllib.parse import urlsplit
+
+from .synthetic_data import iter_profiles
+
+
+PROFILE_TEMPLATE = """<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<title>{full_name} (@{username}) • Fotos y videos de Instagram</title>
+<meta property="og:title" content="{full_name} (@{username}) • Fotos y videos de Instagram">
+<meta property="og:description" content="{followers} seguidores, {following} siguiendo, {posts} publicaciones - Ver fotos y videos de Instagram de {full_name} (@{username})">
+<meta property="og:url" content="https://www.instagram.com/{username}/">
+</head>
+<body>
+<main role="main">
+<header>
+<h2>{username}</h2>
+<ul>
+<li><span>{posts}</span> publicaciones</li>
+<li><a href="/{username}/followers/"><span title="{followers_exact}">{followers}</span> seguidores</a></li>
+<li><a href="/{username}/following/"><span>{following}</span> siguiendo</a></li>
+</ul>
+<span class="bio">{bio}</span>
+</header>
+</main>
+{dialog}
+</body>
+</html>
+"""
+
+DIALOG_TEMPLATE = """<div role="dialog" aria-label="Seguidores">
+<div class="_aano">
+<div style="height: auto; overflow: hidden auto; transform: translateY(0px)">
+{rows}
+</div>
+</div>
+</div>"""
+
+FOLLOWER_ROW_TEMPLATE = (
+    '<div><a href="/{username}/" role="link"><span>{username}</span></a>'
+    '<div role="button">Seguir</div></div>'
+)
+
+NOT_FOUND_PAGE = """<!DOCTYPE html>
+<html lang="es">
+<head><meta charset="utf-8"><title>Página no encontrada • Instagram</title></head>
+<body><main><h2>Esta página no está disponible.</h2></main></body>
+</html>
+"""
+
+
+def format_count(value: int) -> str:
+    """
+    Formatea un contador como lo muestra Instagram ('1,234', '12.5K', '3M').
+
+    Args:
+        value: Valor entero
+
+    Returns:
+        Texto abreviado
+    """
+    if value < 10_000:
+        return f"{value:,}"
+    if value < 999_950:
+        return f"{value / 1_000:.1f}".rstrip('0').rstrip('.') + 'K'
+    return f"{value / 1_000_000:.1f}".rstrip('0').rstrip('.') + 'M'
+
+
+def render_profile_page(profile: Dict, followers: Sequence[str] = ()) -> str:
+    """
+    Genera el HTML de un perfil (con el diálogo de seguidores si se indican).
+
+    Args:
+        profile: Datos del perfil (forma de create_profile_template)
+        followers: Usernames a mostrar en el diálogo de seguidores
+
+    Returns:
+        HTML de la página
+    """
+    dialog = ''
+    if followers:
+        rows = '\n'.join(FOLLOWER_ROW_TEMPLATE.format(username=username) for username in followers)
+        dialog = DIALOG_TEMPLATE.format(rows=rows)
+
+    return PROFILE_TEMPLATE.format(
+        username=profile['username'],
+        full_name=html.escape(profile.get('full_name') or profile['username']),
+        bio=html.escape(profile.get('bio', '')),
+        posts=format_count(profile.get('posts_count', 0)),
+        followers=format_count(profile.get('follower_count', 0)),
+        followers_exact=profile.get('follower_count', 0),
+        following=format_count(profile.get('following_count', 0)),
+        dialog=dialog
+    )
+
+
+class PageCorpus:
+    """
+    Páginas HTML indexadas por la ruta de su URL.
+    """
+
+    def __init__(self, root: str):
+        """
+        Inicializa el corpus.
+
+        Args:
+            root: Directorio raíz del corpus
+        """
+        self.root = Path(root)
+        self._cache = {}
+
+    @staticmethod
+    def normalize_path(url: str) -> str:
+        """Convierte una URL (absoluta o relativa) en la ruta '/a/b/' usada como clave."""
+        path = urlsplit(url).path or '/'
+        return path if path.endswith('/') else path + '/'
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        Obtiene el HTML de una URL.
+
+        Args:
+            url: URL o ruta de la página
+
+        Returns:
+            HTML de la página o None si no está en el corpus
+        """
+        path = self.normalize_path(url)
+
+        if path not in self._cache:
+            page_file = self.root / path.strip('/') / 'index.html'
+            self._cache[path] = page_file.read_text(encoding='utf-8') if page_file.is_file() else None
+
+        return self._cache[path]
+
+    def add(self, url: str, page: str) -> Path:
+        """
+        Guarda una página en el corpus.
+
+        Args:
+            url: URL o ruta de la página
+            page: HTML de la página
+
+        Returns:
+            Ruta del archivo generado
+        """
+        path = self.normalize_path(url)
+        page_file = self.root / path.strip('/') / 'index.html'
+        page_file.parent.mkdir(parents=True, exist_ok=True)
+        page_file.write_text(page, encoding='utf-8')
+        self._cache[path] = page
+
+        return page_file
+
+    def is_empty(self) -> bool:
+        """Indica si el corpus no tiene ninguna página."""
+        return not self.root.is_dir() or next(self.root.rglob('index.html'), None) is None
+
+
+def build_corpus(root: str, accounts: Sequence[str], followers_per_account: int, seed: int = 42) -> PageCorpus:
+    """
+    Genera un corpus sintético: perfil y diálogo de seguidores de cada cuenta
+    más la página de perfil de cada seguidor.
+
+    Args:
+        root: Directorio raíz del corpus
+        accounts: Cuentas de origen
+        followers_per_account: Seguidores por cuenta
+        seed: Semilla del generador
+
+    Returns:
+        Corpus generado
+    """
+    corpus = PageCorpus(root)
+    profiles = iter_profiles(followers_per_account * len(accounts), accounts, seed)
+    followers = {account: [] for account in accounts}
+
+    for profile in profiles:
+        followers[profile['source_account'][1:]].append(profile['username'])
+        corpus.add(f"/{profile['username']}/", render_profile_page(profile))
+
+    for account in accounts:
+        account_profile = {'username': account, 'follower_count': followers_per_account}
+        corpus.add(f"/{account}/", render_profile_page(account_profile))
+        corpus.add(f"/{account}/followers/", render_profile_page(account_profile, followers[account]))
+
+    return corpus
@@ -0,0 +1,140 @@
+"""
+Registro compacto de perfil extraído.
+
+Con cientos de miles de perfiles en memoria el coste de un dict por perfil
+domina el consumo. ProfileRecord usa __slots__ con campos fijos, guarda la
+marca de tiempo como entero (epoch) y comparte la cadena de la cuenta de
+origen entre todos sus seguidores (sys.intern). Se comporta como el dict
+de create_profile_template (profile['follower_count'], update, get,
+items) para que extractores y exportadores no cambien.
+"""
+
+import sys
+import time
+from collections.abc import MutableMapping
+from datetime import datetime
+from typing import Dict, Any, Tuple
+
+
+def _intern(value: Any) -> Any:
+    """Interna la cuenta de origen si es texto (None u otros valores se guardan tal cual)."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class ProfileRecord(MutableMapping):
+    """
+    Perfil con campos fijos y acceso tipo diccionario.
+    """
+
+    # Claves en el orden del dict de create_profile_template
+    FIELDS = (
+        'username', 'full_name', 'phone_numbers', 'account_created_date',
+        'first_post_date', 'last_post_date', 'follower_count', 'following_count',
+        'posts_count', 'is_verified', 'is_private', 'bio', 'external_url',
+        'extraction_timestamp', 'source_account'
+    )
+
+    # 'extraction_timestamp' se guarda como epoch entero en 'extracted_at'
+    __slots__ = tuple(field for field in FIELDS if field != 'extraction_timestamp') + ('extracted_at',)
+
+    def __init__(self, username: str, source_account: str = '', extracted_at: int = None, **fields):
+        """
+        Inicializa el registro.
+
+        Args:
+            username: Username del perfil
+            source_account: Cuenta de origen (se interna)
+            extracted_at: Momento de la extracción en segundos epoch (default: ahora)
+            **fields: Valores iniciales de otros campos de FIELDS
+        """
+        self.username = username
+        self.full_name = ''
+        self.phone_numbers = ()
+        self.account_created_date = None
+        self.first_post_date = None
+        self.last_post_date = None
+        self.follower_count = None
+        self.following_count = None
+        self.posts_count = None
+        self.is_verified = False
+        self.is_private = False
+        self.bio = ''
+        self.external_url = ''
+        self.extracted_at = int(time.time()) if extracted_at is None else int(extracted_at)
+        self.source_account = _intern(source_account)
+        self.update(fields)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'extraction_timestamp':
+            return datetime.fromtimestamp(self.extracted_at).isoformat()
+        if key == 'phone_numbers':
+            return list(self.phone_numbers)
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == 'extraction_timestamp':
+            self.extracted_at = self._to_epoch(value)
+        elif key == 'source_account':
+            self.source_account = _intern(value)
+        elif key == 'phone_numbers':
+            self.phone_numbers = tuple(value or ())
+        elif key in self.FIELDS:
+            setattr(self, key, value)
+        else:
+            raise KeyError(f"Campo de perfil desconocido: {key}")
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("Los campos de ProfileRecord no se pueden eliminar")
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self) -> int:
+        return len(self.FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ProfileRecord({self.to_dict()!r})"
+
+    def __reduce__(self):
+        # Sin __dict__: pickle (pools de procesos) reconstruye desde la fila
+        return (_record_from_row, (self.to_row(raw=True),))
+
+    @staticmethod
+    def _to_epoch(value: Any) -> int:
+        """Convierte un datetime, texto ISO o número a segundos epoch."""
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        if isinstance(value, str):
+            return int(datetime.fromisoformat(value).timestamp())
+        return int(value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Diccionario con la forma de create_profile_template (marca de tiempo ISO)."""
+        return {field: self[field] for field in self.FIELDS}
+
+    def to_row(self, raw: bool = False) -> Tuple:
+        """
+        Valores en el orden de FIELDS.
+
+        Args:
+            raw: Si es True la marca de tiempo va como epoch entero y los
+                teléfonos como tupla (más barato para DataFrames grandes)
+
+        Returns:
+            Tupla de valores
+        """
+        if not raw:
+            return tuple(self[field] for field in self.FIELDS)
+        return tuple(
+            self.extracted_at if field == 'extraction_timestamp' else getattr(self, field)
+            for field in self.FIELDS
+        )
+
+
+def _record_from_row(row: Tuple) -> ProfileRecord:
+    """Reconstruye un registro desde to_row(raw=True)."""
+    values = dict(zip(ProfileRecord.FIELDS, row))
+    extracted_at = values.pop('extraction_timestamp')
+    return ProfileRecord(values.pop('username'), values.pop('source_account'), extracted_at, **values)
@@ -0,0 +1,192 @@
+"""
+Perfilado de CPU del CLI (cProfile o muestreo) con reparto entre espera y CPU.
+"""
+
+import cProfile
+import json
+import pstats
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+
+PROFILE_MODES = ('cprofile', 'sampling')
+
+# Funciones C en las que el proceso espera (sleeps, sockets de WebDriver, locks)
+WAITING_FUNCTION_PATTERN = re.compile(
+    r"time\.sleep|'(recv|recv_into|readinto|sendall|connect|poll|select|acquire|wait)'|select\.|_thread\.lock"
+)
+
+
+def _get_thread_cpu_clock(thread_id: int) -> Optional[int]:
+    """Obtiene el reloj de CPU de un hilo (solo Unix)."""
+    try:
+        return time.pthread_getcpuclockid(thread_id)
+    except (AttributeError, OSError):
+        return None
+
+
+class SamplingProfiler:
+    """
+    Perfilador por muestreo del hilo principal que genera stacks colapsados.
+
+    Cada muestra se reparte entre una raíz 'cpu' y otra 'wait' según el tiempo
+    de CPU consumido por el hilo en el intervalo.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            interval: Segundos entre muestras
+        """
+        self.interval = interval
+        self.stacks = defaultdict(float)
+        self.samples = 0
+        self._thread_id = threading.main_thread().ident
+        self._stop_event = threading.Event()
+        self._sampler = None
+
+    def start(self) -> None:
+        """Inicia el muestreo en un hilo auxiliar."""
+        self._stop_event.clear()
+        self._sampler = threading.Thread(target=self._run, name='sampling-profiler', daemon=True)
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Detiene el muestreo."""
+        self._stop_event.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _cpu_time(self, clock_id: Optional[int]) -> float:
+        """CPU del hilo principal (o del proceso si no hay reloj por hilo)."""
+        return time.clock_gettime(clock_id) if clock_id is not None else time.process_time()
+
+    def _run(self) -> None:
+        """Bucle de muestreo."""
+        clock_id = _get_thread_cpu_clock(self._thread_id)
+        last_wall = time.perf_counter()
+        last_cpu = self._cpu_time(clock_id)
+
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            now_wall = time.perf_counter()
+            now_cpu = self._cpu_time(clock_id)
+
+            wall_delta = now_wall - last_wall
+            cpu_delta = min(max(now_cpu - last_cpu, 0.0), wall_delta)
+            last_wall, last_cpu = now_wall, now_cpu
+
+            if frame is None:
+                continue
+
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            collapsed = ';'.join(reversed(stack))
+
+            self.samples += 1
+            if cpu_delta > 0:
+                self.stacks[f"cpu;{collapsed}"] += cpu_delta
+            if wall_delta - cpu_delta > 0:
+                self.stacks[f"wait;{collapsed}"] += wall_delta - cpu_delta
+
+    def write_collapsed(self, path: Path) -> None:
+        """
+        Escribe los stacks en formato colapsado (compatible con speedscope y flamegraph.pl).
+
+        Args:
+            path: Ruta del archivo de salida (pesos en microsegundos)
+        """
+        lines = [
+            f"{stack} {int(seconds * 1_000_000)}"
+            for stack, seconds in sorted(self.stacks.items())
+            if seconds * 1_000_000 >= 1
+        ]
+        path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+
+class CLIProfiler:
+    """
+    Envuelve una ejecución del CLI con cProfile o con el perfilador por muestreo.
+    """
+
+    def __init__(self, mode: str, output: str):
+        """
+        Inicializa el perfilador.
+
+        Args:
+            mode: 'cprofile' (archivo pstats) o 'sampling' (stacks colapsados)
+            output: Ruta del archivo de perfil; el resumen se guarda junto a él
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Modo de perfilado no soportado: {mode}")
+
+        self.mode = mode
+        self.output = Path(output)
+        self.summary = {}
+
+    @contextmanager
+    def run(self):
+        """Perfila el bloque y escribe el perfil y su resumen al terminar."""
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+
+        profiler = cProfile.Profile() if self.mode == 'cprofile' else SamplingProfiler()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        if self.mode == 'cprofile':
+            profiler.enable()
+        else:
+            profiler.start()
+
+        try:
+            yield self
+        finally:
+            if self.mode == 'cprofile':
+                profiler.disable()
+            else:
+                profiler.stop()
+
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+
+            self.summary = {
+                'mode': self.mode,
+                'profile_file': str(self.output),
+                'wall_seconds': round(wall, 3),
+                'cpu_seconds': round(cpu, 3),
+                'waiting_seconds': round(max(wall - cpu, 0.0), 3),
+                'cpu_fraction': round(cpu / wall, 3) if wall > 0 else 0.0
+            }
+
+            if self.mode == 'cprofile':
+                profiler.dump_stats(str(self.output))
+                self.summary['top_waiting_functions'] = self._top_waiting_functions(pstats.Stats(profiler))
+            else:
+                profiler.write_collapsed(self.output)
+                self.summary['samples'] = profiler.samples
+
+            summary_path = self.output.with_name(self.output.name + '.summary.json')
+            summary_path.write_text(json.dumps(self.summary, indent=2), encoding='utf-8')
+
+    @staticmethod
+    def _top_waiting_functions(stats: pstats.Stats, limit: int = 10) -> List[Dict[str, Any]]:
+        """Funciones de espera con más tiempo propio según cProfile."""
+        waiting = [
+            {'function': name, 'calls': calls, 'seconds': round(tottime, 3)}
+            for (_, _, name), (_, calls, tottime, _, _) in stats.stats.items()
+            if WAITING_FUNCTION_PATTERN.search(name)
+        ]
+
+        return sorted(waiting, key=lambda item: -item['seconds'])[:limit]
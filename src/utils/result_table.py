@@ -0,0 +1,294 @@
+"""
+Tabla columnar (Apache Arrow) con los perfiles extraídos por cuenta.
+
+Sustituye al Dict[str, List[Dict]] que recorría el pipeline: los perfiles
+se acumulan en lotes y se convierten a RecordBatch de Arrow una sola vez.
+Cada lote pertenece a una única cuenta, de modo que la vista de una cuenta
+es una tabla formada por sus lotes sin copiar datos, y los agregados del
+resumen se calculan con pyarrow.compute.
+"""
+
+from datetime import datetime, date
+from typing import Dict, List, Any, Iterable, Iterator
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .profile_record import ProfileRecord
+
+
+# Esquema Arrow de un perfil (mismos campos y orden que ProfileRecord.FIELDS)
+ARROW_SCHEMA = pa.schema([
+    ('username', pa.string()),
+    ('full_name', pa.string()),
+    ('phone_numbers', pa.list_(pa.string())),
+    ('account_created_date', pa.timestamp('us')),
+    ('first_post_date', pa.timestamp('us')),
+    ('last_post_date', pa.timestamp('us')),
+    ('follower_count', pa.int64()),
+    ('following_count', pa.int64()),
+    ('posts_count', pa.int64()),
+    ('is_verified', pa.bool_()),
+    ('is_private', pa.bool_()),
+    ('bio', pa.string()),
+    ('external_url', pa.string()),
+    ('extraction_timestamp', pa.timestamp('us')),
+    # Pocas cuentas repetidas en todas las filas: diccionario (categoría en pandas)
+    ('source_account', pa.dictionary(pa.int32(), pa.string()))
+])
+
+DATETIME_FIELDS = ('account_created_date', 'first_post_date', 'last_post_date', 'extraction_timestamp')
+INTEGER_FIELDS = ('follower_count', 'following_count', 'posts_count')
+BOOLEAN_FIELDS = ('is_verified', 'is_private')
+STRING_FIELDS = ('username', 'full_name', 'bio', 'external_url')
+
+# Textos aceptados como booleanos (en minúsculas)
+TRUE_TEXTS = ('true', '1', 'yes', 'si', 'sí')
+FALSE_TEXTS = ('false', '0', 'no', '')
+
+# Perfiles acumulados antes de convertirlos en un RecordBatch
+DEFAULT_BATCH_SIZE = 1_000
+
+
+def _to_datetime(value: Any):
+    """Normaliza fechas (datetime, date, texto ISO o epoch) a datetime sin zona (no válidas = nulo)."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    try:
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value)
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _to_int(value: Any):
+    """Entero de un contador ('' o texto no numérico = nulo)."""
+    if value is None or isinstance(value, int):
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return int(number) if number.is_integer() else None
+
+
+def _to_bool(value: Any):
+    """Booleano de un flag (textos no reconocidos = nulo)."""
+    if value is None or isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in TRUE_TEXTS:
+            return True
+        if text in FALSE_TEXTS:
+            return False
+    return None
+
+
+def _to_str(value: Any):
+    """Texto de un campo de cadena (otros tipos se convierten con str)."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
+
+def _to_phone_list(value: Any):
+    """Lista de teléfonos (sin teléfonos = nulo, más barato de contar que listas vacías)."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, (list, tuple)):
+        return [number if isinstance(number, str) else str(number) for number in value]
+    return None
+
+
+# Normalización por campo de los valores que Arrow no acepta tal cual
+# (mismo criterio que EXPORT_SCHEMA en la exportación: valores no válidos = nulo)
+COERCERS = {
+    **{field: _to_str for field in STRING_FIELDS},
+    **{field: _to_int for field in INTEGER_FIELDS},
+    **{field: _to_bool for field in BOOLEAN_FIELDS},
+    **{field: _to_datetime for field in DATETIME_FIELDS}
+}
+
+
+class ResultTable:
+    """
+    Perfiles por cuenta en lotes Arrow con vistas por cuenta sin copia.
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Inicializa la tabla vacía.
+
+        Args:
+            batch_size: Perfiles por lote antes de convertirlos a Arrow
+        """
+        self.batch_size = batch_size
+        # Orden de inserción de las cuentas (incluidas las que no tienen perfiles)
+        self._batches = {}
+        self._pending = {}
+        self._rows = {}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, List[Dict[str, Any]]], batch_size: int = DEFAULT_BATCH_SIZE) -> 'ResultTable':
+        """
+        Construye la tabla desde la estructura {cuenta: [perfil]}.
+
+        Args:
+            data: Perfiles por cuenta (dicts o ProfileRecord)
+            batch_size: Perfiles por lote
+
+        Returns:
+            Tabla con los mismos perfiles
+        """
+        table = cls(batch_size)
+        for account, profiles in data.items():
+            table.extend(account, profiles)
+        table.flush()
+        return table
+
+    def add_account(self, account: str) -> None:
+        """Registra una cuenta (aunque no tenga perfiles)."""
+        if account not in self._batches:
+            self._batches[account] = []
+            self._pending[account] = []
+            self._rows[account] = 0
+
+    def append(self, account: str, profile: Dict[str, Any]) -> None:
+        """
+        Añade un perfil a una cuenta (se convierte a Arrow al completar un lote).
+
+        Args:
+            account: Cuenta de origen (sin '@')
+            profile: Perfil (dict o ProfileRecord)
+        """
+        self.add_account(account)
+        pending = self._pending[account]
+        pending.append(profile)
+        self._rows[account] += 1
+        if len(pending) >= self.batch_size:
+            self._flush_account(account)
+
+    def extend(self, account: str, profiles: Iterable[Dict[str, Any]]) -> None:
+        """
+        Añade varios perfiles a una cuenta.
+
+        Args:
+            account: Cuenta de origen (sin '@')
+            profiles: Perfiles (dicts o ProfileRecord)
+        """
+        self.add_account(account)
+        for profile in profiles:
+            self.append(account, profile)
+
+    def flush(self) -> None:
+        """Convierte a Arrow los perfiles pendientes de todas las cuentas."""
+        for account in self._pending:
+            self._flush_account(account)
+
+    def _flush_account(self, account: str) -> None:
+        """Convierte los perfiles pendientes de una cuenta en un RecordBatch."""
+        pending = self._pending[account]
+        if not pending:
+            return
+
+        columns = {field: [] for field in ARROW_SCHEMA.names}
+        for profile in pending:
+            if isinstance(profile, ProfileRecord):
+                row = zip(ProfileRecord.FIELDS, profile.to_row(raw=True))
+            else:
+                row = ((field, profile.get(field)) for field in ARROW_SCHEMA.names)
+            for field, value in row:
+                columns[field].append(value)
+
+        for field in DATETIME_FIELDS:
+            columns[field] = [_to_datetime(value) for value in columns[field]]
+        columns['phone_numbers'] = [_to_phone_list(numbers) for numbers in columns['phone_numbers']]
+        columns['source_account'] = [_to_str(value) or f"@{account}" for value in columns['source_account']]
+
+        try:
+            batch = pa.RecordBatch.from_pydict(columns, schema=ARROW_SCHEMA)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Lote con valores sucios (p. ej. follower_count=''): normalizar
+            # todas las columnas solo en este caso para no penalizar los lotes limpios
+            for field, coerce in COERCERS.items():
+                columns[field] = [coerce(value) for value in columns[field]]
+            batch = pa.RecordBatch.from_pydict(columns, schema=ARROW_SCHEMA)
+
+        self._batches[account].append(batch)
+        self._pending[account] = []
+
+    @property
+    def accounts(self) -> List[str]:
+        """Cuentas en orden de inserción."""
+        return list(self._batches)
+
+    def __len__(self) -> int:
+        return sum(self._rows.values())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._batches)
+
+    def __contains__(self, account: str) -> bool:
+        return account in self._batches
+
+    def row_count(self, account: str) -> int:
+        """Número de perfiles de una cuenta."""
+        return self._rows.get(account, 0)
+
+    def for_account(self, account: str) -> pa.Table:
+        """
+        Vista de una cuenta (sus lotes, sin copiar datos).
+
+        Args:
+            account: Cuenta de origen
+
+        Returns:
+            Tabla Arrow con los perfiles de la cuenta
+        """
+        self._flush_account(account)
+        return pa.Table.from_batches(self._batches[account], schema=ARROW_SCHEMA)
+
+    def to_table(self) -> pa.Table:
+        """Tabla Arrow con todas las cuentas."""
+        self.flush()
+        return pa.Table.from_batches(
+            [batch for batches in self._batches.values() for batch in batches],
+            schema=ARROW_SCHEMA
+        )
+
+    def account_stats(self, account: str) -> Dict[str, int]:
+        """
+        Agregados vectorizados de una cuenta.
+
+        Args:
+            account: Cuenta de origen
+
+        Returns:
+            Diccionario con rows, with_phone, verified y private
+        """
+        table = self.for_account(account)
+        return {
+            'rows': table.num_rows,
+            'with_phone': table.num_rows - table['phone_numbers'].null_count,
+            'verified': pc.sum(table['is_verified']).as_py() or 0,
+            'private': pc.sum(table['is_private']).as_py() or 0
+        }
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Estructura {cuenta: [perfil]} (para código que aún espera dicts).
+
+        Returns:
+            Perfiles por cuenta como dicts
+        """
+        return {account: self.for_account(account).to_pylist() for account in self._batches}
@@ -0,0 +1,261 @@
+"""
+Base de datos SQLite con los perfiles de todas las extracciones.
+
+Cada ejecución añade sus perfiles a una tabla indexada por username,
+cuenta de origen y fecha de extracción, de modo que preguntas como "último
+registro de X" o "seguidores de @mercadona con más de 10k seguidores" se
+responden con una consulta en vez de abrir todos los xlsx. La base usa WAL
+(las consultas no bloquean a una extracción que esté escribiendo) e
+inserta por lotes dentro de una transacción.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable, Union, TYPE_CHECKING
+
+from ..config.settings import RESULTS_DB_CONFIG
+from .profile_record import ProfileRecord
+
+# pyarrow (y con él pandas) solo se importa al convertir filas en tabla: una
+# consulta que solo muestra resultados no lo necesita
+if TYPE_CHECKING:
+    from .result_table import ResultTable
+
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ProfileRecord.FIELDS
+
+DATETIME_COLUMNS = ('account_created_date', 'first_post_date', 'last_post_date', 'extraction_timestamp')
+BOOLEAN_COLUMNS = ('is_verified', 'is_private')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    full_name TEXT,
+    phone_numbers TEXT,
+    account_created_date TEXT,
+    first_post_date TEXT,
+    last_post_date TEXT,
+    follower_count INTEGER,
+    following_count INTEGER,
+    posts_count INTEGER,
+    is_verified INTEGER,
+    is_private INTEGER,
+    bio TEXT,
+    external_url TEXT,
+    extraction_timestamp TEXT NOT NULL,
+    source_account TEXT NOT NULL
+);
+-- Un perfil por cuenta y momento de extracción (re-guardar actualiza la fila);
+-- sirve también para "último registro de X"
+CREATE UNIQUE INDEX IF NOT EXISTS idx_profiles_username
+    ON profiles (username, source_account, extraction_timestamp);
+-- Seguidores de una cuenta filtrados u ordenados por número de seguidores
+CREATE INDEX IF NOT EXISTS idx_profiles_source_account
+    ON profiles (source_account, follower_count);
+CREATE INDEX IF NOT EXISTS idx_profiles_extraction_timestamp
+    ON profiles (extraction_timestamp);
+"""
+
+
+def _to_iso(value: Any) -> Optional[str]:
+    """Fecha en texto ISO (ordenable como texto en SQLite)."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return datetime.fromisoformat(str(value)).isoformat()
+
+
+class ResultsStore:
+    """
+    Almacén SQLite de perfiles con consultas indexadas.
+    """
+
+    def __init__(self, path: str = None, batch_size: int = None, read_only: bool = False):
+        """
+        Abre (o crea) la base de datos.
+
+        Args:
+            path: Archivo SQLite (default: RESULTS_DB_CONFIG['path'])
+            batch_size: Filas por transacción al insertar (default: RESULTS_DB_CONFIG['batch_size'])
+            read_only: Abrir solo para consultas, sin crear el archivo ni sus directorios
+
+        Raises:
+            FileNotFoundError: Si read_only es True y la base no existe
+        """
+        self.path = Path(path or RESULTS_DB_CONFIG['path'])
+        self.batch_size = batch_size or RESULTS_DB_CONFIG['batch_size']
+        self.connection = None
+
+        if read_only:
+            if not self.path.is_file():
+                raise FileNotFoundError(f"No existe la base de resultados: {self.path}")
+            self.connection = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+            self.connection.row_factory = sqlite3.Row
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        # WAL: lectores y un escritor a la vez; NORMAL basta con WAL (sin fsync por transacción)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Cierra la conexión."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def save_table(self, table: 'ResultTable') -> int:
+        """
+        Inserta los perfiles de una tabla de resultados en lotes.
+
+        Args:
+            table: Tabla de resultados
+
+        Returns:
+            Número de perfiles guardados (los que no tienen fecha de extracción
+            válida se omiten)
+        """
+        sql = (
+            f"INSERT OR REPLACE INTO profiles ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+        )
+
+        saved = 0
+        skipped = 0
+        timestamp_index = COLUMNS.index('extraction_timestamp')
+        for account in table:
+            for batch in table.for_account(account).to_batches(max_chunksize=self.batch_size):
+                columns = {name: batch.column(name).to_pylist() for name in COLUMNS}
+                for name in DATETIME_COLUMNS:
+                    columns[name] = [_to_iso(value) for value in columns[name]]
+                columns['phone_numbers'] = [
+                    "; ".join(numbers) if numbers else None for numbers in columns['phone_numbers']
+                ]
+                # Sin fecha de extracción (p. ej. texto no válido convertido a nulo) no
+                # hay clave única: se omite la fila en lugar de fallar todo el lote
+                rows = [
+                    row for row in zip(*(columns[name] for name in COLUMNS))
+                    if row[timestamp_index] is not None
+                ]
+                skipped += batch.num_rows - len(rows)
+                # Una transacción por lote
+                with self.connection:
+                    self.connection.executemany(sql, rows)
+                saved += len(rows)
+
+        if skipped:
+            logger.warning("%d perfiles sin fecha de extracción no se guardaron en %s", skipped, self.path)
+        return saved
+
+    def query(
+        self,
+        username: str = None,
+        source_account: str = None,
+        min_followers: int = None,
+        max_followers: int = None,
+        since: Union[str, datetime] = None,
+        until: Union[str, datetime] = None,
+        latest: bool = False,
+        limit: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Busca perfiles guardados.
+
+        Args:
+            username: Solo este perfil
+            source_account: Solo seguidores de esta cuenta (con o sin '@')
+            min_followers: Mínimo de seguidores (inclusive)
+            max_followers: Máximo de seguidores (inclusive)
+            since: Solo extracciones desde esta fecha (datetime o texto ISO)
+            until: Solo extracciones anteriores a esta fecha (datetime o texto ISO)
+            latest: Solo el registro más reciente de cada perfil y cuenta
+            limit: Máximo de filas (las más recientes primero)
+
+        Returns:
+            Perfiles encontrados (los más recientes primero)
+        """
+        conditions = []
+        params = []
+        if username:
+            conditions.append('p.username = ?')
+            params.append(username.lstrip('@'))
+        if source_account:
+            conditions.append('p.source_account = ?')
+            params.append(f"@{source_account.lstrip('@')}")
+        if min_followers is not None:
+            conditions.append('p.follower_count >= ?')
+            params.append(min_followers)
+        if max_followers is not None:
+            conditions.append('p.follower_count <= ?')
+            params.append(max_followers)
+        if since:
+            conditions.append('p.extraction_timestamp >= ?')
+            params.append(_to_iso(since))
+        if until:
+            conditions.append('p.extraction_timestamp < ?')
+            params.append(_to_iso(until))
+        if latest:
+            # Resuelto con idx_profiles_username (username, source_account, extraction_timestamp)
+            conditions.append(
+                'p.extraction_timestamp = ('
+                'SELECT MAX(l.extraction_timestamp) FROM profiles l '
+                'WHERE l.username = p.username AND l.source_account = p.source_account)'
+            )
+
+        sql = f"SELECT {', '.join(f'p.{name}' for name in COLUMNS)} FROM profiles p"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        sql += ' ORDER BY p.extraction_timestamp DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        return [self._row_to_profile(row) for row in self.connection.execute(sql, params)]
+
+    @staticmethod
+    def _row_to_profile(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convierte una fila de la base al dict de perfil."""
+        profile = dict(row)
+        for name in BOOLEAN_COLUMNS:
+            if profile[name] is not None:
+                profile[name] = bool(profile[name])
+        profile['phone_numbers'] = profile['phone_numbers'].split('; ') if profile['phone_numbers'] else []
+        return profile
+
+    def count(self) -> int:
+        """Número de perfiles guardados."""
+        return self.connection.execute('SELECT COUNT(*) FROM profiles').fetchone()[0]
+
+
+def profiles_to_table(profiles: Iterable[Dict[str, Any]]) -> 'ResultTable':
+    """
+    Agrupa perfiles de una consulta por cuenta de origen para exportarlos.
+
+    Args:
+        profiles: Perfiles devueltos por ResultsStore.query
+
+    Returns:
+        Tabla de resultados
+    """
+    from .result_table import ResultTable
+
+    table = ResultTable()
+    for profile in profiles:
+        table.append(profile['source_account'].lstrip('@') or 'sin_cuenta', profile)
+    table.flush()
+    return table
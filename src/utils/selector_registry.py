@@ -0,0 +1,132 @@
+"""
+Ranking adaptativo de selectores alternativos (modal de seguidores, popups).
+
+Cada grupo tiene una lista de selectores por defecto; el registro anota
+aciertos, fallos y latencia de cada uno y devuelve primero el que mejor ha
+funcionado. El ranking se guarda en disco para que la siguiente ejecución
+no pague la espera implícita de los selectores que Instagram ya no usa.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Any, Sequence
+
+from ..config.settings import SELECTOR_RANKING_CONFIG
+
+
+class SelectorRegistry:
+    """
+    Estadísticas por grupo y selector con olvido exponencial.
+    """
+
+    def __init__(self, path: str = None, decay: float = None, enabled: bool = None):
+        """
+        Inicializa el registro y carga el ranking guardado.
+
+        Args:
+            path: Archivo JSON del ranking (default: SELECTOR_RANKING_CONFIG['file'])
+            decay: Peso del historial en cada actualización (default: SELECTOR_RANKING_CONFIG['decay'])
+            enabled: Si es False se usa siempre el orden por defecto
+        """
+        self.path = Path(path or SELECTOR_RANKING_CONFIG['file'])
+        self.decay = decay if decay is not None else SELECTOR_RANKING_CONFIG['decay']
+        self.enabled = enabled if enabled is not None else SELECTOR_RANKING_CONFIG['enabled']
+        # {grupo: {selector: {'hits', 'misses', 'latency', 'lookups'}}}
+        self.stats = {}
+        self._dirty = False
+        if self.enabled:
+            self.load()
+
+    def load(self) -> None:
+        """Carga el ranking guardado (se ignora un archivo ausente o corrupto)."""
+        try:
+            self.stats = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.stats = {}
+
+    def save(self) -> None:
+        """Guarda el ranking si cambió desde la última vez."""
+        if not self.enabled or not self._dirty:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(self.stats, indent=2, ensure_ascii=False), encoding='utf-8')
+        os.replace(temp_path, self.path)
+        self._dirty = False
+
+    @staticmethod
+    def _score(entry: Dict[str, float]) -> float:
+        """Tasa de acierto suavizada (un selector sin historial vale 0.5)."""
+        return (entry['hits'] + 1) / (entry['hits'] + entry['misses'] + 2)
+
+    def ranked(self, group: str, selectors: Sequence[str]) -> List[str]:
+        """
+        Ordena los selectores de un grupo del más al menos prometedor.
+
+        Args:
+            group: Nombre del grupo (ej: 'followers_modal')
+            selectors: Selectores por defecto, en orden de preferencia
+
+        Returns:
+            Selectores ordenados por tasa de acierto, latencia y orden por defecto
+        """
+        if not self.enabled:
+            return list(selectors)
+
+        group_stats = self.stats.get(group, {})
+
+        def sort_key(item):
+            position, selector = item
+            entry = group_stats.get(selector)
+            if entry is None:
+                return (-0.5, float('inf'), position)
+            return (-self._score(entry), entry['latency'], position)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=sort_key)]
+
+    def record(self, group: str, selector: str, hit: bool, latency: float) -> None:
+        """
+        Anota el resultado de un intento.
+
+        Args:
+            group: Nombre del grupo
+            selector: Selector probado
+            hit: Si el selector encontró lo que se buscaba
+            latency: Segundos que tardó la búsqueda
+        """
+        if not self.enabled:
+            return
+
+        entry = self.stats.setdefault(group, {}).setdefault(
+            selector, {'hits': 0.0, 'misses': 0.0, 'latency': latency, 'lookups': 0}
+        )
+        # Olvido exponencial: unos pocos fallos seguidos bastan para bajar un
+        # selector que dejó de funcionar aunque tenga un historial largo
+        entry['hits'] = entry['hits'] * self.decay + (1 if hit else 0)
+        entry['misses'] = entry['misses'] * self.decay + (0 if hit else 1)
+        entry['latency'] = entry['latency'] * self.decay + latency * (1 - self.decay)
+        entry['lookups'] += 1
+        self._dirty = True
+
+    def get_summary(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Obtiene el ranking actual de cada grupo.
+
+        Returns:
+            Diccionario {grupo: [{selector, score, latency, lookups}, ...]}
+        """
+        summary = {}
+        for group, group_stats in self.stats.items():
+            ranking = [
+                {
+                    'selector': selector,
+                    'score': round(self._score(entry), 3),
+                    'latency': round(entry['latency'], 4),
+                    'lookups': entry['lookups']
+                }
+                for selector, entry in group_stats.items()
+            ]
+            summary[group] = sorted(ranking, key=lambda item: (-item['score'], item['latency']))
+        return summary
@@ -0,0 +1,183 @@
+"""
+Almacén de snapshots HTML de perfiles para re-parsear sin volver a extraer.
+
+Cada página se guarda una sola vez, comprimida y direccionada por su hash
+SHA-256 (objects/ab/cdef....zst). Un índice JSON lines registra qué perfil
+se capturó, cuándo y con qué hash, de modo que una corrección del parser
+puede aplicarse a una ejecución anterior leyendo solo el disco.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Any, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstandard es opcional; sin él se comprime con zlib
+    zstandard = None
+
+from ..config.settings import DATA_PATHS, SNAPSHOT_CONFIG
+
+
+class SnapshotStore:
+    """
+    Almacén direccionado por contenido con índice por username y fecha.
+    """
+
+    def __init__(self, root: str = None, compression_level: int = None):
+        """
+        Inicializa el almacén.
+
+        Args:
+            root: Directorio del almacén (default: DATA_PATHS['raw'])
+            compression_level: Nivel de compresión (default: SNAPSHOT_CONFIG['compression_level'])
+        """
+        self.root = Path(root or DATA_PATHS['raw'])
+        self.objects_dir = self.root / 'objects'
+        self.index_path = self.root / 'index.jsonl'
+        self.compression_level = compression_level if compression_level is not None else SNAPSHOT_CONFIG['compression_level']
+        # zstd si está instalado; zlib (biblioteca estándar) en caso contrario
+        self.extension = '.zst' if zstandard is not None else '.zz'
+
+        self._lock = threading.Lock()
+        self._compressor = zstandard.ZstdCompressor(level=self.compression_level) if zstandard is not None else None
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def _object_path(self, digest: str, extension: str = None) -> Path:
+        """Ruta del objeto de un hash."""
+        return self.objects_dir / digest[:2] / f"{digest[2:]}{extension or self.extension}"
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._compressor is not None:
+            return self._compressor.compress(data)
+        return zlib.compress(data, min(self.compression_level, 9))
+
+    @staticmethod
+    def _decompress(data: bytes, extension: str) -> bytes:
+        if extension == '.zz':
+            return zlib.decompress(data)
+        if zstandard is None:
+            raise RuntimeError("Snapshot comprimido con zstd: instala 'zstandard' para leerlo")
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    def put(
+        self,
+        username: str,
+        content: str,
+        source_account: str = '',
+        url: str = '',
+        captured_at: datetime = None
+    ) -> str:
+        """
+        Guarda el HTML de un perfil (el objeto solo se escribe si es nuevo).
+
+        Args:
+            username: Username del perfil
+            content: HTML capturado
+            source_account: Cuenta de origen
+            url: URL de la página
+            captured_at: Momento de la captura (default: ahora)
+
+        Returns:
+            Hash SHA-256 del contenido
+        """
+        data = content.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+
+        if self.find_object(digest) is None:
+            object_path = self._object_path(digest)
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = object_path.with_name(f".{object_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            temp_path.write_bytes(self._compress(data))
+            os.replace(temp_path, object_path)
+
+        entry = {
+            'username': username,
+            'source_account': source_account,
+            'captured_at': (captured_at or datetime.now()).isoformat(),
+            'sha256': digest,
+            'size': len(data),
+            'url': url
+        }
+
+        with self._lock, open(self.index_path, 'a', encoding='utf-8') as index_file:
+            index_file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+        return digest
+
+    def find_object(self, digest: str) -> Optional[Path]:
+        """Ruta del objeto guardado con cualquier compresión (None si no existe)."""
+        for extension in ('.zst', '.zz'):
+            path = self._object_path(digest, extension)
+            if path.exists():
+                return path
+        return None
+
+    def get(self, digest: str) -> str:
+        """
+        Lee el HTML de un snapshot.
+
+        Args:
+            digest: Hash SHA-256 del contenido
+
+        Returns:
+            HTML descomprimido
+        """
+        path = self.find_object(digest)
+        if path is None:
+            raise KeyError(f"Snapshot no encontrado: {digest}")
+        return self._decompress(path.read_bytes(), path.suffix).decode('utf-8')
+
+    def iter_index(
+        self,
+        since: datetime = None,
+        until: datetime = None,
+        username: str = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre las entradas del índice en orden de captura.
+
+        Args:
+            since: Solo capturas desde esta fecha (incluida)
+            until: Solo capturas anteriores a esta fecha
+            username: Solo capturas de este perfil
+
+        Yields:
+            Entrada del índice
+        """
+        if not self.index_path.exists():
+            return
+
+        with open(self.index_path, encoding='utf-8') as index_file:
+            for line in index_file:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                captured_at = datetime.fromisoformat(entry['captured_at'])
+                if since and captured_at < since:
+                    continue
+                if until and captured_at >= until:
+                    continue
+                if username and entry['username'] != username:
+                    continue
+                yield entry
+
+    def latest(self, **filters) -> Dict[tuple, Dict[str, Any]]:
+        """
+        Obtiene la captura más reciente de cada perfil y cuenta de origen.
+
+        Args:
+            **filters: Filtros de iter_index (since, until, username)
+
+        Returns:
+            Diccionario {(source_account, username): entrada}
+        """
+        latest = {}
+        for entry in self.iter_index(**filters):
+            latest[(entry['source_account'], entry['username'])] = entry
+        return latest
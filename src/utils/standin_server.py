@@ -0,0 +1,196 @@
+"""
+Servidor HTTP local que imita las páginas de Instagram para benchmarks sin red.
+
+Sirve un PageCorpus (perfiles y diálogo de seguidores) con latencia y tasa
+de errores configurables. Con INSTAGRAM_BASE_URL apuntando a este servidor,
+el extractor con un navegador headless real funciona de forma reproducible
+y sin salir de la máquina. Las páginas llevan ETag y Last-Modified y se
+responde 304 a las peticiones condicionales de HttpProfileExtractor.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any
+
+from ..config.settings import STANDIN_SERVER_CONFIG
+from .page_corpus import PageCorpus, NOT_FOUND_PAGE
+
+
+HOME_PAGE = """<!DOCTYPE html>
+<html lang="es">
+<head><meta charset="utf-8"><title>Instagram</title></head>
+<body><main><h1>Instagram (servidor local)</h1></main></body>
+</html>
+"""
+
+ERROR_PAGE = """<!DOCTYPE html>
+<html lang="es">
+<head><meta charset="utf-8"><title>Error • Instagram</title></head>
+<body><main><h2>Espera unos minutos antes de volver a intentarlo.</h2></main></body>
+</html>
+"""
+
+
+class _StandinRequestHandler(BaseHTTPRequestHandler):
+    """Atiende cada petición con la página del corpus correspondiente."""
+
+    server_version = 'InstagramStandin/1.0'
+
+    def do_GET(self):
+        server = self.server.standin
+        server.wait_latency()
+
+        if server.should_fail():
+            status, page = server.error_status, ERROR_PAGE
+        elif self.path.split('?')[0] in ('', '/'):
+            status, page = 200, server.corpus.get('/') or HOME_PAGE
+        else:
+            page = server.corpus.get(self.path)
+            status, page = (200, page) if page is not None else (404, NOT_FOUND_PAGE)
+
+        body = page.encode('utf-8')
+        # Validadores para peticiones condicionales (el corpus no cambia mientras sirve)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            server.record(304)
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        server.record(status)
+        self.send_response(status)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store' if status != 200 else 'private, max-age=0')
+        if status == 200:
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', server.last_modified)
+        if status == 429:
+            self.send_header('Retry-After', '60')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Sin una línea por petición en consola; las estadísticas se consultan con get_stats()
+        pass
+
+
+class StandinServer:
+    """
+    Servidor de páginas de Instagram grabadas o sintéticas.
+    """
+
+    def __init__(
+        self,
+        corpus: PageCorpus,
+        host: str = None,
+        port: int = None,
+        latency: float = None,
+        jitter: float = None,
+        error_rate: float = None,
+        error_status: int = None,
+        seed: int = None
+    ):
+        """
+        Inicializa el servidor (los valores omitidos se toman de STANDIN_SERVER_CONFIG).
+
+        Args:
+            corpus: Corpus de páginas a servir
+            host: Dirección de escucha
+            port: Puerto (0 elige uno libre)
+            latency: Segundos de respuesta por página
+            jitter: Variación relativa de la latencia
+            error_rate: Fracción de respuestas con error
+            error_status: Código HTTP de las respuestas con error
+            seed: Semilla de latencias y errores
+        """
+        config = STANDIN_SERVER_CONFIG
+        self.corpus = corpus
+        self.host = host if host is not None else config['host']
+        self.port = port if port is not None else config['port']
+        self.latency = latency if latency is not None else config['latency']
+        self.jitter = jitter if jitter is not None else config['jitter']
+        self.error_rate = error_rate if error_rate is not None else config['error_rate']
+        self.error_status = error_status if error_status is not None else config['error_status']
+
+        self._random = random.Random(seed if seed is not None else config['seed'])
+        self.last_modified = formatdate(usegmt=True)
+        self._lock = threading.Lock()
+        self._status_counts = {}
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        """URL base para INSTAGRAM_BASE_URL."""
+        return f"http://{self.host}:{self.port}"
+
+    def wait_latency(self) -> None:
+        """Simula el tiempo de respuesta de una página."""
+        if not self.latency:
+            return
+        with self._lock:
+            delay = self.latency * (1 + self._random.uniform(-self.jitter, self.jitter))
+        time.sleep(max(0.0, delay))
+
+    def should_fail(self) -> bool:
+        """Decide si la petición actual devuelve un error."""
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def record(self, status: int) -> None:
+        """Cuenta una respuesta por código de estado."""
+        with self._lock:
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+
+    def start(self) -> 'StandinServer':
+        """
+        Arranca el servidor en un hilo en segundo plano.
+
+        Returns:
+            El propio servidor (con el puerto real si se pidió el 0)
+        """
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _StandinRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self.port = self._httpd.server_address[1]
+
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='standin-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Obtiene estadísticas de las respuestas servidas.
+
+        Returns:
+            Diccionario con el total de peticiones y el desglose por código
+        """
+        with self._lock:
+            return {
+                'requests': sum(self._status_counts.values()),
+                'by_status': dict(sorted(self._status_counts.items()))
+            }
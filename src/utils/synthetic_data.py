@@ -0,0 +1,111 @@
+"""
+Generador de perfiles sintéticos para pruebas de carga de los exportadores.
+
+Produce registros con la forma de create_profile_template (más los campos
+opcionales que usan los exportadores) de manera perezosa y reproducible:
+la misma semilla genera siempre la misma secuencia.
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Any, Sequence
+
+
+# Fragmentos de bio con acentos, emojis, escrituras no latinas y saltos de línea
+BIO_FRAGMENTS = (
+    'Amante del café ☕', 'Fotografía 📷 y viajes ✈️', 'Diseño · Ilustración',
+    'Madrid 🇪🇸', 'Enseñando español 👩‍🏫', 'Música en directo 🎶',
+    '東京在住', 'مرحبا بالعالم', 'Привет!', 'Ñandú & pingüino',
+    'Cocina casera 🥘', 'Runner 🏃‍♂️ | 42K', 'Links ⬇️\nmás info en la web',
+    'Cuenta oficial ✔️', '«Citas» y “comillas”',
+)
+
+FIRST_NAMES = ('María', 'José', 'Lucía', 'Álvaro', 'Zoë', 'Iñaki', 'Chloé', 'Sofía', 'Hugo', 'Noa')
+LAST_NAMES = ('García', 'Martínez', 'López', 'Núñez', 'Sánchez', 'Pérez', 'Gómez', 'Muñoz', 'Díaz', 'Ruiz')
+
+# Los usernames de Instagram solo admiten ASCII, puntos y guiones bajos
+USERNAME_PREFIXES = ('maria', 'jose', 'lucia', 'alvaro', 'zoe', 'inaki', 'chloe', 'sofia', 'hugo', 'noa')
+
+
+def _skewed_count(rng: random.Random, scale: int, alpha: float) -> int:
+    """Contador con distribución de cola larga (la mayoría pequeños, pocos enormes)."""
+    return min(int(rng.paretovariate(alpha) * scale) - scale, 500_000_000)
+
+
+def _bio(rng: random.Random) -> str:
+    """Bio vacía (~30%) o combinación de fragmentos."""
+    if rng.random() < 0.3:
+        return ''
+    return ' '.join(rng.sample(BIO_FRAGMENTS, rng.randint(1, 4)))
+
+
+def _phone_numbers(rng: random.Random) -> List[str]:
+    """Lista de teléfonos (vacía en la mayoría de perfiles)."""
+    roll = rng.random()
+    count = 0 if roll < 0.85 else 1 if roll < 0.97 else 2
+    return [f"+34 6{rng.randint(10_000_000, 99_999_999)}" for _ in range(count)]
+
+
+def iter_profiles(
+    rows: int,
+    accounts: Sequence[str] = ('cuenta_demo',),
+    seed: int = 42,
+    start: datetime = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Genera perfiles sintéticos de forma perezosa.
+
+    Args:
+        rows: Número total de perfiles
+        accounts: Cuentas de origen (se reparten en orden circular)
+        seed: Semilla del generador
+        start: Marca de tiempo de la primera extracción (default: 2024-01-01)
+
+    Yields:
+        Diccionario de perfil
+    """
+    rng = random.Random(seed)
+    timestamp = start or datetime(2024, 1, 1)
+
+    for i in range(rows):
+        timestamp += timedelta(milliseconds=rng.randint(200, 3_000))
+        has_name = rng.random() > 0.15
+
+        yield {
+            'username': f"{rng.choice(USERNAME_PREFIXES)}.{i}_{rng.randint(0, 99)}",
+            'full_name': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" if has_name else '',
+            'bio': _bio(rng),
+            'posts_count': _skewed_count(rng, 20, 1.5),
+            'follower_count': _skewed_count(rng, 150, 1.1),
+            'following_count': min(_skewed_count(rng, 300, 2.0), 7_500),
+            'extraction_timestamp': timestamp.isoformat(),
+            'source_account': f"@{accounts[i % len(accounts)]}",
+            'phone_numbers': _phone_numbers(rng),
+            'is_verified': rng.random() < 0.01,
+            'is_private': rng.random() < 0.35,
+        }
+
+
+def build_account_data(
+    rows: int,
+    accounts: Sequence[str] = ('cuenta_demo',),
+    seed: int = 42
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Materializa perfiles sintéticos con la estructura que reciben los exportadores.
+
+    Args:
+        rows: Número total de perfiles
+        accounts: Cuentas de origen
+        seed: Semilla del generador
+
+    Returns:
+        Datos por cuenta {account: [profile_data]}
+    """
+    data = {account: [] for account in accounts}
+
+    for profile in iter_profiles(rows, accounts, seed):
+        data[profile['source_account'][1:]].append(profile)
+
+    return data
+
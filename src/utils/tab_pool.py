@@ -0,0 +1,105 @@
+"""
+Pool fijo de pestañas del navegador reutilizadas entre perfiles.
+"""
+
+import time
+from typing import Dict, List, Any
+
+
+class TabPool:
+    """
+    Mantiene N pestañas abiertas y navega en ellas en lugar de abrir y cerrar
+    pestañas por cada lote de perfiles.
+    """
+
+    NAVIGATE_SCRIPT = "window.location.href = arguments[0];"
+
+    def __init__(self, driver, size: int):
+        """
+        Inicializa el pool.
+
+        Args:
+            driver: Driver de Selenium
+            size: Número de pestañas del pool
+        """
+        self.size = max(1, size)
+        self.driver = None
+        self.handles = []
+        self.current_index = None
+        self.opened_at = time.monotonic()
+        self._busy_since = {}
+        self._stats = [{'navigations': 0, 'busy_seconds': 0.0} for _ in range(self.size)]
+        self.attach(driver)
+
+    def attach(self, driver) -> None:
+        """
+        Asocia el pool a un driver, reutilizando sus pestañas y abriendo las que falten.
+
+        Args:
+            driver: Driver de Selenium (p. ej. tras reciclar el navegador)
+        """
+        self.driver = driver
+        handles = driver.window_handles
+
+        while len(handles) < self.size:
+            driver.execute_script("window.open('about:blank', '_blank');")
+            handles = driver.window_handles
+
+        self.handles = handles[:self.size]
+        self.current_index = None
+        self._busy_since = {}
+        self.switch_to(0)
+
+    def switch_to(self, index: int) -> None:
+        """
+        Cambia a la pestaña indicada (sin round-trip si ya está activa).
+
+        Args:
+            index: Índice de la pestaña en el pool
+        """
+        if index != self.current_index:
+            self.driver.switch_to.window(self.handles[index])
+            self.current_index = index
+
+    def navigate(self, index: int, url: str) -> None:
+        """
+        Inicia la navegación de una pestaña sin esperar a que cargue.
+
+        Args:
+            index: Índice de la pestaña en el pool
+            url: URL a cargar
+        """
+        self.switch_to(index)
+        self.driver.execute_script(self.NAVIGATE_SCRIPT, url)
+        self._stats[index]['navigations'] += 1
+        self._busy_since[index] = time.monotonic()
+
+    def release(self, index: int) -> None:
+        """
+        Marca una pestaña como libre y acumula su tiempo ocupada.
+
+        Args:
+            index: Índice de la pestaña en el pool
+        """
+        started = self._busy_since.pop(index, None)
+        if started is not None:
+            self._stats[index]['busy_seconds'] += time.monotonic() - started
+
+    def get_stats(self) -> List[Dict[str, Any]]:
+        """
+        Obtiene estadísticas de uso por pestaña.
+
+        Returns:
+            Lista con navegaciones, tiempo ocupada y utilización de cada pestaña
+        """
+        elapsed = time.monotonic() - self.opened_at
+
+        return [
+            {
+                'tab': index,
+                'navigations': stats['navigations'],
+                'busy_seconds': round(stats['busy_seconds'], 3),
+                'utilization': round(stats['busy_seconds'] / elapsed, 3) if elapsed > 0 else 0.0
+            }
+            for index, stats in enumerate(self._stats)
+        ]
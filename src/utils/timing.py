@@ -0,0 +1,114 @@
+"""
+Medición de tiempos por fase del pipeline de extracción y exportación.
+"""
+
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Any
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Calcula un percentil con interpolación lineal.
+
+    Args:
+        sorted_values: Valores ordenados de menor a mayor
+        q: Percentil entre 0 y 100
+
+    Returns:
+        Valor del percentil (0.0 si no hay valores)
+    """
+    if not sorted_values:
+        return 0.0
+
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+class PhaseTimer:
+    """
+    Acumula duraciones por fase y genera un informe con percentiles.
+    """
+
+    def __init__(self):
+        """Inicializa el temporizador."""
+        self.durations = defaultdict(list)
+        self.metadata = {}
+        self.started_at = time.perf_counter()
+
+    @contextmanager
+    def span(self, phase: str):
+        """
+        Mide la duración del bloque como una muestra de la fase.
+
+        Args:
+            phase: Nombre de la fase
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[phase].append(time.perf_counter() - start)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """
+        Registra una duración medida externamente.
+
+        Args:
+            phase: Nombre de la fase
+            seconds: Duración en segundos
+        """
+        self.durations[phase].append(seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resume las duraciones de cada fase.
+
+        Returns:
+            Diccionario {fase: {count, total, mean, p50, p95, p99, max}} en segundos
+        """
+        result = {}
+
+        for phase, values in self.durations.items():
+            ordered = sorted(values)
+            total = sum(ordered)
+            result[phase] = {
+                'count': len(ordered),
+                'total': round(total, 6),
+                'mean': round(total / len(ordered), 6),
+                'p50': round(percentile(ordered, 50), 6),
+                'p95': round(percentile(ordered, 95), 6),
+                'p99': round(percentile(ordered, 99), 6),
+                'max': round(ordered[-1], 6)
+            }
+
+        return result
+
+    def write_report(self, path: str) -> str:
+        """
+        Escribe el informe de tiempos en formato JSON.
+
+        Args:
+            path: Ruta del archivo de salida
+
+        Returns:
+            Ruta del archivo generado
+        """
+        report = {
+            'wall_time': round(time.perf_counter() - self.started_at, 6),
+            'phases': self.summary(),
+            **self.metadata
+        }
+
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, indent=2, ensure_ascii=False, default=str), encoding='utf-8')
+
+        return str(output_path)
@@ -0,0 +1,200 @@
+"""
+Contabilidad de comandos WebDriver (opt-in).
+
+Envuelve driver.execute, por el que pasan todos los comandos del driver y de
+sus WebElement, para contar y cronometrar cada round-trip y atribuirlo al
+método del extractor que lo originó y al perfil en curso.
+"""
+
+import json
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .timing import percentile
+
+
+# Límites superiores (ms) de los buckets del histograma de latencia
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class WebDriverCommandRecorder:
+    """
+    Registra cada comando WebDriver con su latencia, método llamador y perfil.
+    """
+
+    def __init__(self, owner: Any = None):
+        """
+        Inicializa el registro.
+
+        Args:
+            owner: Objeto cuyos métodos se usan para atribuir los comandos
+        """
+        self.owner = owner
+        self.current_profile = None
+        self.total_commands = 0
+        self.total_seconds = 0.0
+        self.by_method = defaultdict(lambda: defaultdict(lambda: [0, 0.0]))
+        self.by_command = defaultdict(lambda: [0, 0.0])
+        # Por perfil: [comandos, segundos] e histograma de latencia propio
+        self.per_profile = defaultdict(lambda: [0, 0.0])
+        self.profile_histograms = defaultdict(lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+        # Histograma global (todos los comandos, con o sin perfil en curso)
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def instrument(self, driver) -> None:
+        """
+        Envuelve driver.execute para registrar los comandos.
+
+        Args:
+            driver: Driver de Selenium
+        """
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self._record(driver_command, params, time.perf_counter() - start)
+
+        driver.execute = execute
+
+    @contextmanager
+    def profile(self, username: str):
+        """
+        Atribuye los comandos del bloque al perfil indicado.
+
+        Args:
+            username: Username del perfil
+        """
+        previous = self.current_profile
+        self.current_profile = username
+        try:
+            yield
+        finally:
+            self.current_profile = previous
+
+    def _caller(self) -> str:
+        """Busca el primer método del owner en la pila de llamadas."""
+        frame = sys._getframe(3)
+
+        while frame is not None:
+            if frame.f_locals.get('self') is self.owner:
+                return frame.f_code.co_name
+            frame = frame.f_back
+
+        return '<external>'
+
+    @staticmethod
+    def _command_name(driver_command: str, params: Optional[Dict[str, Any]]) -> str:
+        """Nombre legible del comando (los atoms de Selenium se identifican por su comentario)."""
+        script = (params or {}).get('script') if isinstance(params, dict) else None
+
+        if isinstance(script, str) and script.startswith('/* '):
+            return script[3:script.find(' */')]
+
+        return driver_command
+
+    def _record(self, driver_command: str, params, seconds: float) -> None:
+        """Acumula un comando."""
+        command = self._command_name(driver_command, params)
+        method = self._caller()
+
+        self.total_commands += 1
+        self.total_seconds += seconds
+
+        method_stats = self.by_method[method][command]
+        method_stats[0] += 1
+        method_stats[1] += seconds
+
+        command_stats = self.by_command[command]
+        command_stats[0] += 1
+        command_stats[1] += seconds
+
+        bucket = bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)
+        self.histogram[bucket] += 1
+
+        if self.current_profile is not None:
+            profile_stats = self.per_profile[self.current_profile]
+            profile_stats[0] += 1
+            profile_stats[1] += seconds
+            self.profile_histograms[self.current_profile][bucket] += 1
+
+    @staticmethod
+    def _format_stats(count: int, seconds: float) -> Dict[str, float]:
+        """Formatea contador y tiempo acumulado."""
+        return {
+            'count': count,
+            'total_ms': round(seconds * 1000, 3),
+            'mean_ms': round(seconds * 1000 / count, 3) if count else 0.0
+        }
+
+    def get_report(self) -> Dict[str, Any]:
+        """
+        Genera el informe de comandos.
+
+        Returns:
+            Diccionario con totales, desglose por método y comando,
+            comandos y latencia por perfil e histograma de latencia global
+        """
+        profile_counts = sorted(stats[0] for stats in self.per_profile.values())
+        profile_ms = sorted(stats[1] * 1000 for stats in self.per_profile.values())
+        labels = [f"<={limit}ms" for limit in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+
+        return {
+            'total_commands': self.total_commands,
+            'total_ms': round(self.total_seconds * 1000, 3),
+            'by_method': {
+                method: {
+                    command: self._format_stats(*stats)
+                    for command, stats in sorted(commands.items(), key=lambda item: -item[1][1])
+                }
+                for method, commands in sorted(
+                    self.by_method.items(),
+                    key=lambda item: -sum(stats[1] for stats in item[1].values())
+                )
+            },
+            'by_command': {
+                command: self._format_stats(*stats)
+                for command, stats in sorted(self.by_command.items(), key=lambda item: -item[1][1])
+            },
+            'per_profile': {
+                'profiles': len(profile_counts),
+                'mean_commands': round(sum(profile_counts) / len(profile_counts), 2) if profile_counts else 0.0,
+                'p50_commands': percentile(profile_counts, 50),
+                'p95_commands': percentile(profile_counts, 95),
+                'max_commands': profile_counts[-1] if profile_counts else 0,
+                'p50_ms': round(percentile(profile_ms, 50), 3),
+                'p95_ms': round(percentile(profile_ms, 95), 3),
+                'max_ms': round(profile_ms[-1], 3) if profile_ms else 0.0
+            },
+            'profiles': {
+                username: {
+                    **self._format_stats(*stats),
+                    'latency_histogram': dict(zip(labels, self.profile_histograms[username]))
+                }
+                for username, stats in self.per_profile.items()
+            },
+            'latency_histogram': dict(zip(labels, self.histogram))
+        }
+
+    def write_report(self, path: str) -> str:
+        """
+        Escribe el informe en formato JSON.
+
+        Args:
+            path: Ruta del archivo de salida
+
+        Returns:
+            Ruta del archivo generado
+        """
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(self.get_report(), indent=2, ensure_ascii=False), encoding='utf-8')
+
+        return str(output_path)
@@ -0,0 +1,39 @@
+"""
+Tests del bloqueo del perfil persistente del navegador.
+"""
+
+import os
+import socket
+
+import pytest
+
+from src.config.settings import BROWSER_PROFILE_CONFIG
+from src.utils.browser_profile import BrowserProfileManager
+
+
+@pytest.fixture
+def profile(tmp_path):
+    return BrowserProfileManager(str(tmp_path / 'perfil'), config=BROWSER_PROFILE_CONFIG)
+
+
+def test_prepare_unlocked_profile(profile):
+    assert profile.prepare() == profile.path
+    assert profile.cache_dir.is_dir()
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or os.name == 'nt', reason='SingletonLock es un enlace simbólico en POSIX')
+def test_prepare_locked_profile_raises(profile):
+    profile.path.mkdir(parents=True)
+    os.symlink(f"{socket.gethostname()}-{os.getpid()}", profile.path / 'SingletonLock')
+
+    assert profile.is_locked()
+    with pytest.raises(RuntimeError):
+        profile.prepare()
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or os.name == 'nt', reason='SingletonLock es un enlace simbólico en POSIX')
+def test_stale_lock_is_ignored(profile):
+    profile.path.mkdir(parents=True)
+    os.symlink(f"{socket.gethostname()}-999999999", profile.path / 'SingletonLock')
+
+    assert not profile.is_locked()
@@ -0,0 +1,93 @@
+"""
+Tests del parseo de contadores y og:description en español e inglés.
+"""
+
+import pytest
+
+from src.utils.count_parser import parse_count, parse_counts, parse_description
+
+
+@pytest.mark.parametrize('text, expected', [
+    # Sin separadores
+    ('0', 0),
+    ('500', 500),
+    (' 747 ', 747),
+    # Miles en inglés (coma) y en español (punto o espacio)
+    ('1,234', 1_234),
+    ('1,234,567', 1_234_567),
+    ('1.234', 1_234),
+    ('1.234.567', 1_234_567),
+    ('1 234', 1_234),
+    ('12 345 678', 12_345_678),
+    # Decimales: separador único sin 3 cifras detrás o tras el otro separador
+    ('1,234.5', 1_234),
+    ('1.234,5', 1_234),
+    ('1.234,6', 1_235),
+    ('1.234,5 mil', 1_234_500),
+    ('12,5K', 12_500),
+    # Sufijos en inglés
+    ('10K', 10_000),
+    ('12.5k', 12_500),
+    ('1.5M', 1_500_000),
+    ('1,5M', 1_500_000),
+    ('2B', 2_000_000_000),
+    ('3.1bn', 3_100_000_000),
+    # Sufijos en español (con decimal de coma)
+    ('11,2 mil', 11_200),
+    ('11.2 mil', 11_200),
+    ('999 mil', 999_000),
+    ('1,234 mil', 1_234),
+    ('3,4 mill.', 3_400_000),
+    ('1 millón', 1_000_000),
+    ('2,5 millones', 2_500_000),
+    ('5 mln', 5_000_000),
+    ('1,2 mil millones', 1_200_000_000),
+    ('1 MIL MILLONES', 1_000_000_000),
+])
+def test_parse_count(text, expected):
+    assert parse_count(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', 'abc', '1,2 milla', '12 seguidores', '--', None, 1234])
+def test_parse_count_invalid(text):
+    assert parse_count(text) == 0
+
+
+@pytest.mark.parametrize('description, expected', [
+    (
+        '1M seguidores, 747 siguiendo, 11K publicaciones - Ver fotos y videos de Instagram de Mercadona (@mercadona)',
+        {'follower_count': 1_000_000, 'following_count': 747, 'posts_count': 11_000}
+    ),
+    (
+        '1.5M Followers, 747 Following, 11K Posts - See Instagram photos and videos from Mercadona (@mercadona)',
+        {'follower_count': 1_500_000, 'following_count': 747, 'posts_count': 11_000}
+    ),
+    (
+        '11,2 mil seguidores, 1.234 seguidos, 1 publicación - Ver fotos de usuario_1 (@usuario_1)',
+        {'follower_count': 11_200, 'following_count': 1_234, 'posts_count': 1}
+    ),
+    (
+        '3,4 mill. seguidores, 1,234 siguiendo, 2 mil millones publicaciones',
+        {'follower_count': 3_400_000, 'following_count': 1_234, 'posts_count': 2_000_000_000}
+    ),
+    # Los números del nombre tras ' - ' no cuentan
+    ('1 follower - 500 posts fan (@fan500)', {'follower_count': 1}),
+    ('Sin contadores', {}),
+    (None, {}),
+])
+def test_parse_description(description, expected):
+    assert parse_description(description) == expected
+
+
+def test_parse_counts_list_and_series():
+    pd = pytest.importorskip('pandas')
+
+    texts = ['1,234', '11,2 mil', '1.5M', 'abc']
+    expected = [1_234, 11_200, 1_500_000, 0]
+
+    assert parse_counts(texts) == expected
+
+    series = pd.Series(texts, index=[10, 11, 12, 13])
+    result = parse_counts(series)
+    assert result.tolist() == expected
+    assert result.index.tolist() == [10, 11, 12, 13]
@@ -0,0 +1,82 @@
+"""
+Tests de la conversión de perfiles a lotes Arrow de ResultTable.
+"""
+
+from datetime import datetime
+
+from src.utils.profile_record import ProfileRecord
+from src.utils.result_table import ResultTable
+
+
+def _profile(username: str, **fields):
+    """Perfil limpio como el que devuelve la extracción."""
+    profile = {
+        'username': username,
+        'full_name': f"Nombre {username}",
+        'phone_numbers': ['600111222'],
+        'follower_count': 1_234,
+        'following_count': 56,
+        'posts_count': 7,
+        'is_verified': False,
+        'is_private': True,
+        'extraction_timestamp': '2026-01-02T03:04:05',
+        'source_account': '@cuenta'
+    }
+    profile.update(fields)
+    return profile
+
+
+def test_clean_rows():
+    table = ResultTable.from_dict({'cuenta': [_profile('a'), ProfileRecord('b', '@cuenta', follower_count=10)]})
+
+    rows = table.to_dict()['cuenta']
+    assert [row['username'] for row in rows] == ['a', 'b']
+    assert rows[0]['follower_count'] == 1_234
+    assert rows[0]['phone_numbers'] == ['600111222']
+    assert rows[0]['extraction_timestamp'] == datetime(2026, 1, 2, 3, 4, 5)
+    assert rows[1]['follower_count'] == 10
+    assert rows[1]['phone_numbers'] is None
+
+
+def test_dirty_values_become_null_without_losing_rows():
+    profiles = [
+        _profile('limpio'),
+        _profile('vacio', follower_count='', following_count='abc', posts_count='12'),
+        _profile('fechas', extraction_timestamp='02/01/2026', account_created_date='no es fecha'),
+        _profile('flags', is_verified='true', is_private='quizá'),
+        _profile('tipos', full_name=123, phone_numbers='600333444', source_account=None),
+        _profile('otro_limpio', follower_count=5),
+    ]
+    table = ResultTable.from_dict({'cuenta': profiles}, batch_size=len(profiles))
+
+    assert table.row_count('cuenta') == len(profiles)
+    rows = {row['username']: row for row in table.to_dict()['cuenta']}
+    assert list(rows) == [profile['username'] for profile in profiles]
+
+    assert rows['limpio']['follower_count'] == 1_234
+    assert rows['otro_limpio']['follower_count'] == 5
+
+    assert rows['vacio']['follower_count'] is None
+    assert rows['vacio']['following_count'] is None
+    assert rows['vacio']['posts_count'] == 12
+
+    assert rows['fechas']['extraction_timestamp'] is None
+    assert rows['fechas']['account_created_date'] is None
+
+    assert rows['flags']['is_verified'] is True
+    assert rows['flags']['is_private'] is None
+
+    assert rows['tipos']['full_name'] == '123'
+    assert rows['tipos']['phone_numbers'] == ['600333444']
+    assert rows['tipos']['source_account'] == '@cuenta'
+
+
+def test_dirty_batch_does_not_affect_other_batches():
+    table = ResultTable(batch_size=2)
+    table.extend('cuenta', [_profile('a'), _profile('b', follower_count='')])
+    table.extend('cuenta', [_profile('c'), _profile('d')])
+    table.flush()
+
+    counts = [row['follower_count'] for row in table.to_dict()['cuenta']]
+    assert counts == [1_234, None, 1_234, 1_234]
+    assert table.account_stats('cuenta') == {'rows': 4, 'with_phone': 4, 'verified': 0, 'private': 4}
@@ -0,0 +1,43 @@
+"""
+Tests de la base SQLite de resultados.
+"""
+
+import pytest
+
+from src.utils.result_table import ResultTable
+from src.utils.results_store import ResultsStore
+
+
+def test_read_only_missing_store_is_not_created(tmp_path):
+    path = tmp_path / 'no_existe' / 'results.sqlite3'
+
+    with pytest.raises(FileNotFoundError):
+        ResultsStore(str(path), read_only=True)
+
+    assert not path.parent.exists()
+
+
+def test_read_only_query(tmp_path):
+    path = tmp_path / 'results.sqlite3'
+    table = ResultTable.from_dict({'cuenta': [
+        {'username': 'a', 'follower_count': 10, 'extraction_timestamp': '2026-01-01T00:00:00'},
+        {'username': 'b', 'follower_count': 20_000, 'extraction_timestamp': '2026-01-02T00:00:00'},
+    ]})
+    with ResultsStore(str(path)) as store:
+        assert store.save_table(table) == 2
+
+    with ResultsStore(str(path), read_only=True) as store:
+        profiles = store.query(source_account='cuenta', min_followers=10_001)
+        assert [profile['username'] for profile in profiles] == ['b']
+        assert profiles[0]['source_account'] == '@cuenta'
+
+
+def test_rows_without_timestamp_are_skipped(tmp_path):
+    table = ResultTable.from_dict({'cuenta': [
+        {'username': 'a', 'extraction_timestamp': '02/01/2026'},
+        {'username': 'b', 'extraction_timestamp': '2026-01-02T00:00:00'},
+    ]})
+
+    with ResultsStore(str(tmp_path / 'results.sqlite3')) as store:
+        assert store.save_table(table) == 1
+        assert [profile['username'] for profile in store.query()] == ['b']